@@ -15,6 +15,25 @@ Alan Karmaşıklığı:
 - Recursive: O(n) - Stack kullanımı
 """
 
+import math
+import os
+from collections import deque
+from array import array, typecodes
+from itertools import accumulate, islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isteğe bağlıdır
+    np = None
+
+# Pairwise toplamada sıralı toplanan blok boyutu
+PAIRWISE_BLOCK_SIZE = 128
+# Böl ve fethet toplamada daha fazla bölünmeden doğrudan toplanan aralık boyutu
+LEAF_SIZE = 1024
+# Paralel böl ve fethet toplamanın devreye girdiği en küçük dizi boyutu
+PARALLEL_SUM_THRESHOLD = 1 << 20
+
+
 def array_sum_iterative(arr):
     """
     İterative (döngü kullanarak) toplama
@@ -72,6 +91,726 @@ def array_sum_recursive_v2(arr):
     return arr[0] + array_sum_recursive_v2(arr[1:])
 
 
+def array_sum_divide_and_conquer(arr, left=0, right=None, parallel=False, workers=None,
+                                 threshold=PARALLEL_SUM_THRESHOLD):
+    """
+    Recursive toplama - böl ve fethet versiyonu (index sınırları ile)
+    
+    [left, right) aralığı ikiye bölünür ve iki yarının toplamları toplanır.
+    Slicing yapılmadığı için kopya oluşturulmaz; recursion derinliği
+    O(log n) olduğundan 10^8 elemanlı dizilerde bile stack taşmaz.
+    
+    Args:
+        arr: Sayı dizisi (index ile erişilebilen herhangi bir dizi, örn. list, range)
+        left: Aralığın sol sınırı (dahil, varsayılan 0)
+        right: Aralığın sağ sınırı (hariç, varsayılan len(arr))
+        parallel: True ise büyük dizilerde yarılar process havuzunda toplanır
+        workers: Process sayısı (varsayılan: işlemci sayısı)
+        threshold: Paralel toplamanın devreye girdiği en küçük aralık boyutu
+    
+    Returns:
+        int/float: Aralıktaki elemanların toplamı (NumPy dizilerinde de Python
+                   sayısı; int64 dizilerde taşma olmaz)
+    """
+    if right is None:
+        right = len(arr)
+    if parallel and right - left >= threshold:
+        return _array_sum_halves_parallel(arr, left, right, workers)
+    if np is not None and isinstance(arr, np.ndarray):
+        # np.int64 toplamı taşınca sarar; paralel yol gibi Python sayılarıyla toplanır
+        return _array_sum_halves(arr[left:right].tolist(), 0, right - left)
+    return _array_sum_halves(arr, left, right)
+
+
+def _array_sum_halves(arr, left, right):
+    """[left, right) aralığını yarılara bölerek toplar"""
+    # Base case: Küçük aralıklar doğrudan toplanır (döngü C içinde çalışır)
+    if right - left <= LEAF_SIZE:
+        return sum(map(arr.__getitem__, range(left, right)))
+    
+    # Recursive case: Sol yarının toplamı + sağ yarının toplamı
+    mid = left + (right - left) // 2
+    return _array_sum_halves(arr, left, mid) + _array_sum_halves(arr, mid, right)
+
+
+def _array_sum_chunk(chunk):
+    """Process havuzundaki işçinin topladığı parça (pickle edilebilmesi için modül seviyesinde)"""
+    return _array_sum_halves(chunk, 0, len(chunk))
+
+
+def _shared_halves_worker(name, typecode, start, stop):
+    """Paylaşılan bellekteki [start, stop) aralığını seri versiyonun bölmeleriyle toplar"""
+    from multiprocessing import shared_memory
+    
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            return _array_sum_halves(view, start, stop)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _array_sum_halves_parallel(arr, left, right, workers=None):
+    """
+    Aralığı seri versiyonla aynı noktalardan ikiye bölerek işçi sayısı kadar
+    parçaya ayırır, parçaları process havuzunda toplar ve kısmi toplamları aynı
+    ağaç sırasıyla birleştirir. Bu yüzden sonuç seri versiyonla birebir aynıdır.
+    
+    Sabit genişlikli tampona çevrilebilen diziler (bkz. _as_typed_buffer) bir
+    kez paylaşılan belleğe kopyalanır ve işçilere yalnızca parça sınırları
+    gönderilir (parallel_sum ile aynı yol). range ve çevrilemeyen diziler
+    parça parça pickle edilerek gönderilir.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    workers = workers or os.cpu_count() or 1
+    ranges = [(left, right)]
+    while len(ranges) < workers:
+        halves = []
+        for lo, hi in ranges:
+            mid = lo + (hi - lo) // 2
+            halves += [(lo, mid), (mid, hi)]
+        ranges = halves
+    
+    typed = None
+    if not isinstance(arr, range):
+        typed = _as_typed_buffer(arr if (left, right) == (0, len(arr)) else arr[left:right])
+    
+    if typed is None:
+        # Her işçiye yalnızca kendi parçası gönderilir (range için kopya oluşmaz)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(_array_sum_chunk, (arr[lo:hi] for lo, hi in ranges)))
+    else:
+        typecode, data = typed
+        shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        try:
+            shm.buf[:data.nbytes] = data
+            # Tampon arr[left:right]'ı tutar; sınırlar left kadar kaydırılır
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                partials = list(pool.map(_shared_halves_worker, [shm.name] * len(ranges),
+                                         [typecode] * len(ranges),
+                                         [lo - left for lo, _ in ranges], [hi - left for _, hi in ranges]))
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    while len(partials) > 1:
+        partials = [partials[i] + partials[i + 1] for i in range(0, len(partials), 2)]
+    return partials[0]
+
+
+def _as_typed_buffer(arr):
+    """
+    Diziyi sabit genişlikli bir tampona çevirir
+    
+    Returns:
+        tuple: (tip kodu, bayt görünümü) - çevrilemezse None
+    """
+    if isinstance(arr, array):
+        return arr.typecode, memoryview(arr).cast("B")
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.ndim == 1 and arr.dtype.isnative and arr.dtype.char in typecodes:
+            return arr.dtype.char, memoryview(np.ascontiguousarray(arr)).cast("B")
+        arr = arr.tolist()
+    
+    try:
+        return "q", memoryview(array("q", arr)).cast("B")
+    except (TypeError, OverflowError):
+        pass
+    # array("d") tamsayıları da kabul eder; büyük tamsayılar hassasiyet kaybetmesin
+    if all(type(num) is float for num in arr):
+        return "d", memoryview(array("d", arr)).cast("B")
+    return None
+
+
+def _parallel_sum_worker(name, typecode, start, stop):
+    """Paylaşılan bellekteki [start, stop) aralığını toplar"""
+    from multiprocessing import shared_memory
+    
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            return sum(view[start:stop])
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def parallel_sum(arr, workers=None):
+    """
+    Paralel toplama - dizi parçalara bölünür, parçalar process havuzunda toplanır
+    
+    Dizi bir kez paylaşılan belleğe (multiprocessing.shared_memory) kopyalanır;
+    işçilere yalnızca bellek bloğunun adı ve parça sınırları gönderilir, veri
+    pickle edilmez. Tamsayılarda sonuç array_sum_iterative ile birebir aynıdır
+    (kısmi toplamlar Python int olduğundan taşma olmaz). Ondalıklı sayılarda
+    toplama sırası değiştiği için son basamaklarda fark olabilir.
+    
+    Args:
+        arr: Sayı dizisi (list, array.array veya NumPy dizisi)
+        workers: Process sayısı (varsayılan: işlemci sayısı)
+    
+    Returns:
+        int/float: Dizinin toplamı
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    typed = _as_typed_buffer(arr) if workers > 1 and n >= workers else None
+    if typed is None:
+        # Tek işçi, çok küçük dizi veya int64/double'a sığmayan değerler;
+        # NumPy skalerleri taşmasın diye dizi Python sayılarına çevrilir
+        if np is not None and isinstance(arr, np.ndarray):
+            arr = arr.tolist()
+        return array_sum_iterative(arr)
+    
+    typecode, data = typed
+    shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+    try:
+        shm.buf[:data.nbytes] = data
+        bounds = [n * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = pool.map(_parallel_sum_worker, [shm.name] * workers, [typecode] * workers,
+                                bounds[:-1], bounds[1:])
+            return array_sum_iterative(partials)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def benchmark_parallel_sum(size=10**7, max_workers=None, repeat=3):
+    """
+    parallel_sum için güçlü ölçekleme (strong scaling) testi: aynı dizi 1..N işçiyle toplanır
+    
+    Args:
+        size: Dizi boyutu
+        max_workers: En fazla işçi sayısı (varsayılan: işlemci sayısı)
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (işçi sayısı, milisaniye cinsinden süre, tek işçiye göre hızlanma)
+    """
+    import time
+    
+    values = array("q", range(size))
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parallel_sum(values, workers)
+            best = min(best, time.perf_counter() - start)
+        results.append((workers, best * 1e3, results[0][1] / (best * 1e3) if results else 1.0))
+    return results
+
+
+class PrefixSumIndex:
+    """
+    Aynı dizinin alt aralık toplamlarını tekrar tekrar sorgulamak için indeks
+    
+    İki çalışma modu vardır:
+    - "prefix": prefix[i] = arr[0] + ... + arr[i - 1] tutulur,
+      arr[i:j] toplamı prefix[j] - prefix[i] ile O(1)'de bulunur
+    - "fenwick": Fenwick ağacı (Binary Indexed Tree) tutulur, sorgular ve
+      eleman güncellemeleri O(log n)'dir
+    
+    Zaman Karmaşıklığı:
+    - Oluşturma: O(n)
+    - range_sum: O(1) (prefix) / O(log n) (fenwick)
+    - update / add: O(n) (prefix) / O(log n) (fenwick)
+    
+    Not: Tamsayılarda sonuçlar tamdır. Ondalıklı sayılarda iki prefix toplamının
+    farkı alındığından doğrudan toplamaya göre yuvarlama hatası farklı olabilir.
+    """
+    
+    def __init__(self, arr, mode="prefix"):
+        """
+        Args:
+            arr: Sayı dizisi
+            mode: "prefix" veya "fenwick" (varsayılan "prefix")
+        
+        Raises:
+            ValueError: Bilinmeyen mod verilirse
+        """
+        if mode not in ("prefix", "fenwick"):
+            raise ValueError(f"Bilinmeyen mod: {mode}")
+        self.mode = mode
+        self._values = list(arr)
+        n = len(self._values)
+        
+        if mode == "prefix":
+            self._tree = [0]
+            self._tree.extend(accumulate(self._values))
+        else:
+            # O(n) oluşturma: her düğüm kendi toplamını bir üst düğüme aktarır
+            self._tree = [0] + self._values
+            for i in range(1, n + 1):
+                parent = i + (i & -i)
+                if parent <= n:
+                    self._tree[parent] += self._tree[i]
+    
+    def __len__(self):
+        return len(self._values)
+    
+    def _prefix_sum(self, end):
+        """İlk end elemanın toplamı"""
+        if self.mode == "prefix":
+            return self._tree[end]
+        tree = self._tree
+        total = 0
+        while end > 0:
+            total += tree[end]
+            end &= end - 1   # en düşük 1 bitini sil
+        return total
+    
+    def range_sum(self, i, j):
+        """
+        arr[i:j] aralığının toplamını döndürür (slicing ile aynı sınır kuralları)
+        
+        Args:
+            i: Başlangıç index'i (dahil, negatif olabilir)
+            j: Bitiş index'i (hariç, negatif olabilir)
+        
+        Returns:
+            int/float: array_sum_iterative(arr[i:j]) ile aynı değer
+        """
+        start, stop, _ = slice(i, j).indices(len(self._values))
+        if stop <= start:
+            return 0
+        return self._prefix_sum(stop) - self._prefix_sum(start)
+    
+    def add(self, index, delta):
+        """
+        Verilen konumdaki elemana delta ekler
+        
+        Args:
+            index: Güncellenecek konum (negatif index desteklenir)
+            delta: Eklenecek değer
+        
+        Raises:
+            IndexError: index dizinin dışındaysa
+        """
+        n = len(self._values)
+        self._values[index] += delta
+        if index < 0:
+            index += n
+        
+        tree = self._tree
+        if self.mode == "prefix":
+            for k in range(index + 1, n + 1):
+                tree[k] += delta
+            return
+        k = index + 1
+        while k <= n:
+            tree[k] += delta
+            k += k & -k   # sorumlu olduğu aralık bu konumu içeren bir sonraki düğüm
+    
+    def update(self, index, value):
+        """
+        Verilen konumdaki elemanı değiştirir, indeks yeniden oluşturulmaz
+        
+        Args:
+            index: Güncellenecek konum (negatif index desteklenir)
+            value: Yeni değer
+        
+        Raises:
+            IndexError: index dizinin dışındaysa
+        """
+        self.add(index, value - self._values[index])
+
+
+def benchmark_prefix_sum_index(size=10**5, queries=10**4, repeat=3):
+    """
+    Dilimleyip array_sum_iterative çağırmak ile PrefixSumIndex sorgularını karşılaştırır
+    
+    Args:
+        size: Dizi boyutu
+        queries: Rastgele aralık sorgusu sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Yöntem adı -> saniyedeki sorgu sayısı
+    """
+    import random
+    import time
+    
+    def throughput(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for i, j in ranges:
+                func(i, j)
+            best = min(best, time.perf_counter() - start)
+        return queries / best
+    
+    rng = random.Random(42)
+    values = [rng.randrange(1000) for _ in range(size)]
+    ranges = [sorted((rng.randrange(size + 1), rng.randrange(size + 1))) for _ in range(queries)]
+    
+    return {
+        "slice + array_sum_iterative": throughput(lambda i, j: array_sum_iterative(values[i:j])),
+        "PrefixSumIndex (prefix)": throughput(PrefixSumIndex(values).range_sum),
+        "PrefixSumIndex (fenwick)": throughput(PrefixSumIndex(values, "fenwick").range_sum),
+    }
+
+
+class StreamingSum:
+    """
+    Bitmeyen veri akışları için çevrimiçi (online) toplayıcı
+    
+    Değerler saklanmaz; toplam, eleman sayısı, ortalama ve varyans (Welford
+    algoritması) her yeni değerle güncellenir. Farklı parçalarda (shard)
+    toplanan toplayıcılar Chan'ın birleştirme formülüyle merge edilebilir.
+    İsteğe bağlı olarak son window değerin toplamı (kayan pencere) tutulur;
+    pencere toplamı Neumaier telafisiyle güncellenir, böylece büyük bir değer
+    pencereden çıktığında ondan sonra gelen küçük değerler kaybolmaz.
+    
+    Alan Karmaşıklığı: O(1) - pencere kullanılıyorsa O(window)
+    """
+    
+    def __init__(self, window=None):
+        """
+        Args:
+            window: Kayan pencere boyutu (varsayılan None - pencere tutulmaz)
+        """
+        self.count = 0
+        self.sum = 0
+        self.mean = 0.0
+        self._m2 = 0.0   # ortalamadan farkların karelerinin toplamı
+        self.window = window
+        self._window_values = deque(maxlen=window) if window else None
+        self._window_total = 0
+        self._window_compensation = 0   # toplamada kaybolan düşük anlamlı kısım
+    
+    @property
+    def window_sum(self):
+        """Son window değerin toplamı"""
+        return self._window_total + self._window_compensation
+    
+    @property
+    def variance(self):
+        """Popülasyon varyansı"""
+        return self._m2 / self.count if self.count else 0.0
+    
+    @property
+    def sample_variance(self):
+        """Örneklem varyansı (n - 1 ile bölünür)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    def add(self, value):
+        """
+        Tek bir değer ekler (klasik Welford güncellemesi)
+        
+        Args:
+            value: Eklenecek sayı
+        """
+        self.count += 1
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        
+        if self._window_values is not None:
+            self._window_push(value)
+    
+    def update(self, values):
+        """
+        Bir grup (batch) değeri ekler
+        
+        Grup önce kendi içinde özetlenir (toplam, ortalama ve fsum ile
+        farkların kareleri toplamı) ve toplayıcıya tek bir birleştirme
+        adımıyla eklenir. Değerler yine bir kez dolaşılır, ancak add'deki
+        değer başına bölme ve öznitelik güncellemeleri yapılmaz.
+        
+        Args:
+            values: Sayı dizisi veya iterable
+        
+        Returns:
+            StreamingSum: self (zincirleme çağrı için)
+        """
+        if not isinstance(values, (list, tuple, array)):
+            values = list(values)
+        n = len(values)
+        if n == 0:
+            return self
+        
+        total = sum(values)
+        mean = total / n
+        m2 = math.fsum([(value - mean) ** 2 for value in values])
+        self._combine(n, total, mean, m2)
+        
+        if self._window_values is not None:
+            if n >= self.window:
+                self._window_values.clear()
+                self._window_values.extend(values[n - self.window:])
+                self._window_total = fast_sum(list(self._window_values))
+                self._window_compensation = 0
+            else:
+                for value in values:
+                    self._window_push(value)
+        return self
+    
+    def _window_push(self, value):
+        """Pencereye değer ekler; pencere doluysa en eski değer çıkarılır"""
+        if len(self._window_values) == self.window:
+            self._window_add(-self._window_values[0])
+        self._window_values.append(value)
+        self._window_add(value)
+    
+    def _window_add(self, value):
+        """Neumaier telafili toplama adımı (bkz. _kahan_sum)"""
+        total = self._window_total
+        t = total + value
+        if abs(total) >= abs(value):
+            self._window_compensation += (total - t) + value
+        else:
+            self._window_compensation += (value - t) + total
+        self._window_total = t
+    
+    def merge(self, other):
+        """
+        Başka bir parçada (shard) toplanan toplayıcıyı bu toplayıcıya ekler
+        
+        Kayan pencere birleştirilmez; her parçanın penceresi kendi akışına aittir.
+        
+        Args:
+            other: Diğer StreamingSum
+        
+        Returns:
+            StreamingSum: self (zincirleme çağrı için)
+        """
+        if other.count:
+            self._combine(other.count, other.sum, other.mean, other._m2)
+        return self
+    
+    def _combine(self, count, total, mean, m2):
+        """Chan vd. paralel varyans formülü ile iki özeti birleştirir"""
+        new_count = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / new_count
+        self._m2 += m2 + delta * delta * self.count * count / new_count
+        self.count = new_count
+        self.sum += total
+
+
+def benchmark_streaming_sum(events=10**6, batch_size=1000, repeat=3):
+    """
+    StreamingSum'ın saniyede işlediği olay sayısını ölçer
+    
+    Args:
+        events: Toplam olay (değer) sayısı
+        batch_size: update() ile bir seferde verilen değer sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Yöntem adı -> saniyedeki olay sayısı
+    """
+    import random
+    import time
+    
+    def throughput(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return events / best
+    
+    rng = random.Random(42)
+    batches = [[rng.random() for _ in range(batch_size)] for _ in range(events // batch_size)]
+    
+    def run_add(window=None):
+        accumulator = StreamingSum(window)
+        for batch in batches:
+            for value in batch:
+                accumulator.add(value)
+    
+    def run_update(window=None):
+        accumulator = StreamingSum(window)
+        for batch in batches:
+            accumulator.update(batch)
+    
+    return {
+        "add (tek tek)": throughput(run_add),
+        f"update ({batch_size}'lik gruplar)": throughput(run_update),
+        "update + pencere (100)": throughput(lambda: run_update(100)),
+    }
+
+
+def _pairwise_sum(arr):
+    """
+    Pairwise (ikili ağaç) toplama
+    
+    Elemanlar PAIRWISE_BLOCK_SIZE'lık bloklarda toplanır, blok toplamları ise
+    ikişer ikişer birleştirilir. Yuvarlama hatası O(n) yerine O(log n) büyür.
+    """
+    iterator = iter(arr)
+    partials = []
+    while True:
+        block = list(islice(iterator, PAIRWISE_BLOCK_SIZE))
+        if not block:
+            break
+        partials.append(sum(block))
+    
+    if not partials:
+        return 0
+    while len(partials) > 1:
+        paired = [partials[i] + partials[i + 1] for i in range(0, len(partials) - 1, 2)]
+        if len(partials) % 2:
+            paired.append(partials[-1])
+        partials = paired
+    return partials[0]
+
+
+def _kahan_sum(arr):
+    """
+    Kahan-Babuška (Neumaier) telafili toplama
+    
+    Her toplamada kaybolan düşük anlamlı kısım ayrı bir değişkende biriktirilir
+    ve sonunda toplama eklenir.
+    """
+    total = 0
+    compensation = 0
+    for num in arr:
+        t = total + num
+        if abs(total) >= abs(num):
+            compensation += (total - t) + num
+        else:
+            compensation += (num - t) + total
+        total = t
+    return total + compensation
+
+
+def fast_sum(arr, mode="auto"):
+    """
+    Hızlı ve hassas toplama, giriş türüne göre yöntem seçer
+    
+    Yöntemler:
+    - "fsum": math.fsum - tam doğru yuvarlanmış sonuç (C içinde)
+    - "pairwise": pairwise toplama - O(log n) hata büyümesi
+    - "kahan": Kahan-Babuška telafili toplama - O(1) hata büyümesi
+    - "numpy": numpy.sum (NumPy kurulu olmalıdır)
+    - "auto": NumPy dizisi -> numpy, tamsayılar -> sum() (tam sonuç),
+      ondalıklı sayılar -> fsum
+    
+    Args:
+        arr: Sayı dizisi
+        mode: Toplama yöntemi (varsayılan "auto")
+    
+    Returns:
+        int/float: Dizinin toplamı
+    
+    Raises:
+        ValueError: Bilinmeyen yöntem verilirse
+        ImportError: "numpy" yöntemi seçilip NumPy kurulu değilse
+    """
+    if mode == "auto":
+        if np is not None and isinstance(arr, np.ndarray):
+            mode = "numpy"
+        elif isinstance(arr, array):
+            return math.fsum(arr) if arr.typecode in "fd" else sum(arr)
+        else:
+            if not isinstance(arr, (list, tuple, range)):
+                arr = list(arr)
+            # Tamsayılarda sum() tam sonuç verir; sonuç ondalıklıysa fsum ile
+            # doğru yuvarlanmış toplam hesaplanır
+            total = sum(arr)
+            return math.fsum(arr) if type(total) is float else total
+    
+    if mode == "fsum":
+        return math.fsum(arr)
+    if mode == "pairwise":
+        return _pairwise_sum(arr)
+    if mode == "kahan":
+        return _kahan_sum(arr)
+    if mode == "numpy":
+        if np is None:
+            raise ImportError("numpy yöntemi için NumPy kurulu olmalıdır")
+        return np.sum(np.asarray(arr)).item()
+    raise ValueError(f"Bilinmeyen toplama yöntemi: {mode}")
+
+
+def _fast_sum_modes():
+    """Bu ortamda kullanılabilen fast_sum yöntemleri"""
+    modes = ["auto", "fsum", "pairwise", "kahan"]
+    if np is not None:
+        modes.append("numpy")
+    return modes
+
+
+def accuracy_report(values):
+    """
+    Her toplama yönteminin sonucunu ve tam (kesirli) toplama göre hatasını hesaplar
+    
+    Recursive versiyonlar da karşılaştırıldığı için dizi, Python'un recursion
+    sınırından (varsayılan 1000) kısa olmalıdır.
+    
+    Args:
+        values: Ondalıklı sayı dizisi
+    
+    Returns:
+        dict: Yöntem adı -> (sonuç, mutlak hata)
+    """
+    from fractions import Fraction
+    
+    exact = sum(map(Fraction, values))
+    methods = {
+        "array_sum_iterative": array_sum_iterative,
+        "array_sum_recursive": array_sum_recursive,
+        "array_sum_recursive_v2": array_sum_recursive_v2,
+    }
+    for mode in _fast_sum_modes():
+        methods[f"fast_sum({mode})"] = lambda arr, mode=mode: fast_sum(arr, mode)
+    
+    report = {}
+    for name, func in methods.items():
+        result = func(values)
+        report[name] = (result, float(abs(Fraction(result) - exact)))
+    return report
+
+
+def benchmark_array_sum(size=10**6, repeat=3):
+    """
+    Büyük ondalıklı dizide iterative toplama ile fast_sum yöntemlerinin sürelerini ölçer
+    
+    Recursive versiyonlar recursion sınırı nedeniyle bu boyutlarda çalışamaz.
+    
+    Args:
+        size: Dizi boyutu
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Yöntem adı -> milisaniye cinsinden süre
+    """
+    import random
+    import time
+    
+    def best_time(func, arr):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(arr)
+            best = min(best, time.perf_counter() - start)
+        return best * 1e3
+    
+    rng = random.Random(42)
+    values = [rng.random() for _ in range(size)]
+    results = {"array_sum_iterative": best_time(array_sum_iterative, values)}
+    for mode in _fast_sum_modes():
+        results[f"fast_sum({mode})"] = best_time(lambda arr: fast_sum(arr, mode), values)
+    if np is not None:
+        results["fast_sum(auto, ndarray)"] = best_time(fast_sum, np.asarray(values))
+    return results
+
+
 # Test Senaryoları
 if __name__ == "__main__":
     print("=" * 60)
@@ -126,5 +865,135 @@ if __name__ == "__main__":
     print(f"Recursive Toplam (v1): {array_sum_recursive(test_array_6)}")
     # Not: v2 çok büyük dizilerde stack overflow'a neden olabilir
     
+    # Test 7: Hızlı toplama yöntemleri
+    print(f"\nTest 7: Hızlı Toplama (fast_sum)")
+    print(f"Dizi: {test_array_3}")
+    for mode in _fast_sum_modes():
+        print(f"fast_sum({mode}): {fast_sum(test_array_3, mode)!r}")
+    print(f"Tamsayılar (auto): {fast_sum(test_array_6)}, array('q'): {fast_sum(array('q', test_array_6))}")
+    assert fast_sum([10**20, 1, -10**20]) == 1  # tamsayılarda tam sonuç
+    
+    # Test 8: Hassasiyet raporu (büyük ve küçük sayıların karışımı)
+    import random
+    rng = random.Random(42)
+    accuracy_values = [rng.choice([1e16, -1e16, 1.0]) + rng.random() for _ in range(900)]
+    print(f"\nTest 8: Hassasiyet Raporu ({len(accuracy_values)} ondalıklı sayı)")
+    for name, (result, error) in accuracy_report(accuracy_values).items():
+        print(f"{name:>25}: {result!r:>24}  hata: {error:.3g}")
+    
+    # Test 9: Böl ve fethet toplama (stack taşması olmadan)
+    print(f"\nTest 9: Böl ve Fethet Toplama")
+    for arr in [test_array_1, test_array_2, test_array_3, test_array_4, test_array_5, test_array_6]:
+        assert array_sum_divide_and_conquer(arr) == array_sum_iterative(arr)
+    print(f"Dizi: {test_array_1} -> {array_sum_divide_and_conquer(test_array_1)}")
+    print(f"Aralık [2, 5): {array_sum_divide_and_conquer(test_array_1, 2, 5)}")
+    big_range = range(10**6)  # recursive versiyonlar bu boyutta RecursionError verir
+    print(f"range(10^6): {array_sum_divide_and_conquer(big_range)} "
+          f"(beklenen: {10**6 * (10**6 - 1) // 2})")
+    parallel_values = [rng.random() for _ in range(50000)]
+    serial = array_sum_divide_and_conquer(parallel_values)
+    parallel = array_sum_divide_and_conquer(parallel_values, parallel=True, workers=2, threshold=10000)
+    print(f"Paralel (2 işçi): {parallel!r}, Seri: {serial!r}")
+    assert parallel == serial
+    # Paylaşılan bellek yolu (tamsayı, array.array, alt aralık) ve pickle yolu (karışık tipler)
+    mixed_values = [rng.randrange(100) if i % 3 else rng.random() for i in range(30000)]
+    int_values_9 = [rng.randrange(-10**12, 10**12) for _ in range(30001)]
+    for arr in [int_values_9, array("d", parallel_values), mixed_values, range(30000)]:
+        for lo, hi in [(0, len(arr)), (123, len(arr) - 45)]:
+            assert (array_sum_divide_and_conquer(arr, lo, hi, parallel=True, workers=3, threshold=10000)
+                    == array_sum_divide_and_conquer(arr, lo, hi))
+    if np is not None:
+        # int64 dizide toplam 2^63'ü aşar: seri ve paralel yol aynı tam sonucu verir
+        overflow_values = np.full(30000, 2**62, dtype=np.int64)
+        expected = 30000 * 2**62
+        assert array_sum_divide_and_conquer(overflow_values) == expected
+        assert array_sum_divide_and_conquer(overflow_values, 5, 29000) == 28995 * 2**62
+        assert array_sum_divide_and_conquer(overflow_values, parallel=True, workers=3, threshold=10000) == expected
+        assert parallel_sum(overflow_values, 1) == parallel_sum(overflow_values, 2) == expected
+        print(f"int64 taşması (30000 × 2^62): seri ve paralel sonuç {expected}")
+    
+    # Test 10: Paylaşılan bellek ile paralel toplama
+    print(f"\nTest 10: Paralel Toplama (parallel_sum)")
+    int_values = [rng.randrange(-10**12, 10**12) for _ in range(100003)]
+    for workers in [1, 2, 3]:
+        result = parallel_sum(int_values, workers)
+        assert result == array_sum_iterative(int_values)
+        print(f"{workers} işçi: {result} (array_sum_iterative ile aynı)")
+    assert parallel_sum(array("i", range(1000)), 4) == sum(range(1000))
+    assert parallel_sum([10**30, 1, 2], 2) == 10**30 + 3  # int64'e sığmayan değerler
+    print(f"Ondalıklı (2 işçi): {parallel_sum(parallel_values, 2)!r}")
+    
+    # Test 11: Aralık toplamı indeksi
+    print(f"\nTest 11: Aralık Toplamı İndeksi (PrefixSumIndex)")
+    print(f"Dizi: {test_array_1}")
+    for mode in ["prefix", "fenwick"]:
+        index = PrefixSumIndex(test_array_1, mode)
+        before = index.range_sum(2, 7)
+        index.update(4, 100)
+        print(f"{mode:>8}: range_sum(2, 7) = {before}, update(4, 100) sonrası = {index.range_sum(2, 7)}")
+    
+    for mode in ["prefix", "fenwick"]:
+        values = [rng.randrange(-50, 50) for _ in range(60)]
+        index = PrefixSumIndex(values, mode)
+        for step in range(100):
+            position = rng.randrange(-len(values), len(values))
+            value = rng.randrange(-50, 50)
+            values[position] = value
+            index.update(position, value)
+            for i in range(-3, 63, 7):
+                for j in range(-5, 65, 9):
+                    assert index.range_sum(i, j) == array_sum_iterative(values[i:j])
+    print("Dilimleme + array_sum_iterative karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 12: Çevrimiçi (streaming) toplama
+    print(f"\nTest 12: Çevrimiçi Toplama (StreamingSum)")
+    stream = StreamingSum(window=3)
+    for batch in [[1, 2, 3], [4, 5], [6]]:
+        stream.update(batch)
+        print(f"update({batch}) -> toplam: {stream.sum}, sayı: {stream.count}, "
+              f"ortalama: {stream.mean:.2f}, varyans: {stream.variance:.3f}, son 3: {stream.window_sum}")
+    
+    import statistics
+    stream_values = [rng.uniform(-100, 100) for _ in range(1000)]
+    shards = [StreamingSum().update(stream_values[i:i + 137]) for i in range(0, 1000, 137)]
+    merged = StreamingSum()
+    for shard in shards:
+        merged.merge(shard)
+    single = StreamingSum(window=50)
+    for value in stream_values:
+        single.add(value)
+    for accumulator in [merged, single]:
+        assert accumulator.count == len(stream_values)
+        assert math.isclose(accumulator.sum, math.fsum(stream_values), rel_tol=1e-9)
+        assert math.isclose(accumulator.mean, statistics.fmean(stream_values), rel_tol=1e-9)
+        assert math.isclose(accumulator.variance, statistics.pvariance(stream_values), rel_tol=1e-9)
+        assert math.isclose(accumulator.sample_variance, statistics.variance(stream_values), rel_tol=1e-9)
+    assert math.isclose(single.window_sum, math.fsum(stream_values[-50:]), rel_tol=1e-9, abs_tol=1e-9)
+    # Büyük bir değer pencereden çıktığında sonraki küçük değerler kaybolmamalı
+    large = StreamingSum(window=2)
+    for value in [1e16, 1.0, 1.0, 1.0]:
+        large.add(value)
+    assert large.window_sum == 2.0, large.window_sum
+    large = StreamingSum(window=3).update([1e16]).update([1.0, 1.0]).update([1.0])
+    assert large.window_sum == 3.0, large.window_sum
+    print(f"{len(shards)} parçanın birleşimi ve tek akış: statistics modülü ile aynı sonuçlar")
+    
+    # Test 13: Performans testi
+    print(f"\nTest 13: Performans Testi (10^6 ondalıklı sayı)")
+    for name, elapsed_ms in benchmark_array_sum().items():
+        print(f"{name:>25}: {elapsed_ms:8.2f} ms")
+    
+    print(f"\nAralık toplamı sorguları (10^4 eleman):")
+    for name, rate in benchmark_prefix_sum_index(size=10**4, queries=2000).items():
+        print(f"{name:>30}: {rate:>12,.0f} sorgu/sn")
+    
+    print(f"\nStreamingSum işlem hızı (10^5 olay):")
+    for name, rate in benchmark_streaming_sum(events=10**5, repeat=1).items():
+        print(f"{name:>30}: {rate:>12,.0f} olay/sn")
+    
+    print(f"\nparallel_sum ölçekleme (10^6 tamsayı):")
+    for workers, elapsed_ms, speedup in benchmark_parallel_sum(size=10**6, max_workers=2, repeat=1):
+        print(f"{workers:>3} işçi: {elapsed_ms:8.2f} ms, hızlanma: {speedup:.2f}x")
+    
     print("\n" + "=" * 60)
 
@@ -0,0 +1,677 @@
+"""
+PERFORMANS TESTLERİ (BENCHMARK SUITE)
+
+Açıklama:
+binary_search, linear_search, array_sum ve matrix_multiplication modüllerindeki
+fonksiyonları aynı yöntemle ölçer:
+- time.perf_counter_ns ile nanosaniye çözünürlüğünde ölçüm
+- Ölçümden önce ısınma (warmup) çalıştırmaları
+- Her örnek en az ~5 ms sürecek şekilde tekrar sayısı otomatik belirlenir
+  (timeit.autorange gibi); sonuçlar çağrı başına süredir
+- Her fonksiyon birkaç girdi boyutunda ölçülür
+- İstatistikler: en küçük, medyan, p95, ortalama, standart sapma
+
+Sonuçlar JSON olarak yazılabilir ve kaydedilmiş bir temel çizgi (baseline)
+ile karşılaştırılabilir; medyanı eşikten fazla yavaşlayan ölçümler
+gerileme (regression) sayılır ve çıkış kodu 1 olur.
+
+Bellek modu (--memory):
+Her ölçüm ayrı bir process'te çalıştırılır; girdi hazırlandıktan sonra tek
+bir çağrı tracemalloc altında yapılır ve şunlar raporlanır:
+- peak_bytes: Çağrı sırasında ayrılan en yüksek bellek (tracemalloc)
+- peak_blocks: Tepe bellek anında çağrının ayırıp tuttuğu blok (ayırma)
+  sayısı; ayrı bir çalıştırmada, bellek her %10 arttığında alınan
+  tracemalloc anlık görüntüleri (snapshot) ile ölçülür
+- retained_bytes / retained_blocks: Çağrının ayırıp döndüğünde hâlâ canlı
+  olan bellek ve blok (nesne) sayısı
+- rss_peak_kb: Process'in en yüksek RSS değeri (ru_maxrss; yorumlayıcı ve
+  girdi dahil, resource modülü olmayan platformlarda None)
+Bellek sonuçları kendi temel çizgisi ile peak_bytes ve peak_blocks
+üzerinden karşılaştırılır.
+
+Süre modunda ayrıca instrumentation.instrument() bloğunun kapalıyken ek yük
+getirmediği ölçülür: blok öncesi ve sonrası süreler aynı olmalı, fonksiyonlar
+orijinal nesnelere geri dönmelidir.
+
+Kullanım:
+    python3 benchmark.py                        # tüm boyutlar
+    python3 benchmark.py --quick                # küçük boyutlar
+    python3 benchmark.py --filter matrix        # adı "matrix" içerenler
+    python3 benchmark.py --filter instrumentation   # yalnızca instrument() ek yükü
+    python3 benchmark.py --output sonuc.json
+    python3 benchmark.py --baseline temel.json --threshold 0.25
+    python3 benchmark.py --baseline temel.json --update-baseline
+    python3 benchmark.py --memory --quick --baseline bellek.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows'ta resource modülü yok, RSS ölçülmez
+    resource = None
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 7
+# Bir örneğin en az süresi (5 ms); daha kısa çağrılar bir örnekte birden çok kez çalıştırılır
+MIN_SAMPLE_NS = 5_000_000
+DEFAULT_THRESHOLD = 0.25
+# Bellek ölçümleri deterministiktir, eşik daha sıkı tutulur
+DEFAULT_MEMORY_THRESHOLD = 0.10
+# Bundan küçük mutlak bellek artışları (bayt) gerileme sayılmaz
+MIN_MEMORY_DELTA = 4096
+# Bundan küçük blok sayısı artışları gerileme sayılmaz
+MIN_BLOCK_DELTA = 64
+# peak_blocks ölçümünde yeni anlık görüntü için gereken bellek artışı (göreli)
+PEAK_SNAPSHOT_STEP = 0.10
+
+
+def _sorted_data(size):
+    rng = random.Random(42)
+    arr = list(range(0, 2 * size, 2))
+    targets = [rng.randrange(2 * size) for _ in range(1000)]
+    return arr, targets
+
+
+def _bench_binary_search_iterative(size):
+    from binary_search import binary_search_iterative
+    arr, targets = _sorted_data(size)
+    return lambda: [binary_search_iterative(arr, target) for target in targets]
+
+
+def _bench_binary_search_many(size):
+    from binary_search import binary_search_many
+    arr, targets = _sorted_data(size)
+    return lambda: binary_search_many(arr, targets)
+
+
+def _bench_sorted_index_find(size):
+    from binary_search import SortedIndex
+    arr, targets = _sorted_data(size)
+    index = SortedIndex(arr)
+    return lambda: [index.find(target) for target in targets]
+
+
+def _bench_linear_search_iterative(size):
+    from linear_search import linear_search_iterative
+    arr = list(range(size))
+    return lambda: linear_search_iterative(arr, -1)
+
+
+def _bench_linear_search_multi(size):
+    from linear_search import linear_search_multi
+    rng = random.Random(42)
+    arr = [rng.randrange(size) for _ in range(size)]
+    targets = [rng.randrange(2 * size) for _ in range(100)]
+    return lambda: linear_search_multi(arr, targets)
+
+
+def _random_floats(size):
+    rng = random.Random(42)
+    return [rng.random() for _ in range(size)]
+
+
+def _bench_array_sum_iterative(size):
+    from array_sum import array_sum_iterative
+    arr = _random_floats(size)
+    return lambda: array_sum_iterative(arr)
+
+
+def _bench_array_sum_divide_and_conquer(size):
+    from array_sum import array_sum_divide_and_conquer
+    arr = _random_floats(size)
+    return lambda: array_sum_divide_and_conquer(arr)
+
+
+def _bench_fast_sum(size):
+    from array_sum import fast_sum
+    arr = _random_floats(size)
+    return lambda: fast_sum(arr)
+
+
+def _square_matrices(size):
+    rng = random.Random(42)
+    A = [[rng.randrange(-9, 10) for _ in range(size)] for _ in range(size)]
+    B = [[rng.randrange(-9, 10) for _ in range(size)] for _ in range(size)]
+    return A, B
+
+
+def _bench_matrix_multiply(size):
+    from matrix_multiplication import matrix_multiply
+    A, B = _square_matrices(size)
+    return lambda: matrix_multiply(A, B)
+
+
+def _bench_matrix_multiply_tiled(size):
+    from matrix_multiplication import matrix_multiply_tiled
+    A, B = _square_matrices(size)
+    return lambda: matrix_multiply_tiled(A, B)
+
+
+def _bench_array_sum_recursive_v2(size):
+    from array_sum import array_sum_recursive_v2
+    arr = _random_floats(size)
+    return lambda: array_sum_recursive_v2(arr)
+
+
+def _bench_matrix_multiply_optimized(size):
+    from matrix_multiplication import matrix_multiply_optimized
+    A, B = _square_matrices(size)
+    return lambda: matrix_multiply_optimized(A, B)
+
+
+def _bench_create_identity_matrix(size):
+    from matrix_multiplication import create_identity_matrix
+    return lambda: create_identity_matrix(size)
+
+
+def _bench_create_identity_matrix_compact(size):
+    from matrix_multiplication import create_identity_matrix
+    return lambda: create_identity_matrix(size, compact=True)
+
+
+# ad -> (kurulum fonksiyonu, tüm boyutlar, --quick boyutları)
+# Kurulum fonksiyonu verilen boyut için girdiyi hazırlar ve ölçülecek,
+# argümansız bir fonksiyon döndürür (kurulum süresi ölçüme dahil değildir).
+BENCHMARKS = {
+    "binary_search.binary_search_iterative": (_bench_binary_search_iterative, (10**3, 10**5, 10**6), (10**3, 10**5)),
+    "binary_search.binary_search_many": (_bench_binary_search_many, (10**3, 10**5, 10**6), (10**3, 10**5)),
+    "binary_search.SortedIndex.find": (_bench_sorted_index_find, (10**3, 10**5, 10**6), (10**3, 10**5)),
+    "linear_search.linear_search_iterative": (_bench_linear_search_iterative, (10**3, 10**5, 10**6), (10**3, 10**4)),
+    "linear_search.linear_search_multi": (_bench_linear_search_multi, (10**3, 10**5, 10**6), (10**3, 10**4)),
+    "array_sum.array_sum_iterative": (_bench_array_sum_iterative, (10**3, 10**5, 10**6), (10**3, 10**4)),
+    "array_sum.array_sum_divide_and_conquer": (_bench_array_sum_divide_and_conquer, (10**3, 10**5, 10**6), (10**3, 10**4)),
+    "array_sum.fast_sum": (_bench_fast_sum, (10**3, 10**5, 10**6), (10**3, 10**4)),
+    "matrix_multiplication.matrix_multiply": (_bench_matrix_multiply, (16, 32, 64, 128), (16, 32)),
+    "matrix_multiplication.matrix_multiply_tiled": (_bench_matrix_multiply_tiled, (16, 32, 64, 128), (16, 32)),
+}
+
+# Bellek modunda ayrıca ölçülen, ayırdığı bellek açısından ilginç fonksiyonlar
+# (array_sum_recursive_v2 her seviyede dilim kopyalar: recursion limiti nedeniyle küçük boyutlar)
+MEMORY_BENCHMARKS = {
+    **BENCHMARKS,
+    "array_sum.array_sum_recursive_v2": (_bench_array_sum_recursive_v2, (100, 300, 900), (100, 300)),
+    "matrix_multiplication.matrix_multiply_optimized": (_bench_matrix_multiply_optimized, (16, 32, 64, 128), (16, 32)),
+    "matrix_multiplication.create_identity_matrix": (_bench_create_identity_matrix, (100, 300, 1000), (100, 300)),
+    "matrix_multiplication.create_identity_matrix(compact)": (_bench_create_identity_matrix_compact,
+                                                              (100, 300, 1000), (100, 300)),
+}
+
+
+def _calibrate(func, min_sample_ns=MIN_SAMPLE_NS):
+    """Bir örneğin en az min_sample_ns sürmesi için gereken çağrı sayısı"""
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_sample_ns or number >= 1 << 20:
+            return number
+        # Kalan süreye göre büyüt, en az iki katına çıkar
+        number = max(number * 2, int(number * min_sample_ns / max(elapsed, 1)) + 1)
+
+
+def measure(func, warmup=DEFAULT_WARMUP, repeat=DEFAULT_REPEAT, min_sample_ns=MIN_SAMPLE_NS):
+    """
+    Bir fonksiyonun çağrı başına süresini örnekler
+    
+    Args:
+        func: Argümansız ölçülecek fonksiyon
+        warmup: Ölçülmeyen ısınma çalıştırması sayısı
+        repeat: Örnek sayısı
+        min_sample_ns: Bir örneğin en az süresi (nanosaniye)
+    
+    Returns:
+        list: Çağrı başına süreler (nanosaniye, örnek başına bir değer)
+    """
+    for _ in range(warmup):
+        func()
+    number = _calibrate(func, min_sample_ns)
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter_ns() - start) / number)
+    return samples
+
+
+def percentile(values, q):
+    """
+    En yakın sıra (nearest-rank) yöntemiyle yüzdelik
+    
+    Args:
+        values: Değerler (boş olmamalı)
+        q: 0-100 arası yüzdelik
+    
+    Returns:
+        Değerlerin q. yüzdeliği
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """
+    Örneklerin istatistikleri
+    
+    Args:
+        samples: Nanosaniye cinsinden süreler
+    
+    Returns:
+        dict: samples, min_ns, median_ns, p95_ns, mean_ns, stddev_ns
+    """
+    return {
+        "samples": len(samples),
+        "min_ns": min(samples),
+        "median_ns": statistics.median(samples),
+        "p95_ns": percentile(samples, 95),
+        "mean_ns": statistics.fmean(samples),
+        "stddev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def measure_memory(func):
+    """
+    Tek bir çağrının bellek kullanımını tracemalloc ile ölçer
+    
+    Args:
+        func: Argümansız ölçülecek fonksiyon
+    
+    Fonksiyon iki kez çağrılır: ilk çağrıda tepe ve kalan bellek, ikincisinde
+    (anlık görüntülerin belleği tepe değerini etkilemesin diye) peak_blocks
+    ölçülür.
+    
+    Returns:
+        dict: peak_bytes, peak_blocks, retained_bytes, retained_blocks
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        # İzleme çağrıdan hemen önce başladığı için canlı bloklar çağrıya aittir
+        retained_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "peak_bytes": peak - start,
+        "peak_blocks": count_peak_blocks(func),
+        "retained_bytes": current - start,
+        "retained_blocks": retained_blocks,
+    }
+
+
+def count_peak_blocks(func):
+    """
+    Tepe bellek anında çağrının ayırıp tuttuğu blok sayısı
+    
+    Profil kancası her çağrı/dönüşte izlenen belleğe bakar ve bellek son
+    anlık görüntüden PEAK_SNAPSHOT_STEP oranında fazlaysa yeni bir anlık
+    görüntü alır; en yüksek bellekteki görüntünün blok sayısı döner.
+    tracemalloc'un kendi ayırmaları (anlık görüntüler) sayılmaz.
+    
+    Args:
+        func: Argümansız ölçülecek fonksiyon
+    
+    Returns:
+        int: Blok sayısı (tepe bellek ±PEAK_SNAPSHOT_STEP anındaki)
+    """
+    own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    state = {"mark": 0, "best": 0, "snapshot": None}
+    
+    def take(current):
+        state["snapshot"] = tracemalloc.take_snapshot()
+        state["best"] = current
+        state["mark"] = current * (1 + PEAK_SNAPSHOT_STEP)
+    
+    def hook(frame, event, arg):
+        current = tracemalloc.get_traced_memory()[0]
+        if current > state["mark"]:
+            take(current)
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        take(tracemalloc.get_traced_memory()[0])
+        base = state["snapshot"].filter_traces(own)
+        sys.setprofile(hook)
+        try:
+            result = func()
+        finally:
+            sys.setprofile(None)
+        current = tracemalloc.get_traced_memory()[0]
+        if current > state["best"]:
+            take(current)
+        snapshot = state["snapshot"].filter_traces(own)
+    finally:
+        tracemalloc.stop()
+    del result
+    return max(0, sum(stat.count_diff for stat in snapshot.compare_to(base, "filename")))
+
+
+def peak_rss_kb():
+    """Process'in en yüksek RSS değeri (KB, ölçülemiyorsa None)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss   # macOS bayt döndürür
+
+
+def _measure_memory_case(name, size):
+    """--memory-case: bir ölçümü bu process'te çalıştırıp JSON yazdırır"""
+    func = MEMORY_BENCHMARKS[name][0](size)
+    stats = measure_memory(func)
+    stats["rss_peak_kb"] = peak_rss_kb()
+    print(json.dumps(stats))
+
+
+def _selected(name_filter, registry=BENCHMARKS):
+    return {name: case for name, case in registry.items() if not name_filter or name_filter in name}
+
+
+def run_benchmarks(name_filter=None, quick=False, warmup=DEFAULT_WARMUP, repeat=DEFAULT_REPEAT, verbose=True):
+    """
+    Kayıtlı tüm ölçümleri boyut taramasıyla çalıştırır
+    
+    Args:
+        name_filter: Yalnızca adı bu metni içeren ölçümler (None: hepsi)
+        quick: True ise küçük boyutlar kullanılır
+        warmup: Isınma çalıştırması sayısı
+        repeat: Örnek sayısı
+        verbose: True ise her sonuç yazdırılır
+    
+    Returns:
+        dict: {"meta": {...}, "results": {"ad[boyut]": istatistikler}}
+    """
+    results = {}
+    for name, (setup, sizes, quick_sizes) in _selected(name_filter).items():
+        for size in (quick_sizes if quick else sizes):
+            stats = summarize(measure(setup(size), warmup=warmup, repeat=repeat))
+            stats.update(name=name, size=size)
+            results[f"{name}[{size}]"] = stats
+            if verbose:
+                print(f"{name + f'[{size}]':<52} medyan {format_ns(stats['median_ns']):>10}  "
+                      f"p95 {format_ns(stats['p95_ns']):>10}  ±{format_ns(stats['stddev_ns']):>9}")
+    return {"meta": _metadata(quick, warmup, repeat), "results": results}
+
+
+def run_memory_benchmarks(name_filter=None, quick=False, isolate=True, verbose=True):
+    """
+    Bellek ölçümlerini boyut taramasıyla çalıştırır
+    
+    Args:
+        name_filter: Yalnızca adı bu metni içeren ölçümler (None: hepsi)
+        quick: True ise küçük boyutlar kullanılır
+        isolate: True ise her ölçüm ayrı bir process'te yapılır; RSS yalnızca
+            bu durumda ölçüme özgüdür (False ise rss_peak_kb None)
+        verbose: True ise her sonuç yazdırılır
+    
+    Returns:
+        dict: {"meta": {...}, "results": {"ad[boyut]": bellek istatistikleri}}
+    
+    Raises:
+        RuntimeError: Ayrı process'teki ölçüm başarısız olursa
+    """
+    results = {}
+    for name, (setup, sizes, quick_sizes) in _selected(name_filter, MEMORY_BENCHMARKS).items():
+        for size in (quick_sizes if quick else sizes):
+            if isolate:
+                completed = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--memory-case", name, str(size)],
+                    capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+                if completed.returncode != 0:
+                    raise RuntimeError(f"{name}[{size}] bellek ölçümü başarısız:\n{completed.stderr}")
+                stats = json.loads(completed.stdout.strip().splitlines()[-1])
+            else:
+                stats = measure_memory(setup(size))
+                stats["rss_peak_kb"] = None
+            stats.update(name=name, size=size)
+            results[f"{name}[{size}]"] = stats
+            if verbose:
+                rss = "-" if stats["rss_peak_kb"] is None else f"{stats['rss_peak_kb']} KB"
+                print(f"{name + f'[{size}]':<60} tepe {format_bytes(stats['peak_bytes']):>10} "
+                      f"({stats['peak_blocks']:>7} blok)  "
+                      f"kalan {format_bytes(stats['retained_bytes']):>10} "
+                      f"({stats['retained_blocks']:>7} blok)  RSS {rss:>9}")
+    meta = _metadata(quick, 0, 1)
+    meta["mode"] = "memory"
+    return {"meta": meta, "results": results}
+
+
+def measure_instrumentation_overhead(size=10**5, warmup=DEFAULT_WARMUP, repeat=DEFAULT_REPEAT):
+    """
+    instrument() bloğunun açıkken ve kapalıyken ek yükünü ölçer
+    
+    binary_search.binary_search_iterative modül özniteliği üzerinden (sayacın
+    sarabileceği şekilde) ölçülür. Her turda blok öncesi, içi ve sonrası
+    birer örnek alınır; ek yük turların oranlarının medyanıdır, böylece
+    makinedeki yavaş değişimler iki tarafı birlikte etkiler. Oranların
+    yarı aralığı gürültü bandıdır; kapalı ek yük bu bandın içindeyse
+    ölçülebilir bir fark yoktur.
+    
+    Args:
+        size: Dizi boyutu
+        warmup: Isınma çalıştırması sayısı
+        repeat: Tur sayısı
+    
+    Returns:
+        dict: before_ns, enabled_ns, after_ns (medyanlar), disabled_overhead ve
+              enabled_overhead (göreli), noise (gürültü bandı, göreli),
+              within_noise (kapalı ek yük gürültü içinde mi), restored
+              (fonksiyonlar orijinal mi)
+    """
+    import binary_search
+    from instrumentation import INSTRUMENTED_FUNCTIONS, instrument
+    
+    arr, targets = _sorted_data(size)
+    originals = {name: getattr(binary_search, name) for name in INSTRUMENTED_FUNCTIONS["binary_search"]}
+    
+    def run():
+        search = binary_search.binary_search_iterative
+        for target in targets:
+            search(arr, target)
+    
+    for _ in range(warmup):
+        run()
+    number = _calibrate(run)
+    
+    def sample():
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            run()
+        return (time.perf_counter_ns() - start) / number
+    
+    before, enabled, after = [], [], []
+    for _ in range(max(1, repeat)):
+        before.append(sample())
+        with instrument(["binary_search"]):
+            enabled.append(sample())
+        after.append(sample())
+    
+    disabled_ratios = [a / b for a, b in zip(after, before)]
+    disabled_overhead = statistics.median(disabled_ratios) - 1
+    noise = (max(disabled_ratios) - min(disabled_ratios)) / 2
+    return {
+        "before_ns": statistics.median(before),
+        "enabled_ns": statistics.median(enabled),
+        "after_ns": statistics.median(after),
+        "disabled_overhead": disabled_overhead,
+        "enabled_overhead": statistics.median(e / b for e, b in zip(enabled, before)) - 1,
+        "noise": noise,
+        "within_noise": abs(disabled_overhead) <= noise,
+        "restored": all(getattr(binary_search, name) is original for name, original in originals.items()),
+    }
+
+
+def _metadata(quick, warmup, repeat):
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "quick": quick,
+        "warmup": warmup,
+        "repeat": repeat,
+    }
+
+
+def format_ns(ns):
+    """Nanosaniyeyi okunabilir birime çevirir (ns, µs, ms, s)"""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def format_bytes(size):
+    """Bayt değerini okunabilir birime çevirir (B, KB, MB, GB)"""
+    for unit, scale in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size} B"
+
+
+def save_results(results, path):
+    """Sonuçları JSON dosyasına yazar"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """JSON dosyasından sonuçları okur"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, metric="median_ns", min_delta=0):
+    """
+    Sonuçları temel çizgi ile karşılaştırır
+    
+    Yalnızca iki tarafta da bulunan ölçümler karşılaştırılır.
+    
+    Args:
+        current: run_benchmarks sonucu
+        baseline: Kaydedilmiş sonuç
+        threshold: İzin verilen göreli artış (0.25 = %25 yavaşlama)
+        metric: Karşılaştırılan istatistik (varsayılan medyan; bellek için "peak_bytes")
+        min_delta: Bundan küçük mutlak artışlar gerileme sayılmaz
+    
+    Returns:
+        list: Gerilemeler - (ad, temel değer, yeni değer, oran), orana göre azalan
+    """
+    regressions = []
+    for key, stats in current["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if base is None or metric not in base or not base[metric]:
+            continue
+        ratio = stats[metric] / base[metric]
+        if ratio > 1 + threshold and stats[metric] - base[metric] >= min_delta:
+            regressions.append((key, base[metric], stats[metric], ratio))
+    return sorted(regressions, key=lambda item: item[3], reverse=True)
+
+
+def main(argv=None):
+    """
+    Komut satırı arayüzü
+    
+    Returns:
+        int: Çıkış kodu - gerileme varsa 1, yoksa 0
+    """
+    parser = argparse.ArgumentParser(description="Algoritma performans testleri")
+    parser.add_argument("--quick", action="store_true", help="küçük girdi boyutları")
+    parser.add_argument("--memory", action="store_true",
+                        help="süre yerine bellek kullanımını ölç (tracemalloc, ru_maxrss)")
+    parser.add_argument("--filter", default=None, help="yalnızca adı bu metni içeren ölçümler")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="ısınma çalıştırması sayısı")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="örnek sayısı")
+    parser.add_argument("--output", default=None, help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", default=None,
+                        help="karşılaştırılacak temel çizgi (yoksa bu çalıştırma ile oluşturulur)")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="gerileme eşiği, göreli (varsayılan süre için 0.25, bellek için 0.10)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="karşılaştırmadan sonra temel çizgiyi bu sonuçlarla değiştir")
+    parser.add_argument("--memory-case", nargs=2, metavar=("AD", "BOYUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.memory_case:
+        _measure_memory_case(args.memory_case[0], int(args.memory_case[1]))
+        return 0
+    
+    print("=" * 60)
+    print("BELLEK TESTLERİ" if args.memory else "PERFORMANS TESTLERİ")
+    print("=" * 60)
+    if args.memory:
+        results = run_memory_benchmarks(args.filter, args.quick)
+        threshold = DEFAULT_MEMORY_THRESHOLD if args.threshold is None else args.threshold
+        metric, min_delta, fmt, change = "peak_bytes", MIN_MEMORY_DELTA, format_bytes, "bellek artışı"
+    else:
+        results = run_benchmarks(args.filter, args.quick, args.warmup, args.repeat)
+        threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+        metric, min_delta, fmt, change = "median_ns", 0, format_ns, "yavaşlama"
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+    
+    if not args.memory and (not args.filter or "instrumentation" in args.filter):
+        overhead = measure_instrumentation_overhead(warmup=args.warmup, repeat=args.repeat)
+        if overhead["within_noise"]:
+            disabled = f"gürültü içinde (±{overhead['noise']:.1%})"
+        else:
+            disabled = f"{overhead['disabled_overhead']:+.1%} (gürültü ±{overhead['noise']:.1%})"
+        print(f"\ninstrument() ek yükü (binary_search_iterative, 1000 arama): "
+              f"kapalı {disabled}, "
+              f"açık {overhead['enabled_overhead']:+.1%} ({format_ns(overhead['enabled_ns'])})")
+        if not overhead["restored"] or (not overhead["within_noise"] and overhead["disabled_overhead"] > threshold):
+            print("instrument() bloğundan sonra orijinal performansa dönülmedi")
+            return 1
+    
+    if not args.baseline:
+        return 0
+    if not os.path.exists(args.baseline):
+        save_results(results, args.baseline)
+        print(f"\nTemel çizgi bulunamadı, bu sonuçlarla oluşturuldu: {args.baseline}")
+        return 0
+    
+    baseline = load_results(args.baseline)
+    regressions = compare(results, baseline, threshold, metric, min_delta)
+    if args.memory:
+        # Ayırma sayısı patlamaları da bellek artışı gibi kapıdan geçemez
+        regressions += [(f"{key} (blok)", base, new, ratio) for key, base, new, ratio
+                        in compare(results, baseline, threshold, "peak_blocks", MIN_BLOCK_DELTA)]
+    if args.update_baseline:
+        save_results(results, args.baseline)
+        print(f"\nTemel çizgi güncellendi: {args.baseline}")
+    if not regressions:
+        print(f"\nTemel çizgiye göre eşiği (%{threshold * 100:.0f}) aşan {change} yok")
+        return 0
+    
+    print(f"\n{len(regressions)} gerileme (eşik %{threshold * 100:.0f}):")
+    for key, base, new, ratio in regressions:
+        if key.endswith(" (blok)"):
+            print(f"  {key:<60} {base:>10} -> {new:>10} ({ratio:.2f}x)")
+        else:
+            print(f"  {key:<60} {fmt(base):>10} -> {fmt(new):>10} ({ratio:.2f}x)")
+    return 0 if args.update_baseline else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
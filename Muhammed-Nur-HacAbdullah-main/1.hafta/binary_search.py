@@ -10,9 +10,25 @@ Zaman Karmaşıklığı:
 - Ortalama Durum: O(log n) - Aranan eleman dizinin herhangi bir yerindedir
 - En Kötü Durum: O(log n) - Aranan eleman dizinin sonundadır veya dizide yoktur
 
-Alan Karmaşıklığı: O(log n) - Recursive çağrılardan dolayı stack kullanımı
+Alan Karmaşıklığı:
+- Recursive: O(log n) - Recursive çağrılardan dolayı stack kullanımı
+- Iterative: O(1) - Sabit alan kullanımı
 """
 
+import math
+from array import array
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isteğe bağlıdır, yoksa saf Python yolu kullanılır
+    np = None
+
+# adaptive_search: bu boyuttan küçük dizilerde interpolasyon maliyetine değmez
+ADAPTIVE_MIN_SIZE = 16
+# Düzgün olmayan dağılımda ilk GALLOP_LIMIT eleman içindeki hedefler üstel arama ile bulunur
+GALLOP_LIMIT = 64
+
 def binary_search_recursive(arr, target, left, right):
     """
     Recursive ikili arama fonksiyonu
@@ -60,6 +76,729 @@ def binary_search(arr, target):
     return binary_search_recursive(arr, target, 0, len(arr) - 1)
 
 
+def binary_search_iterative(arr, target, key=None):
+    """
+    İterative (döngü kullanarak) ikili arama
+    
+    binary_search ile aynı orta noktaları aynı sırayla dener, bu yüzden tekrar
+    eden elemanlarda bile aynı index'i döndürür. Her yarıya bölmede yeni bir
+    fonksiyon çağrısı yapılmadığı için daha hızlıdır ve alan karmaşıklığı O(1)'dir.
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+        key: Elemanlardan karşılaştırma anahtarını çıkaran fonksiyon (varsayılan None)
+    
+    Returns:
+        int: Elemanın index'i (bulunamazsa -1)
+    """
+    left = 0
+    right = len(arr) - 1
+    
+    if key is None:
+        while left <= right:
+            mid = left + (right - left) // 2
+            value = arr[mid]
+            if value == target:
+                return mid
+            if value > target:
+                right = mid - 1
+            else:
+                left = mid + 1
+        return -1
+    
+    while left <= right:
+        mid = left + (right - left) // 2
+        value = key(arr[mid])
+        if value == target:
+            return mid
+        if value > target:
+            right = mid - 1
+        else:
+            left = mid + 1
+    return -1
+
+
+def lower_bound(arr, target, lo=0, hi=None, key=None):
+    """
+    target'tan küçük olmayan ilk elemanın index'ini bulur (bisect.bisect_left ile uyumlu)
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+        lo: Arama aralığının sol sınırı (dahil, varsayılan 0)
+        hi: Arama aralığının sağ sınırı (hariç, varsayılan len(arr))
+        key: Elemanlardan karşılaştırma anahtarını çıkaran fonksiyon (varsayılan None)
+    
+    Returns:
+        int: target'ın sıralamayı bozmadan eklenebileceği en soldaki konum
+    
+    Raises:
+        ValueError: lo negatifse
+    """
+    if lo < 0:
+        raise ValueError("lo negatif olamaz")
+    if hi is None:
+        hi = len(arr)
+    
+    if key is None:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if arr[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key(arr[mid]) < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def upper_bound(arr, target, lo=0, hi=None, key=None):
+    """
+    target'tan büyük olan ilk elemanın index'ini bulur (bisect.bisect_right ile uyumlu)
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+        lo: Arama aralığının sol sınırı (dahil, varsayılan 0)
+        hi: Arama aralığının sağ sınırı (hariç, varsayılan len(arr))
+        key: Elemanlardan karşılaştırma anahtarını çıkaran fonksiyon (varsayılan None)
+    
+    Returns:
+        int: target'ın sıralamayı bozmadan eklenebileceği en sağdaki konum
+    
+    Raises:
+        ValueError: lo negatifse
+    """
+    if lo < 0:
+        raise ValueError("lo negatif olamaz")
+    if hi is None:
+        hi = len(arr)
+    
+    if key is None:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if target < arr[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if target < key(arr[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def equal_range(arr, target, lo=0, hi=None, key=None):
+    """
+    target'a eşit elemanların kapladığı aralığı bulur
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+        lo: Arama aralığının sol sınırı (dahil, varsayılan 0)
+        hi: Arama aralığının sağ sınırı (hariç, varsayılan len(arr))
+        key: Elemanlardan karşılaştırma anahtarını çıkaran fonksiyon (varsayılan None)
+    
+    Returns:
+        tuple: (ilk konum, son konum + 1) - eleman yoksa iki değer eşittir
+    """
+    first = lower_bound(arr, target, lo, hi, key)
+    return (first, upper_bound(arr, target, first, hi, key))
+
+
+def _binary_search_choice(n, first, last):
+    """
+    arr[first..last] (dahil) aynı değerse binary_search'ün döndüreceği index
+    
+    binary_search'ün orta noktaları yalnızca index'lerle yeniden izlenir,
+    diziye erişilmez: O(log n).
+    """
+    left = 0
+    right = n - 1
+    while True:
+        mid = left + (right - left) // 2
+        if mid > last:
+            right = mid - 1
+        elif mid < first:
+            left = mid + 1
+        else:
+            return mid
+
+
+def binary_search_many(arr, targets):
+    """
+    Birden fazla değeri aynı sıralı dizide tek seferde arar
+    
+    - NumPy dizileri (veya array.array) için vektörel searchsorted kullanılır
+    - Hedefler sıralıysa galloping (üstel) arama ile bir önceki sonucun
+      bulunduğu yerden devam edilir, böylece dizi baştan taranmaz
+    - Aksi halde her hedef için lower_bound çağrılır
+    
+    Sonuçlar her hedef için binary_search çağırmakla aynıdır: tekrar eden
+    elemanlarda bulunan grubun içinden binary_search'ün seçtiği index döner.
+    
+    Args:
+        arr: Sıralı dizi
+        targets: Aranan değerler
+    
+    Returns:
+        list: Her hedef için index (bulunamazsa -1); NumPy girişte ndarray
+    """
+    if np is not None and isinstance(arr, (np.ndarray, array)):
+        return _binary_search_many_numpy(arr, targets)
+    
+    if not isinstance(targets, (list, tuple, range)):
+        targets = list(targets)
+    
+    n = len(arr)
+    result = [-1] * len(targets)
+    
+    if all(a <= b for a, b in zip(targets, islice(targets, 1, None))):
+        # Sıralı hedefler: arr[lo - 1] < target her zaman sağlanır
+        lo = 0
+        for i, target in enumerate(targets):
+            hi = lo
+            step = 1
+            while hi < n and arr[hi] < target:
+                lo = hi + 1
+                hi += step
+                step *= 2
+            lo = lower_bound(arr, target, lo, min(hi, n))
+            if lo < n and arr[lo] == target:
+                result[i] = _duplicate_choice(arr, target, lo, n)
+        return result
+    
+    for i, target in enumerate(targets):
+        index = lower_bound(arr, target)
+        if index < n and arr[index] == target:
+            result[i] = _duplicate_choice(arr, target, index, n)
+    return result
+
+
+def _duplicate_choice(arr, target, first, n):
+    """arr[first] == target iken binary_search'ün döndüreceği index"""
+    if first + 1 < n and arr[first + 1] == target:
+        return _binary_search_choice(n, first, upper_bound(arr, target, first + 1) - 1)
+    return first
+
+
+def _binary_search_many_numpy(arr, targets):
+    """NumPy searchsorted ile vektörel toplu arama"""
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    if len(arr) == 0:
+        return np.full(targets.shape, -1, dtype=np.intp)
+    
+    positions = np.searchsorted(arr, targets, side="left")
+    ends = np.searchsorted(arr, targets, side="right")
+    result = np.where(ends > positions, positions, -1)
+    
+    # Tekrar eden elemanlar: binary_search'ün orta noktaları vektörel izlenir
+    duplicates = np.flatnonzero(ends - positions > 1)
+    if len(duplicates):
+        first = positions[duplicates]
+        last = ends[duplicates] - 1
+        left = np.zeros_like(first)
+        right = np.full_like(first, len(arr) - 1)
+        pending = np.ones(len(duplicates), dtype=bool)
+        while pending.any():
+            mid = left + (right - left) // 2
+            hit = pending & (mid >= first) & (mid <= last)
+            result[duplicates[hit]] = mid[hit]
+            pending &= ~hit
+            right = np.where(pending & (mid > last), mid - 1, right)
+            left = np.where(pending & (mid < first), mid + 1, left)
+    return result
+
+
+def binary_search_with_count(arr, target):
+    """
+    binary_search ile aynı sonucu ve dizi erişimi (yoklama) sayısını döndürür
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+    
+    Returns:
+        tuple: (index, yoklama sayısı) - bulunamazsa index -1
+    """
+    left = 0
+    right = len(arr) - 1
+    probes = 0
+    while left <= right:
+        mid = left + (right - left) // 2
+        value = arr[mid]
+        probes += 1
+        if value == target:
+            return (mid, probes)
+        if value > target:
+            right = mid - 1
+        else:
+            left = mid + 1
+    return (-1, probes)
+
+
+def _is_finite_number(value):
+    """NaN ve sonsuz olmayan sayı mı? (bool sayı kabul edilmez)"""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, float) and math.isfinite(value)
+
+
+class _ProbeCounter:
+    """Dizi erişimlerini (yoklamaları) sayan salt okunur sarmalayıcı"""
+    
+    def __init__(self, arr):
+        self._arr = arr
+        self.probes = 0
+    
+    def __len__(self):
+        return len(self._arr)
+    
+    def __getitem__(self, index):
+        self.probes += 1
+        return self._arr[index]
+
+
+def adaptive_search_with_count(arr, target):
+    """
+    adaptive_search sonucunu ve dizi erişimi (yoklama) sayısını döndürür
+    
+    Yalnızca testler ve karşılaştırmalar içindir: adaptive_search aynen
+    çalıştırılır, erişimler bir sarmalayıcı üzerinden sayılır.
+    
+    Args:
+        arr: Sıralı sayı dizisi
+        target: Aranan değer
+    
+    Returns:
+        tuple: (index, yoklama sayısı) - bulunamazsa index -1
+    """
+    counter = _ProbeCounter(arr)
+    index = adaptive_search(counter, target)
+    return (index, counter.probes)
+
+
+def _bisect_between(arr, target, left, right):
+    """arr[left..right] (dahil) aralığında ikiye bölerek arama"""
+    while left <= right:
+        mid = left + (right - left) // 2
+        value = arr[mid]
+        if value == target:
+            return mid
+        if value > target:
+            right = mid - 1
+        else:
+            left = mid + 1
+    return -1
+
+
+def _gallop_search(arr, target, limit):
+    """arr[0] < target <= arr[limit] iken 1, 2, 4, ... adımlarla arama, O(log i)"""
+    low = 0
+    bound = 1
+    while bound < limit and arr[bound] < target:
+        low = bound
+        bound *= 2
+    return _bisect_between(arr, target, low + 1, min(bound, limit))
+
+
+def adaptive_search(arr, target):
+    """
+    Verinin dağılımına uyum sağlayan arama (sıralı sayı dizileri için)
+    
+    - İlk ve son eleman okunur; aralık dışındaki hedefler hemen elenir.
+    - Interpolasyon araması yapılır: konum, hedefin değer aralığındaki
+      oranına göre tahmin edilir (düzgün veride ortalama O(log log n) yoklama).
+    - Bir interpolasyon adımı aralığı en az yarıya indiremezse dağılım düzgün
+      değildir ve kalan aralıkta ikiye bölmeye geçilir; en kötü durum
+      O(log n) yoklamadır. Hedef dizinin başında kaldıysa (ilk
+      GALLOP_LIMIT eleman) üstel (galloping) arama yapılır: O(log i).
+    
+    Not: Düzgün olmayan veride ikili aramadan birkaç yoklama fazla yapılır ve
+    interpolasyon adımı bir ikiye bölme adımından pahalıdır; bu dağılımlarda
+    binary_search_iterative daha hızlıdır.
+    
+    Sonuçlar binary_search ile aynıdır: bulunan konum komşularıyla kontrol
+    edilir, tekrar eden elemanlarda binary_search'ün seçtiği kopya döndürülür.
+    Küçük diziler, sayı olmayan, NaN ya da sonsuz değerler doğrudan ikiye
+    bölme ile aranır.
+    
+    Args:
+        arr: Sıralı dizi
+        target: Aranan değer
+    
+    Returns:
+        int: Elemanın index'i (bulunamazsa -1)
+    """
+    n = len(arr)
+    if n < ADAPTIVE_MIN_SIZE or not _is_finite_number(target):
+        return binary_search_iterative(arr, target)
+    
+    left, right = 0, n - 1
+    left_value, right_value = arr[left], arr[right]
+    if not (_is_finite_number(left_value) and _is_finite_number(right_value)):
+        return binary_search_iterative(arr, target)
+    if target < left_value or target > right_value:
+        return -1
+    
+    if target == left_value:
+        index = left
+    elif target == right_value:
+        index = right
+    else:
+        # Değişmez: arr[left] < target < arr[right]
+        index = -1
+        while right - left > 1:
+            size = right - left
+            # left_value < target < right_value olduğundan 0 <= offset <= size - 2
+            offset = (target - left_value) * (size - 1) // (right_value - left_value)
+            if not 0 <= offset < size:
+                # Değer aralığı float'a sığmadı (inf veya NaN), ikiye bölmeye geç
+                index = _bisect_between(arr, target, left + 1, right - 1)
+                break
+            mid = left + 1 + int(offset)
+            if mid >= right:  # ondalıklı bölmede yuvarlama
+                mid = right - 1
+            value = arr[mid]
+            if value == target:
+                index = mid
+                break
+            if value < target:
+                left, left_value = mid, value
+            else:
+                right, right_value = mid, value
+            if right - left > size // 2:
+                # Interpolasyon ilerleyemedi, kalan aralıkta ikiye bölme
+                if left == 0 and right > GALLOP_LIMIT:
+                    if target <= arr[GALLOP_LIMIT]:
+                        index = _gallop_search(arr, target, GALLOP_LIMIT)
+                    else:
+                        index = _bisect_between(arr, target, GALLOP_LIMIT + 1, right - 1)
+                else:
+                    index = _bisect_between(arr, target, left + 1, right - 1)
+                break
+    
+    if index == -1:
+        return -1
+    # Tekrar eden elemanlarda binary_search'ün seçtiği kopya döndürülmeli
+    if (index > 0 and arr[index - 1] == target) or (index < n - 1 and arr[index + 1] == target):
+        return binary_search_iterative(arr, target)
+    return index
+
+
+def benchmark_adaptive_search(size=10**5, queries=5000, repeat=3):
+    """
+    adaptive_search ile binary_search'ü farklı dağılımlarda karşılaştırır
+    
+    Dağılımlar:
+    - uniform: 0, 2, 4, ... (interpolasyon için ideal)
+    - skewed: log-normal dağılımdan sıralı değerler (çoğu değer başta)
+    - adversarial: 0, 1, ..., n-2 ve çok büyük tek bir son değer
+      (interpolasyon her adımda dizinin başını tahmin eder)
+    
+    Args:
+        size: Dizi boyutu
+        queries: Arama sayısı (yarısı dizide olan değerler)
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (dağılım, binary ort. yoklama, adaptive ort. yoklama,
+               binary ns/arama, adaptive ns/arama)
+    """
+    import random
+    import time
+    
+    rng = random.Random(42)
+    distributions = {
+        "uniform": list(range(0, 2 * size, 2)),
+        "skewed": sorted(set(int(rng.lognormvariate(0, 2) * size) for _ in range(size))),
+        "adversarial": list(range(size - 1)) + [10 ** 12],
+    }
+    
+    def best_time(func, arr, targets):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for target in targets:
+                func(arr, target)
+            best = min(best, time.perf_counter() - start)
+        return best * 1e9 / len(targets)
+    
+    results = []
+    for name, arr in distributions.items():
+        targets = [rng.choice(arr) if i % 2 else rng.randrange(arr[0], arr[-1] + 1) for i in range(queries)]
+        binary_probes = sum(binary_search_with_count(arr, t)[1] for t in targets) / queries
+        adaptive_probes = sum(adaptive_search_with_count(arr, t)[1] for t in targets) / queries
+        results.append((
+            name,
+            binary_probes,
+            adaptive_probes,
+            best_time(binary_search_iterative, arr, targets),
+            best_time(adaptive_search, arr, targets),
+        ))
+    return results
+
+
+class SortedIndex:
+    """
+    Tekrarlı aramalar için bir kez oluşturulan arama indeksi (Eytzinger düzeni)
+    
+    Sıralı dizinin elemanları, örtük ikili ağacın genişlik öncelikli (BFS)
+    sırasıyla saklanır: k. düğümün çocukları 2k ve 2k+1'dedir. Böylece aramanın
+    ilk adımlarında erişilen elemanlar bellekte yan yana durur. Tamsayı ve
+    ondalıklı diziler sabit genişlikli array('q') / array('d') içinde tutulur.
+    
+    Zaman Karmaşıklığı:
+    - Oluşturma: O(n)
+    - find / lower_bound: O(log n)
+    - range: O(log n) - sonuç bir range nesnesidir, kopya oluşturulmaz
+    
+    Not: find sonuçları tekrar eden elemanlarda da binary_search ile
+    aynıdır; lower_bound ve range en soldaki index'i kullanır.
+    """
+    
+    def __init__(self, arr):
+        """
+        Args:
+            arr: Sıralı dizi
+        """
+        n = len(arr)
+        self._size = n
+        keys = [arr[0] if n else 0] * (n + 1)   # 0. konum kullanılmaz
+        ranks = array("q", bytes(8 * (n + 1)))  # Eytzinger konumu -> sıralı index
+        
+        # Örtük ağacın in-order (sol-kök-sağ) gezintisi sıralı sırayı verir
+        stack = []
+        k = 1
+        i = 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            keys[k] = arr[i]
+            ranks[k] = i
+            i += 1
+            k = 2 * k + 1
+        
+        # Tekrar eden değer grupları: en soldaki index -> binary_search'ün seçtiği index
+        choices = {}
+        start = 0
+        for i in range(1, n + 1):
+            if i == n or arr[i] != arr[start]:
+                if i - start > 1:
+                    choices[start] = _binary_search_choice(n, start, i - 1)
+                start = i
+        
+        if all(type(key) is int for key in keys):
+            try:
+                keys = array("q", keys)
+            except OverflowError:
+                pass
+        elif all(type(key) is float for key in keys):
+            keys = array("d", keys)
+        
+        self._keys = keys
+        self._ranks = ranks
+        self._choices = choices
+    
+    def __len__(self):
+        return self._size
+    
+    def __contains__(self, target):
+        return self.find(target) != -1
+    
+    def _descend(self, target):
+        """target'tan küçük olmayan ilk elemanın Eytzinger konumu (yoksa 0)"""
+        keys = self._keys
+        n = self._size
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] < target)
+        # Sondaki 1 bitleri ve bir 0 biti atılınca en son sola dönülen düğüm kalır
+        return k >> ((~k & (k + 1)).bit_length())
+    
+    def lower_bound(self, target):
+        """
+        target'tan küçük olmayan ilk elemanın index'ini bulur
+        
+        Args:
+            target: Aranan değer
+        
+        Returns:
+            int: Sıralı dizideki index (tüm elemanlar küçükse len(dizi))
+        """
+        k = self._descend(target)
+        return self._ranks[k] if k else self._size
+    
+    def find(self, target):
+        """
+        Elemanın sıralı dizideki index'ini bulur
+        
+        Args:
+            target: Aranan değer
+        
+        Returns:
+            int: Elemanın index'i (bulunamazsa -1)
+        """
+        k = self._descend(target)
+        if k and self._keys[k] == target:
+            rank = self._ranks[k]
+            return self._choices.get(rank, rank)
+        return -1
+    
+    def range(self, lo, hi):
+        """
+        lo <= eleman < hi koşulunu sağlayan elemanların index'lerini bulur
+        
+        Args:
+            lo: Alt sınır (dahil)
+            hi: Üst sınır (hariç)
+        
+        Returns:
+            range: Sıralı dizideki index aralığı
+        """
+        start = self.lower_bound(lo)
+        return range(start, max(start, self.lower_bound(hi)))
+
+
+def benchmark_sorted_index(sizes=(10**3, 10**5, 10**6), queries=10000, repeat=3):
+    """
+    SortedIndex oluşturma ve sorgu sürelerini binary_search ile karşılaştırır
+    
+    Args:
+        sizes: Denenecek dizi boyutları
+        queries: Her boyutta yapılacak arama sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (boyut, oluşturma ms, binary_search ns/arama, SortedIndex.find ns/arama)
+    """
+    import random
+    import time
+    
+    def best_time(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    rng = random.Random(42)
+    results = []
+    for size in sizes:
+        arr = list(range(0, 2 * size, 2))
+        targets = [rng.randrange(2 * size) for _ in range(queries)]
+        build_time = best_time(lambda: SortedIndex(arr))
+        index = SortedIndex(arr)
+        find = index.find
+        results.append((
+            size,
+            build_time * 1e3,
+            best_time(lambda: [binary_search(arr, t) for t in targets]) * 1e9 / queries,
+            best_time(lambda: [find(t) for t in targets]) * 1e9 / queries,
+        ))
+    return results
+
+
+def benchmark_binary_search_many(size=10**5, queries=20000, repeat=3):
+    """
+    Tek tek binary_search döngüsü ile binary_search_many'nin işlem hacmini karşılaştırır
+    
+    Args:
+        size: Sıralı dizinin boyutu
+        queries: Aranan değer sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Yöntem adı -> saniyedeki arama sayısı
+    """
+    import random
+    import time
+    
+    def throughput(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return queries / best
+    
+    rng = random.Random(42)
+    arr = list(range(0, 2 * size, 2))
+    targets = [rng.randrange(2 * size) for _ in range(queries)]
+    sorted_targets = sorted(targets)
+    
+    results = {
+        "binary_search döngüsü": throughput(lambda: [binary_search(arr, t) for t in targets]),
+        "binary_search_many (sırasız)": throughput(lambda: binary_search_many(arr, targets)),
+        "binary_search_many (sıralı)": throughput(lambda: binary_search_many(arr, sorted_targets)),
+    }
+    if np is not None:
+        np_arr = np.asarray(arr)
+        np_targets = np.asarray(targets)
+        results["binary_search_many (NumPy)"] = throughput(
+            lambda: binary_search_many(np_arr, np_targets))
+    return results
+
+
+def benchmark_binary_search(sizes=(10, 10**3, 10**5, 10**8), lookups=10000, repeat=3):
+    """
+    Recursive ve iterative ikili aramanın arama başına sürelerini ölçer
+    
+    Büyük boyutlarda bellek harcamamak için dizi olarak range nesnesi kullanılır
+    (range sıralıdır ve index ile erişim O(1)'dir).
+    
+    Args:
+        sizes: Denenecek dizi boyutları
+        lookups: Her boyutta yapılacak arama sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (boyut, recursive ns/arama, iterative ns/arama, lower_bound ns/arama)
+    """
+    import random
+    import time
+    
+    def best_time(func, arr, targets):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for target in targets:
+                func(arr, target)
+            best = min(best, time.perf_counter() - start)
+        return best * 1e9 / len(targets)
+    
+    rng = random.Random(42)
+    results = []
+    for size in sizes:
+        arr = range(0, 2 * size, 2)
+        # Yarısı dizide olan, yarısı olmayan (tek sayı) hedefler
+        targets = [rng.randrange(2 * size) for _ in range(lookups)]
+        results.append((
+            size,
+            best_time(binary_search, arr, targets),
+            best_time(binary_search_iterative, arr, targets),
+            best_time(lower_bound, arr, targets),
+        ))
+    return results
+
+
 # Test Senaryoları
 if __name__ == "__main__":
     print("=" * 60)
@@ -109,5 +848,147 @@ if __name__ == "__main__":
     print(f"Aranan: {target_5}")
     print(f"Sonuç: Index {result_5}")
     
+    # Test 6: Iterative arama ve sınır fonksiyonları
+    test_array_6 = [1, 2, 2, 2, 3, 5, 5, 8]
+    print(f"\nTest 6: Iterative Arama ve Sınırlar")
+    print(f"Dizi: {test_array_6}")
+    for target_6 in [0, 1, 2, 4, 5, 8, 9]:
+        print(f"Aranan: {target_6} -> Recursive: {binary_search(test_array_6, target_6)}, "
+              f"Iterative: {binary_search_iterative(test_array_6, target_6)}, "
+              f"lower_bound: {lower_bound(test_array_6, target_6)}, "
+              f"upper_bound: {upper_bound(test_array_6, target_6)}, "
+              f"equal_range: {equal_range(test_array_6, target_6)}")
+    
+    # Sonuçlar hem recursive versiyonla hem de bisect modülüyle aynı olmalı
+    import bisect
+    for n in range(0, 40):
+        arr = sorted((i * 7) % 11 for i in range(n))
+        for target in range(-1, 12):
+            assert binary_search_iterative(arr, target) == binary_search(arr, target)
+            assert lower_bound(arr, target) == bisect.bisect_left(arr, target)
+            assert upper_bound(arr, target) == bisect.bisect_right(arr, target)
+    print("Recursive / bisect karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 7: key= ile arama (kayıtlar id'ye göre sıralı)
+    records = [(3, "ali"), (7, "ayşe"), (12, "mehmet"), (20, "zeynep")]
+    id_key = lambda record: record[0]
+    print(f"\nTest 7: key= ile Arama")
+    print(f"Kayıtlar: {records}")
+    print(f"id=12 -> Index {binary_search_iterative(records, 12, key=id_key)}")
+    print(f"id=10 -> lower_bound {lower_bound(records, 10, key=id_key)}")
+    
+    # Test 8: Performans testi (range kullanıldığı için 10^8 eleman bellek harcamaz)
+    print(f"\nTest 8: Performans Testi (arama başına süre)")
+    print(f"{'Boyut':>12} {'Recursive':>12} {'Iterative':>12} {'lower_bound':>12} {'Hızlanma':>9}")
+    for size, rec_ns, iter_ns, lb_ns in benchmark_binary_search(lookups=2000):
+        print(f"{size:>12} {rec_ns:>10.0f}ns {iter_ns:>10.0f}ns {lb_ns:>10.0f}ns {rec_ns / iter_ns:>8.2f}x")
+    
+    # Test 9: Toplu arama
+    test_array_9 = [2, 4, 4, 8, 16, 23, 42]
+    targets_9 = [4, 5, 16, 42, 1, 100]
+    print(f"\nTest 9: Toplu Arama (binary_search_many)")
+    print(f"Dizi: {test_array_9}")
+    print(f"Arananlar: {targets_9}")
+    print(f"Sonuç (sırasız): {binary_search_many(test_array_9, targets_9)}")
+    print(f"Sonuç (sıralı): {binary_search_many(test_array_9, sorted(targets_9))}")
+    
+    # Sonuçlar binary_search ile aynı olmalı
+    import random
+    rng = random.Random(7)
+    for n in range(0, 60):
+        arr = sorted(rng.sample(range(200), n))
+        queries = [rng.randrange(-5, 205) for _ in range(30)]
+        expected = [binary_search(arr, q) for q in queries]
+        assert binary_search_many(arr, queries) == expected
+        assert binary_search_many(arr, sorted(queries)) == [binary_search(arr, q) for q in sorted(queries)]
+        if np is not None:
+            assert binary_search_many(np.array(arr, dtype=np.int64), np.array(queries)).tolist() == expected
+    # Tekrar eden elemanlarda da tek tek binary_search döngüsüyle aynı sonuç
+    assert binary_search_many([1, 2, 2, 2, 2, 2, 3], [2]) == [binary_search([1, 2, 2, 2, 2, 2, 3], 2)] == [3]
+    for n in range(0, 60):
+        arr = sorted(rng.randrange(15) for _ in range(n))
+        queries = [rng.randrange(-2, 17) for _ in range(30)]
+        expected = [binary_search(arr, q) for q in queries]
+        assert binary_search_many(arr, queries) == expected
+        assert binary_search_many(arr, sorted(queries)) == [binary_search(arr, q) for q in sorted(queries)]
+        if np is not None:
+            assert binary_search_many(np.array(arr, dtype=np.int64), np.array(queries)).tolist() == expected
+    print("binary_search karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 10: Toplu arama işlem hacmi
+    print(f"\nTest 10: Toplu Arama Performansı (saniyedeki arama)")
+    for name, rate in benchmark_binary_search_many(queries=5000).items():
+        print(f"{name:>30}: {rate:>12,.0f} arama/sn")
+    
+    # Test 11: Önceden oluşturulan arama indeksi
+    test_array_11 = [3, 8, 8, 15, 21, 34, 55, 89]
+    index_11 = SortedIndex(test_array_11)
+    print(f"\nTest 11: SortedIndex (Eytzinger Düzeni)")
+    print(f"Dizi: {test_array_11}")
+    print(f"find(21): {index_11.find(21)}, find(22): {index_11.find(22)}")
+    print(f"lower_bound(9): {index_11.lower_bound(9)}, lower_bound(100): {index_11.lower_bound(100)}")
+    print(f"range(8, 34): {list(index_11.range(8, 34))}")
+    assert SortedIndex([1, 2, 2, 2, 2, 2, 3]).find(2) == binary_search([1, 2, 2, 2, 2, 2, 3], 2) == 3
+    
+    for n in range(0, 60):
+        arr = sorted(rng.sample(range(200), n))
+        index = SortedIndex(arr)
+        for q in range(-5, 205):
+            assert index.find(q) == binary_search(arr, q)
+            assert index.lower_bound(q) == lower_bound(arr, q)
+        dup_arr = sorted(rng.randrange(20) for _ in range(n))
+        dup_index = SortedIndex(dup_arr)
+        for lo in range(-1, 22):
+            assert dup_index.find(lo) == binary_search(dup_arr, lo)
+            assert dup_index.lower_bound(lo) == lower_bound(dup_arr, lo)
+            assert dup_index.range(lo, lo + 3) == range(lower_bound(dup_arr, lo),
+                                                       max(lower_bound(dup_arr, lo), lower_bound(dup_arr, lo + 3)))
+    print("binary_search karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 12: SortedIndex oluşturma ve sorgu süreleri
+    print(f"\nTest 12: SortedIndex Performansı")
+    print(f"{'Boyut':>10} {'Oluşturma':>12} {'binary_search':>14} {'find':>10}")
+    for size, build_ms, search_ns, find_ns in benchmark_sorted_index(sizes=(10**3, 10**5), queries=2000):
+        print(f"{size:>10} {build_ms:>10.2f}ms {search_ns:>12.0f}ns {find_ns:>8.0f}ns")
+    
+    # Test 13: Uyarlanabilir arama
+    print(f"\nTest 13: Uyarlanabilir Arama (adaptive_search)")
+    for target_13 in [0, 500, 998, 501]:
+        index_13, probes_13 = adaptive_search_with_count(test_array_5, target_13)
+        print(f"Aranan: {target_13} -> Index {index_13}, {probes_13} yoklama "
+              f"(binary_search: {binary_search_with_count(test_array_5, target_13)[1]} yoklama)")
+    
+    # Sonuçlar tekrar eden elemanlar ve düzgün olmayan dağılımlarda da binary_search ile aynı olmalı
+    arrays_13 = [test_array_5, test_array_6, [1.5, 2.25, 2.25, 7.0] * 5, [0.5 * i for i in range(300)],
+                 [i * i for i in range(200)], list(range(99)) + [10 ** 9], [7] * 40,
+                 sorted(rng.randrange(50) for _ in range(300)), ["a", "b", "c"] * 6]
+    arrays_13[2].sort()
+    arrays_13[-1].sort()
+    for n in range(0, 80):
+        arrays_13.append(sorted(rng.sample(range(10 * n + 1), n)))
+    for arr in arrays_13:
+        queries = sorted(set(arr)) if isinstance(arr[0] if arr else 0, str) else \
+            sorted(set(arr)) + [min(arr, default=0) - 1, max(arr, default=0) + 1, 3, 3.5, 17, 1000]
+        for q in queries:
+            assert adaptive_search(arr, q) == binary_search(arr, q), (arr, q)
+    assert adaptive_search(range(0, 2 * 10**8, 2), 123456788) == 61728394
+    # NaN ve sonsuz hedefler interpolasyona girmez, ikiye bölmeye düşer
+    for q in [float("nan"), float("inf"), float("-inf")]:
+        assert adaptive_search(list(range(0, 2000, 2)), q) == binary_search(list(range(0, 2000, 2)), q) == -1
+    assert adaptive_search([float("-inf")] + [float(i) for i in range(30)], 5.0) == 6
+    # Değer aralığı float'a sığmayan diziler (fark veya çarpım sonsuza taşar)
+    extreme = sorted([-1e308, -1e300, 0.0, 1e300, 1e308] + [float(i) for i in range(20)])
+    huge = [float(i) for i in range(30)] + [1e308, 1.5e308, 1.7e308]
+    for arr, q in [(extreme, 5.0), (extreme, 1e300), (extreme, 2.5), (huge, 1.5e308), (huge, 7.0), (huge, 1.6e308)]:
+        assert adaptive_search(arr, q) == binary_search(arr, q), (arr, q)
+    assert adaptive_search(extreme, 5.0) == 8
+    print("binary_search karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 14: Uyarlanabilir arama performansı
+    print(f"\nTest 14: Uyarlanabilir Arama Performansı (10^4 eleman, ortalama yoklama ve süre)")
+    print(f"{'Dağılım':>12} {'binary':>8} {'adaptive':>9} {'binary':>10} {'adaptive':>10}")
+    for name, b_probes, a_probes, b_ns, a_ns in benchmark_adaptive_search(size=10**4, queries=2000):
+        print(f"{name:>12} {b_probes:>8.1f} {a_probes:>9.1f} {b_ns:>8.0f}ns {a_ns:>8.0f}ns")
+    
     print("\n" + "=" * 60)
 
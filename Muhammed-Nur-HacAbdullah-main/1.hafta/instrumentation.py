@@ -0,0 +1,443 @@
+"""
+İŞLEM SAYACI (INSTRUMENTATION)
+
+Açıklama:
+Arama, toplama ve matris çarpımı fonksiyonlarının yaptığı işi ölçer:
+- Karşılaştırma sayısı: Aranan değer (target), her karşılaştırmada sayacı
+  artıran bir vekil (proxy) nesneye sarılır
+- Recursion derinliği: Fonksiyonlar kendilerini modül üzerinden çağırdığı
+  için recursive çağrılar da sarmalayıcıdan geçer
+- Çarpma-toplama sayısı: Klasik çarpım kernel'lerinde m × n × p;
+  Strassen-Winograd'da temel algoritmaya inen alt çarpımların toplamı
+- Süre: Her dıştaki çağrı için perf_counter_ns
+
+Sayaç yalnızca "with instrument():" bloğu içinde etkindir: blok girişinde
+modüllerdeki fonksiyonlar sayan sarmalayıcılarla değiştirilir, çıkışta
+orijinalleri geri konur. Blok dışında hiçbir ek kod çalışmaz, bu yüzden
+kapalıyken ek yük sıfırdır (benchmark.py bunu ölçer).
+
+Not: Sarmalama modül özniteliği üzerinden yapılır; "from binary_search
+import binary_search" ile önceden alınmış referanslar sayılmaz, çağrılar
+binary_search.binary_search(...) şeklinde yapılmalıdır. Sayaçlar
+thread-safe değildir.
+
+Kullanım:
+    import binary_search
+    from instrumentation import instrument
+    
+    with instrument() as stats:
+        binary_search.binary_search(list(range(100)), 42)
+    print(stats.report())
+"""
+
+import functools
+import importlib
+import time
+from contextlib import contextmanager
+
+# modül -> {fonksiyon adı: tür}
+# "search": 2. argüman aranan değerdir, karşılaştırmalar sayılır
+# "matmul": ilk iki argüman matristir, m × n × p çarpma-toplama sayılır
+# "composite": işi "matmul" fonksiyonlarına yaptırır; çarpma-toplama sayısı
+#              çağrı sırasında bu alt çarpımlarda sayılanların toplamıdır
+# "plain": yalnızca çağrı, derinlik ve süre
+INSTRUMENTED_FUNCTIONS = {
+    "binary_search": {
+        "binary_search": "search",
+        "binary_search_recursive": "search",
+        "binary_search_iterative": "search",
+        "lower_bound": "search",
+        "upper_bound": "search",
+        "binary_search_many": "plain",
+    },
+    "linear_search": {
+        "linear_search_iterative": "search",
+        "linear_search_recursive": "search",
+        "linear_search_all_occurrences": "search",
+        "linear_search_with_count": "search",
+        "linear_search_multi": "plain",
+    },
+    "array_sum": {
+        "array_sum_iterative": "plain",
+        "array_sum_recursive": "plain",
+        "array_sum_recursive_v2": "plain",
+        "array_sum_divide_and_conquer": "plain",
+        "_array_sum_halves": "plain",
+        "fast_sum": "plain",
+    },
+    "matrix_multiplication": {
+        "matrix_multiply": "matmul",
+        "matrix_multiply_optimized": "matmul",
+        "matrix_multiply_tiled": "matmul",
+        "matrix_multiply_strassen": "composite",
+        "matrix_multiply_parallel": "matmul",
+        "_strassen_winograd": "plain",
+    },
+}
+
+
+class CountingValue:
+    """
+    Karşılaştırıldıkça ortak bir sayacı artıran vekil değer
+    
+    Hem "değer == target" hem "target == değer" biçimleri sayılır: int/float
+    bilinmeyen bir tiple karşılaştırıldığında NotImplemented döner ve Python
+    ters işlemi (örn. __gt__ yerine __lt__) bu nesnede çağırır.
+    """
+    
+    __slots__ = ("value", "counter")
+    
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+    
+    def __eq__(self, other):
+        self.counter[0] += 1
+        return self.value == _unwrap(other)
+    
+    def __ne__(self, other):
+        self.counter[0] += 1
+        return self.value != _unwrap(other)
+    
+    def __lt__(self, other):
+        self.counter[0] += 1
+        return self.value < _unwrap(other)
+    
+    def __le__(self, other):
+        self.counter[0] += 1
+        return self.value <= _unwrap(other)
+    
+    def __gt__(self, other):
+        self.counter[0] += 1
+        return self.value > _unwrap(other)
+    
+    def __ge__(self, other):
+        self.counter[0] += 1
+        return self.value >= _unwrap(other)
+    
+    def __hash__(self):
+        return hash(self.value)
+    
+    def __repr__(self):
+        return f"CountingValue({self.value!r})"
+
+
+def _unwrap(value):
+    return value.value if isinstance(value, CountingValue) else value
+
+
+def _bucket(value):
+    """Histogram kovası: value'dan küçük veya eşit en büyük 2'nin kuvveti (0 için 0)"""
+    return 1 << (int(value).bit_length() - 1) if value >= 1 else 0
+
+
+class InstrumentationStats:
+    """
+    Fonksiyon başına sayaçlar ve histogramlar
+    """
+    
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._kernel_work = 0    # en dıştaki "matmul" çağrılarının toplam işi
+        self._kernel_depth = 0   # şu an çalışan "matmul" çağrısı sayısı
+    
+    def record(self, name, elapsed_ns, comparisons=0, depth=1, multiply_adds=0, calls=1):
+        """
+        Bir dıştaki çağrının ölçümlerini ekler
+        
+        Args:
+            name: Fonksiyon adı (modül.fonksiyon)
+            elapsed_ns: Süre (nanosaniye)
+            comparisons: Karşılaştırma sayısı
+            depth: Ulaşılan en büyük recursion derinliği
+            multiply_adds: Çarpma-toplama sayısı
+            calls: Recursive çağrılar dahil toplam çağrı sayısı
+        """
+        counters = self._counters.setdefault(name, {
+            "calls": 0, "total_calls": 0, "comparisons": 0, "max_depth": 0,
+            "multiply_adds": 0, "total_ns": 0,
+        })
+        counters["calls"] += 1
+        counters["total_calls"] += calls
+        counters["comparisons"] += comparisons
+        counters["max_depth"] = max(counters["max_depth"], depth)
+        counters["multiply_adds"] += multiply_adds
+        counters["total_ns"] += elapsed_ns
+        
+        histograms = self._histograms.setdefault(name, {"elapsed_ns": {}, "comparisons": {}, "depth": {}})
+        for metric, value in (("elapsed_ns", elapsed_ns), ("comparisons", comparisons), ("depth", depth)):
+            bucket = _bucket(value)
+            histograms[metric][bucket] = histograms[metric].get(bucket, 0) + 1
+    
+    def counters(self, name=None):
+        """
+        Toplam sayaçlar
+        
+        Args:
+            name: Yalnızca bu fonksiyonun sayaçları (None: hepsi)
+        
+        Returns:
+            dict: calls (dıştaki çağrılar), total_calls (recursive dahil),
+                  comparisons, max_depth, multiply_adds, total_ns
+        """
+        if name is not None:
+            return dict(self._counters.get(name, {}))
+        return {key: dict(value) for key, value in self._counters.items()}
+    
+    def histograms(self, name=None):
+        """
+        Çağrı başına değerlerin histogramları (2'nin kuvvetleri kovalarında)
+        
+        Args:
+            name: Yalnızca bu fonksiyonun histogramları (None: hepsi)
+        
+        Returns:
+            dict: {metrik: {kova alt sınırı: çağrı sayısı}} - metrikler:
+                  elapsed_ns, comparisons, depth
+        """
+        def sorted_copy(histograms):
+            return {metric: dict(sorted(buckets.items())) for metric, buckets in histograms.items()}
+        
+        if name is not None:
+            return sorted_copy(self._histograms.get(name, {}))
+        return {key: sorted_copy(value) for key, value in self._histograms.items()}
+    
+    def to_dict(self):
+        """JSON'a yazılabilir biçim: {"counters": ..., "histograms": ...}"""
+        return {"counters": self.counters(), "histograms": self.histograms()}
+    
+    def reset(self):
+        """Tüm sayaçları sıfırlar"""
+        self._counters.clear()
+        self._histograms.clear()
+        self._kernel_work = 0
+    
+    def report(self):
+        """
+        Sayaçları tablo olarak döndürür
+        
+        Returns:
+            str: Fonksiyon başına çağrı, karşılaştırma, derinlik, çarpma-toplama ve süre
+        """
+        lines = [f"{'Fonksiyon':<48} {'Çağrı':>7} {'Karşılaştırma':>14} {'Derinlik':>9} "
+                 f"{'Çarpma-Toplama':>15} {'Süre (ms)':>10}"]
+        for name, c in sorted(self._counters.items()):
+            lines.append(f"{name:<48} {c['calls']:>7} {c['comparisons']:>14} {c['max_depth']:>9} "
+                         f"{c['multiply_adds']:>15} {c['total_ns'] / 1e6:>10.3f}")
+        return "\n".join(lines)
+
+
+def _matrix_work(A, B):
+    """Klasik çarpımın çarpma-toplama sayısı (m × n × p), boyutlar okunamazsa 0"""
+    try:
+        return len(A) * len(A[0]) * len(B[0])
+    except (TypeError, IndexError):
+        return 0
+
+
+def instrumented(func, stats, name=None, kind="plain"):
+    """
+    Bir fonksiyonu sayan bir sarmalayıcıyla sarar (dekoratör olarak da kullanılabilir)
+    
+    Args:
+        func: Sarılacak fonksiyon
+        stats: Ölçümlerin yazılacağı InstrumentationStats
+        name: Sayaç adı (varsayılan: modül.fonksiyon)
+        kind: "search", "matmul", "composite" veya "plain" (bkz. INSTRUMENTED_FUNCTIONS)
+    
+    Returns:
+        function: Sarmalayıcı (orijinali __wrapped__ özniteliğindedir)
+    """
+    name = name or f"{func.__module__}.{func.__name__}"
+    state = {"depth": 0, "max_depth": 0, "calls": 0, "counter": [0], "base": 0,
+             "top_kernel": False, "work_base": 0}
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outermost = state["depth"] == 0
+        if outermost:
+            state["max_depth"] = 0
+            state["calls"] = 0
+            if kind == "search" and len(args) > 1:
+                # Başka bir sarmalayıcı değeri zaten sardıysa onun sayacı paylaşılır
+                if not isinstance(args[1], CountingValue):
+                    args = (args[0], CountingValue(args[1], [0])) + args[2:]
+                state["counter"] = args[1].counter
+            else:
+                state["counter"] = [0]
+            state["base"] = state["counter"][0]
+            if kind == "matmul":
+                # İç içe kernel'lerde (ör. backend="tiled") iş yalnızca bir kez sayılır
+                state["top_kernel"] = stats._kernel_depth == 0
+                stats._kernel_depth += 1
+            elif kind == "composite":
+                state["work_base"] = stats._kernel_work
+        
+        state["depth"] += 1
+        state["calls"] += 1
+        state["max_depth"] = max(state["max_depth"], state["depth"])
+        start = time.perf_counter_ns() if outermost else 0
+        try:
+            return func(*args, **kwargs)
+        finally:
+            state["depth"] -= 1
+            if outermost:
+                elapsed = time.perf_counter_ns() - start
+                multiply_adds = 0
+                if kind == "matmul":
+                    multiply_adds = _matrix_work(args[0], args[1]) if len(args) > 1 else 0
+                    stats._kernel_depth -= 1
+                    if state["top_kernel"]:
+                        stats._kernel_work += multiply_adds
+                elif kind == "composite":
+                    multiply_adds = stats._kernel_work - state["work_base"]
+                stats.record(name, elapsed, state["counter"][0] - state["base"], state["max_depth"], multiply_adds,
+                             state["calls"])
+    
+    return wrapper
+
+
+@contextmanager
+def instrument(modules=None, stats=None):
+    """
+    Blok süresince modül fonksiyonlarını sayan sarmalayıcılarla değiştirir
+    
+    Args:
+        modules: Sarılacak modül adları (varsayılan: INSTRUMENTED_FUNCTIONS'taki tümü)
+        stats: Ölçümlerin ekleneceği InstrumentationStats (varsayılan: yeni)
+    
+    Yields:
+        InstrumentationStats: Blok içindeki çağrıların ölçümleri
+    
+    Raises:
+        ValueError: Bilinmeyen bir modül adı verilirse
+    """
+    stats = stats if stats is not None else InstrumentationStats()
+    names = list(INSTRUMENTED_FUNCTIONS) if modules is None else list(modules)
+    unknown = [module_name for module_name in names if module_name not in INSTRUMENTED_FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen modül: {', '.join(unknown)} "
+                         f"(seçenekler: {', '.join(INSTRUMENTED_FUNCTIONS)})")
+    
+    originals = []
+    try:
+        for module_name in names:
+            module = importlib.import_module(module_name)
+            for function_name, kind in INSTRUMENTED_FUNCTIONS[module_name].items():
+                original = getattr(module, function_name)
+                originals.append((module, function_name, original))
+                setattr(module, function_name,
+                        instrumented(original, stats, f"{module_name}.{function_name}", kind))
+        yield stats
+    finally:
+        for module, function_name, original in reversed(originals):
+            setattr(module, function_name, original)
+
+
+# Test Senaryoları
+if __name__ == "__main__":
+    import json
+    import array_sum
+    import binary_search
+    import linear_search
+    import matrix_multiplication
+    
+    print("=" * 60)
+    print("İŞLEM SAYACI TEST SENARYOLARI")
+    print("=" * 60)
+    
+    originals = {name: getattr(binary_search, name) for name in INSTRUMENTED_FUNCTIONS["binary_search"]}
+    
+    # Test 1: İkili arama karşılaştırma sayısı ve recursion derinliği
+    print("\nTest 1: İkili Arama")
+    arr1 = list(range(0, 1000, 2))
+    with instrument(["binary_search"]) as stats:
+        assert binary_search.binary_search(arr1, 998) == 499
+        assert binary_search.binary_search_iterative(arr1, 998) == 499
+        assert binary_search.binary_search(arr1, 7) == -1
+    recursive = stats.counters("binary_search.binary_search")
+    iterative = stats.counters("binary_search.binary_search_iterative")
+    print(f"binary_search: {recursive['calls']} çağrı, {recursive['comparisons']} karşılaştırma, "
+          f"en büyük derinlik {recursive['max_depth']}")
+    print(f"binary_search_iterative: {iterative['comparisons']} karşılaştırma, derinlik {iterative['max_depth']}")
+    # 500 elemanda en fazla ⌈log2(501)⌉ = 9 yoklama, yoklama başına en fazla 2 karşılaştırma
+    assert iterative["comparisons"] <= 2 * 9 and iterative["max_depth"] == 1
+    # Bulunamayan değerde son çağrı boş aralığı (left > right) görür
+    assert stats.counters("binary_search.binary_search_recursive")["max_depth"] == 10
+    assert stats.counters("binary_search.binary_search_recursive")["comparisons"] == recursive["comparisons"]
+    
+    # Test 2: Lineer arama - linear_search_with_count ile aynı adım sayısı
+    print("\nTest 2: Lineer Arama")
+    arr2 = [5, 3, 8, 1, 9, 2]
+    with instrument(["linear_search"]) as stats:
+        index, steps = linear_search.linear_search_with_count(arr2, 9)
+        linear_search.linear_search_recursive(arr2, 9)
+    counted = stats.counters("linear_search.linear_search_with_count")["comparisons"]
+    print(f"linear_search_with_count: {steps} adım, sayılan karşılaştırma: {counted}")
+    assert counted == steps == 5
+    assert stats.counters("linear_search.linear_search_recursive")["max_depth"] == 5
+    
+    # Test 3: Toplama - recursion derinliği
+    print("\nTest 3: Toplama")
+    arr3 = list(range(1, 101))
+    big = list(range(10 ** 5))
+    with instrument(["array_sum"]) as stats:
+        assert array_sum.array_sum_recursive(arr3) == 5050
+        assert array_sum.array_sum_divide_and_conquer(big) == sum(big)
+    print(f"array_sum_recursive derinlik: {stats.counters('array_sum.array_sum_recursive')['max_depth']}")
+    halves = stats.counters("array_sum._array_sum_halves")
+    print(f"_array_sum_halves: {halves['total_calls']} çağrı, derinlik {halves['max_depth']}")
+    assert stats.counters("array_sum.array_sum_recursive")["max_depth"] == 101
+    assert halves["max_depth"] == 8   # 10^5 / 2^7 < LEAF_SIZE
+    
+    # Test 4: Matris çarpımı - çarpma-toplama sayısı
+    print("\nTest 4: Matris Çarpımı")
+    A4 = [[1, 2, 3], [4, 5, 6]]
+    B4 = [[7, 8], [9, 10], [11, 12]]
+    with instrument(["matrix_multiplication"]) as stats:
+        C4 = matrix_multiplication.matrix_multiply(A4, B4)
+        matrix_multiplication.matrix_multiply(A4, B4, backend="tiled")
+    counters = stats.counters("matrix_multiplication.matrix_multiply")
+    print(f"matrix_multiply: {counters['calls']} çağrı, {counters['multiply_adds']} çarpma-toplama")
+    assert C4 == [[58, 64], [139, 154]] and counters["multiply_adds"] == 2 * 12
+    assert stats.counters("matrix_multiplication.matrix_multiply_tiled")["multiply_adds"] == 12
+    
+    # Strassen-Winograd: 4×4, crossover=2 -> 7 adet 2×2 temel çarpım (m × n × p = 64 değil)
+    A4s = [[i + j for j in range(4)] for i in range(4)]
+    with instrument(["matrix_multiplication"]) as stats:
+        matrix_multiplication.matrix_multiply_strassen(A4s, A4s, crossover=2)
+    strassen = stats.counters("matrix_multiplication.matrix_multiply_strassen")["multiply_adds"]
+    print(f"matrix_multiply_strassen (4×4, crossover=2): {strassen} çarpma-toplama (klasik: 64)")
+    assert strassen == 7 * 2 ** 3
+    
+    # Test 5: Blok dışında orijinal fonksiyonlar geri konur
+    print("\nTest 5: Kapalıyken Ek Yük Yok")
+    assert all(getattr(binary_search, name) is original for name, original in originals.items())
+    try:
+        with instrument(["binary_search"]):
+            raise RuntimeError("blok içinde hata")
+    except RuntimeError:
+        pass
+    assert all(getattr(binary_search, name) is original for name, original in originals.items())
+    print("Blok dışında (hata olsa bile) tüm fonksiyonlar orijinal nesneler")
+    try:
+        with instrument(["bubble_sort"]):
+            pass
+    except ValueError as e:
+        print(f"Hata: {e}")
+    
+    # Test 6: Sayaç ve histogram çıktısı
+    print("\nTest 6: Sayaç ve Histogram Çıktısı")
+    with instrument() as stats:
+        for target in range(0, 1000, 7):
+            binary_search.binary_search_iterative(arr1, target)
+        array_sum.fast_sum(big)
+        matrix_multiplication.matrix_multiply(A4, B4)
+    print(stats.report())
+    histogram = stats.histograms("binary_search.binary_search_iterative")["comparisons"]
+    print(f"binary_search_iterative karşılaştırma histogramı: {histogram}")
+    assert sum(histogram.values()) == len(range(0, 1000, 7))
+    json.dumps(stats.to_dict())
+    
+    print("\n" + "=" * 60)
@@ -15,6 +15,145 @@ Alan Karmaşıklığı:
 - Recursive: O(n) - Stack kullanımı
 """
 
+import os
+from array import array, typecodes
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress, count, repeat
+from operator import eq
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isteğe bağlıdır, yoksa array/memoryview yolu kullanılır
+    np = None
+
+# Büyük sayısal tamponlar parçalar halinde taranır
+CHUNK_SIZE = 1 << 20
+# Bu boyutun üzerindeki NumPy dizilerinde parçalar iş parçacığı havuzunda taranır
+PARALLEL_THRESHOLD = 4 * CHUNK_SIZE
+PARALLEL_WORKERS = os.cpu_count() or 1
+
+
+def _is_numeric_buffer(arr):
+    """array.array, tek boyutlu memoryview veya tek boyutlu NumPy dizisi mi?"""
+    if isinstance(arr, array):
+        return True
+    if isinstance(arr, memoryview):
+        return arr.ndim == 1
+    return np is not None and isinstance(arr, np.ndarray) and arr.ndim == 1
+
+
+def _memoryview_chunk(view, start, stop):
+    """memoryview parçasını index() ile C içinde taranabilen bir diziye çevirir"""
+    chunk = view[start:stop]
+    if chunk.format in typecodes and chunk.c_contiguous:
+        # Baytlar tek bir kopyayla array'e aktarılır, eleman eleman kutulanmaz
+        converted = array(chunk.format)
+        converted.frombytes(chunk.cast("B"))
+        return converted
+    return chunk.tolist()
+
+
+def _chunk_find_first(arr, target, start, stop):
+    """[start, stop) aralığındaki ilk eşleşmenin index'i (yoksa -1)"""
+    if isinstance(arr, memoryview):
+        arr = _memoryview_chunk(arr, start, stop)
+        offset, start, stop = start, 0, stop - start
+    elif isinstance(arr, array):
+        offset = 0
+    else:
+        hits = np.flatnonzero(arr[start:stop] == target)
+        return start + int(hits[0]) if len(hits) else -1
+    
+    # index() döngüyü C içinde çalıştırır
+    try:
+        return offset + arr.index(target, start, stop)
+    except ValueError:
+        return -1
+
+
+def _chunk_find_all(arr, target, start, stop):
+    """[start, stop) aralığındaki tüm eşleşmelerin index'leri"""
+    if isinstance(arr, memoryview):
+        arr = _memoryview_chunk(arr, start, stop)
+        offset, start, stop = start, 0, stop - start
+    elif isinstance(arr, array):
+        offset = 0
+    else:
+        return (np.flatnonzero(arr[start:stop] == target) + start).tolist()
+    
+    indices = []
+    i = start
+    while True:
+        try:
+            i = arr.index(target, i, stop)
+        except ValueError:
+            return indices
+        indices.append(offset + i)
+        i += 1
+
+
+def _chunk_bounds(n, chunk_size):
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+def _scan_releases_gil(arr):
+    """
+    Parça taraması GIL'i bırakıyor mu?
+    
+    Yalnızca NumPy karşılaştırması (arr == target, flatnonzero) GIL'i bırakır.
+    array.index ve memoryview dönüşümü GIL'i tutar; bu türlerde iş
+    parçacıkları hızlandırma sağlamaz, parçalar sırayla taranır.
+    """
+    return np is not None and isinstance(arr, np.ndarray)
+
+
+def _buffer_find_first(arr, target, chunk_size=CHUNK_SIZE, workers=PARALLEL_WORKERS,
+                       threshold=PARALLEL_THRESHOLD):
+    """
+    Sayısal tamponda ilk eşleşmeyi parça parça arar
+    
+    threshold'un üzerindeki NumPy dizilerinde parçalar workers adetlik
+    dalgalar halinde paralel taranır; bir dalgada eşleşme bulunursa sonraki
+    dalgalara geçilmez. array.array ve memoryview her zaman sırayla taranır
+    (bkz. _scan_releases_gil).
+    """
+    bounds = _chunk_bounds(len(arr), chunk_size)
+    
+    if workers <= 1 or len(bounds) <= 1 or len(arr) < threshold or not _scan_releases_gil(arr):
+        for start, stop in bounds:
+            index = _chunk_find_first(arr, target, start, stop)
+            if index != -1:
+                return index
+        return -1
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wave in range(0, len(bounds), workers):
+            # map sonuçları sırayla döndürür, ilk eşleşme en küçük index'tir
+            for index in pool.map(lambda b: _chunk_find_first(arr, target, *b),
+                                  bounds[wave:wave + workers]):
+                if index != -1:
+                    return index
+    return -1
+
+
+def _buffer_find_all(arr, target, chunk_size=CHUNK_SIZE, workers=PARALLEL_WORKERS,
+                     threshold=PARALLEL_THRESHOLD):
+    """Sayısal tamponda tüm eşleşmeleri parça parça arar (NumPy dizilerinde gerekirse paralel)"""
+    bounds = _chunk_bounds(len(arr), chunk_size)
+    
+    if workers <= 1 or len(bounds) <= 1 or len(arr) < threshold or not _scan_releases_gil(arr):
+        parts = [_chunk_find_all(arr, target, start, stop) for start, stop in bounds]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(lambda b: _chunk_find_all(arr, target, *b), bounds))
+    
+    indices = []
+    for part in parts:
+        indices.extend(part)
+    return indices
+
+
 def linear_search_iterative(arr, target):
     """
     İterative (döngü kullanarak) lineer arama
@@ -25,7 +164,12 @@ def linear_search_iterative(arr, target):
     
     Returns:
         int: Elemanın index'i (bulunamazsa -1)
+    
+    Not: array.array, memoryview ve NumPy dizileri vektörel olarak taranır.
     """
+    if _is_numeric_buffer(arr):
+        return _buffer_find_first(arr, target)
+    
     for i in range(len(arr)):
         if arr[i] == target:
             return i
@@ -66,7 +210,12 @@ def linear_search_all_occurrences(arr, target):
     
     Returns:
         list: Elemanın bulunduğu tüm index'ler
+    
+    Not: array.array, memoryview ve NumPy dizileri vektörel olarak taranır.
     """
+    if _is_numeric_buffer(arr):
+        return _buffer_find_all(arr, target)
+    
     indices = []
     for i in range(len(arr)):
         if arr[i] == target:
@@ -84,13 +233,325 @@ def linear_search_with_count(arr, target):
     
     Returns:
         tuple: (index, adım sayısı)
+    
+    Not: array.array, memoryview ve NumPy dizileri vektörel olarak taranır.
     """
+    if _is_numeric_buffer(arr):
+        index = _buffer_find_first(arr, target)
+        return (index, index + 1) if index != -1 else (-1, len(arr))
+    
     for i in range(len(arr)):
         if arr[i] == target:
             return (i, i + 1)
     return (-1, len(arr))
 
 
+def linear_search_stream(iterable, target):
+    """
+    Herhangi bir iterable üzerinde tüm eşleşmelerin index'lerini tembel (lazy) üretir
+    
+    Liste oluşturulmaz ve len() / arr[i] kullanılmaz; elemanlar geldikçe
+    karşılaştırılır, bu yüzden bellek kullanımı giriş boyutundan bağımsızdır.
+    
+    Args:
+        iterable: Herhangi bir iterable (liste, generator, dosya vb.)
+        target: Aranan değer
+    
+    Returns:
+        iterator: Eşleşen elemanların index'leri (artan sırada)
+    """
+    # compress/count/map döngüsü tamamen C içinde çalışır
+    return compress(count(), map(eq, iterable, repeat(target)))
+
+
+def linear_search_stream_first(iterable, target):
+    """
+    Herhangi bir iterable üzerinde ilk eşleşmeyi bulur, bulunca okumayı bırakır
+    
+    Args:
+        iterable: Herhangi bir iterable
+        target: Aranan değer
+    
+    Returns:
+        int: İlk eşleşmenin index'i (bulunamazsa -1)
+    """
+    return next(linear_search_stream(iterable, target), -1)
+
+
+def linear_search_file(path, target, encoding="utf-8"):
+    """
+    Satır satır ayrılmış bir dosyada aranan satırların numaralarını tembel üretir
+    
+    Dosya bir kerede belleğe okunmaz; satırlar tamponlu olarak sırayla
+    okunur. Satırlar bayt olarak karşılaştırılır, çözümleme (decode) yapılmaz.
+    
+    Args:
+        path: Dosya yolu
+        target: Aranan satır içeriği (satır sonu karakteri olmadan, str veya bytes)
+        encoding: target str ise kullanılacak kodlama (varsayılan utf-8)
+    
+    Yields:
+        int: Eşleşen satırların 0'dan başlayan numaraları
+    """
+    needle = target if isinstance(target, bytes) else str(target).encode(encoding)
+    # Son satırda satır sonu olmayabilir, Windows dosyalarında \r\n bulunabilir
+    candidates = {needle, needle + b"\n", needle + b"\r\n"}
+    with open(path, "rb") as file:
+        yield from compress(count(), map(candidates.__contains__, file))
+
+
+def linear_search_multi(arr, targets):
+    """
+    Birden fazla değerin tüm konumlarını dizinin tek bir taramasında bulur
+    
+    Aranan değerler bir sözlükte tutulur; her eleman için sözlükte olup
+    olmadığına O(1)'de bakılır. k değer için k ayrı tarama yerine tek tarama
+    yapılır: O(n × k) yerine O(n + k). Elemanların hashlenebilir olması gerekir.
+    
+    Args:
+        arr: Dizi veya herhangi bir iterable
+        targets: Aranan değerler
+    
+    Returns:
+        dict: Aranan değer -> bulunduğu tüm index'ler (bulunamazsa boş liste)
+    """
+    result = {target: [] for target in targets}
+    get = result.get
+    for i, value in enumerate(arr):
+        positions = get(value)
+        if positions is not None:
+            positions.append(i)
+    return result
+
+
+def linear_search_multi_stream(iterable, targets):
+    """
+    Birden fazla değeri bir akışta tek geçişte arar, eşleşmeleri tembel üretir
+    
+    Args:
+        iterable: Herhangi bir iterable
+        targets: Aranan değerler
+    
+    Yields:
+        tuple: (aranan değer, index) - akıştaki sırayla
+    """
+    wanted = {target: target for target in targets}
+    get = wanted.get
+    missing = object()
+    for i, value in enumerate(iterable):
+        target = get(value, missing)
+        if target is not missing:
+            yield (target, i)
+
+
+def benchmark_linear_search_multi(size=10**5, target_count=1000, repeat=3):
+    """
+    Her değer için linear_search_all_occurrences çağırmak ile tek geçişli
+    linear_search_multi'yi karşılaştırır
+    
+    Args:
+        size: Dizi boyutu
+        target_count: Aranan değer sayısı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Yöntem adı -> milisaniye cinsinden süre
+    """
+    import random
+    import time
+    
+    def best_time(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best * 1e3
+    
+    rng = random.Random(42)
+    arr = [rng.randrange(10 * target_count) for _ in range(size)]
+    targets = rng.sample(range(10 * target_count), target_count)
+    
+    return {
+        "linear_search_all_occurrences döngüsü": best_time(
+            lambda: {t: linear_search_all_occurrences(arr, t) for t in targets}),
+        "linear_search_multi": best_time(lambda: linear_search_multi(arr, targets)),
+    }
+
+
+def benchmark_linear_search_file(size_mb=50, path=None):
+    """
+    linear_search_file'ın sentetik bir dosya üzerindeki işlem hızını (MB/s) ölçer
+    
+    Args:
+        size_mb: Oluşturulacak dosyanın yaklaşık boyutu (MB)
+        path: Dosya yolu (varsayılan: geçici dosya, ölçümden sonra silinir)
+    
+    Returns:
+        tuple: (dosya boyutu bayt, eşleşme sayısı, MB/s)
+    """
+    import tempfile
+    import time
+    
+    temporary = path is None
+    if temporary:
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        os.close(handle)
+    
+    try:
+        line_block = "".join(f"{i}\n" for i in range(100000)).encode()
+        with open(path, "wb") as file:
+            for _ in range(max(1, size_mb * 2**20 // len(line_block))):
+                file.write(line_block)
+        size = os.path.getsize(path)
+        
+        start = time.perf_counter()
+        matches = sum(1 for _ in linear_search_file(path, "4242"))
+        elapsed = time.perf_counter() - start
+    finally:
+        if temporary:
+            os.remove(path)
+    
+    return (size, matches, size / 2**20 / elapsed)
+
+
+class LinearSearchIndex:
+    """
+    Aynı sırasız dizide tekrar tekrar arama yapmak için hash indeksi
+    
+    Dizi bir kez taranarak her değer için geçtiği index'lerin (artan sırada)
+    listesi bir sözlükte tutulur. Sonraki aramalar diziyi baştan taramaz.
+    Değerlerin hashlenebilir olması gerekir.
+    
+    Zaman Karmaşıklığı:
+    - Oluşturma: O(n)
+    - find: O(1)
+    - find_all: O(k) - k: bulunan konum sayısı (listenin kopyası)
+    - append: O(1)
+    - update: O(k) - eski ve yeni değerin konum listeleri güncellenir
+    """
+    
+    def __init__(self, arr=()):
+        """
+        Args:
+            arr: Dizi (sıralı olmak zorunda değil)
+        """
+        self._values = []
+        self._positions = {}
+        self.extend(arr)
+    
+    def __len__(self):
+        return len(self._values)
+    
+    def __contains__(self, target):
+        return target in self._positions
+    
+    def find(self, target):
+        """
+        Elemanın ilk bulunduğu index'i döndürür (linear_search_iterative ile aynı)
+        
+        Args:
+            target: Aranan değer
+        
+        Returns:
+            int: Elemanın index'i (bulunamazsa -1)
+        """
+        positions = self._positions.get(target)
+        return positions[0] if positions else -1
+    
+    def find_all(self, target):
+        """
+        Elemanın tüm konumlarını döndürür (linear_search_all_occurrences ile aynı)
+        
+        Args:
+            target: Aranan değer
+        
+        Returns:
+            list: Elemanın bulunduğu tüm index'ler
+        """
+        return list(self._positions.get(target, ()))
+    
+    def append(self, value):
+        """
+        Dizinin sonuna eleman ekler, indeks yeniden oluşturulmaz
+        
+        Args:
+            value: Eklenecek değer
+        """
+        self._positions.setdefault(value, []).append(len(self._values))
+        self._values.append(value)
+    
+    def extend(self, values):
+        """
+        Dizinin sonuna birden fazla eleman ekler
+        
+        Args:
+            values: Eklenecek değerler
+        """
+        for value in values:
+            self.append(value)
+    
+    def update(self, index, value):
+        """
+        Verilen konumdaki elemanı değiştirir, indeks yeniden oluşturulmaz
+        
+        Args:
+            index: Değiştirilecek konum (negatif index desteklenir)
+            value: Yeni değer
+        
+        Raises:
+            IndexError: index dizinin dışındaysa
+        """
+        old = self._values[index]
+        if index < 0:
+            index += len(self._values)
+        
+        positions = self._positions[old]
+        del positions[bisect_left(positions, index)]
+        if not positions:
+            del self._positions[old]
+        
+        insort(self._positions.setdefault(value, []), index)
+        self._values[index] = value
+
+
+def benchmark_linear_search(size=10**6, repeat=3):
+    """
+    Liste üzerindeki döngü ile sayısal tampon yolunu karşılaştırır
+    
+    Aranan değer dizide olmadığı için her yöntem tüm diziyi tarar (en kötü durum).
+    array.array ve memoryview tek iş parçacığında taranır; PARALLEL_THRESHOLD'u
+    aşan boyutlarda yalnızca numpy.ndarray parçaları paralel taranır.
+    
+    Args:
+        size: Dizi boyutu
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        dict: Giriş türü -> milisaniye cinsinden süre
+    """
+    import time
+    
+    def best_time(arr):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            linear_search_iterative(arr, -1)
+            best = min(best, time.perf_counter() - start)
+        return best * 1e3
+    
+    values = list(range(size))
+    buffer = array("q", values)
+    results = {
+        "list": best_time(values),
+        "array.array": best_time(buffer),
+        "memoryview": best_time(memoryview(buffer)),
+    }
+    if np is not None:
+        results["numpy.ndarray"] = best_time(np.asarray(buffer))
+    return results
+
+
 # Test Senaryoları
 if __name__ == "__main__":
     print("=" * 60)
@@ -153,5 +614,120 @@ if __name__ == "__main__":
     print(f"Aranan: '{target_6}'")
     print(f"Sonuç: Index {result_6}")
     
+    # Test 7: Tekrarlı aramalar için hash indeksi
+    test_array_7 = [5, 3, 5, 9, 1, 5, 3]
+    index_7 = LinearSearchIndex(test_array_7)
+    print(f"\nTest 7: Hash İndeksi (LinearSearchIndex)")
+    print(f"Dizi: {test_array_7}")
+    print(f"find(5): {index_7.find(5)}, find_all(5): {index_7.find_all(5)}, find(4): {index_7.find(4)}")
+    index_7.append(4)
+    index_7.update(0, 3)
+    print(f"append(4) ve update(0, 3) sonrası -> find(4): {index_7.find(4)}, "
+          f"find_all(5): {index_7.find_all(5)}, find_all(3): {index_7.find_all(3)}")
+    
+    # İndeks, her güncellemeden sonra mevcut fonksiyonlarla aynı sonucu vermeli
+    import random
+    rng = random.Random(42)
+    arr = [rng.randrange(10) for _ in range(50)]
+    index = LinearSearchIndex(arr)
+    for step in range(200):
+        if step % 3 == 0:
+            value = rng.randrange(12)
+            arr.append(value)
+            index.append(value)
+        else:
+            position = rng.randrange(-len(arr), len(arr))
+            value = rng.randrange(12)
+            arr[position] = value
+            index.update(position, value)
+        for target in range(13):
+            assert index.find(target) == linear_search_iterative(arr, target)
+            assert index.find_all(target) == linear_search_all_occurrences(arr, target)
+    print("Mevcut fonksiyonlarla karşılaştırma: Tüm sonuçlar aynı")
+    
+    # Test 8: Sayısal tamponlarda vektörel arama
+    test_array_8 = array("i", [4, 8, 15, 16, 23, 42, 15])
+    print(f"\nTest 8: Sayısal Tamponlar (array.array / memoryview)")
+    print(f"Dizi: {test_array_8.tolist()}")
+    print(f"array.array -> ilk: {linear_search_iterative(test_array_8, 15)}, "
+          f"tümü: {linear_search_all_occurrences(test_array_8, 15)}, "
+          f"adım: {linear_search_with_count(test_array_8, 15)}")
+    view_8 = memoryview(test_array_8)
+    print(f"memoryview  -> ilk: {linear_search_iterative(view_8, 42)}, "
+          f"tümü: {linear_search_all_occurrences(view_8, 42)}, "
+          f"adım: {linear_search_with_count(view_8, 99)}")
+    
+    # Küçük parça boyutlarıyla paralel yol (NumPy) ve sıralı yol da liste sonuçlarıyla aynı olmalı
+    values = [rng.randrange(20) for _ in range(500)]
+    buffers = [array("q", values), memoryview(array("q", values))]
+    if np is not None:
+        buffers.append(np.array(values))
+    for buffer in buffers:
+        for target in range(21):
+            assert linear_search_iterative(buffer, target) == linear_search_iterative(values, target)
+            assert linear_search_with_count(buffer, target) == linear_search_with_count(values, target)
+            assert linear_search_all_occurrences(buffer, target) == linear_search_all_occurrences(values, target)
+            for chunk_size, workers in [(7, 1), (7, 3), (64, 4)]:
+                assert (_buffer_find_first(buffer, target, chunk_size, workers, threshold=0)
+                        == linear_search_iterative(values, target))
+                assert (_buffer_find_all(buffer, target, chunk_size, workers, threshold=0)
+                        == linear_search_all_occurrences(values, target))
+    strided = memoryview(array("q", values))[::2]  # bitişik olmayan görünüm
+    for target in range(21):
+        assert linear_search_all_occurrences(strided, target) == linear_search_all_occurrences(values[::2], target)
+    print("Liste sonuçlarıyla karşılaştırma: Tüm sonuçlar aynı")
+    
+    # Test 9: Akış (streaming) üzerinde arama
+    def squares():
+        for i in range(10):
+            yield (i * i) % 7
+    print(f"\nTest 9: Generator Üzerinde Arama")
+    print(f"Dizi: {list(squares())}")
+    print(f"Tüm Konumlar (2): {list(linear_search_stream(squares(), 2))}")
+    print(f"İlk Bulunma (4): Index {linear_search_stream_first(squares(), 4)}")
+    
+    import itertools
+    infinite = itertools.count()  # sonsuz akış: ilk eşleşmede durmalı
+    print(f"Sonsuz akışta ilk 1000: Index {linear_search_stream_first(infinite, 1000)}")
+    for target in range(21):
+        assert list(linear_search_stream(iter(values), target)) == linear_search_all_occurrences(values, target)
+        assert linear_search_stream_first(iter(values), target) == linear_search_iterative(values, target)
+    
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "meyveler.txt")
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write("elma\narmut\r\nkiraz\nüzüm\nkiraz")
+        print(f"Dosyada 'kiraz': {list(linear_search_file(path, 'kiraz'))}, "
+              f"'armut': {list(linear_search_file(path, 'armut'))}, "
+              f"'üzüm': {list(linear_search_file(path, 'üzüm'))}")
+    
+    # Test 10: Çoklu değer arama (tek geçiş)
+    test_array_11 = [3, 7, 2, 7, 9, 7, 1, 2]
+    targets_11 = [7, 2, 5]
+    print(f"\nTest 10: Çoklu Değer Arama (Tek Geçiş)")
+    print(f"Dizi: {test_array_11}")
+    print(f"Arananlar: {targets_11}")
+    print(f"Sonuç: {linear_search_multi(test_array_11, targets_11)}")
+    print(f"Akış Sonucu: {list(linear_search_multi_stream(iter(test_array_11), targets_11))}")
+    
+    multi = linear_search_multi(values, range(25))
+    for target in range(25):
+        assert multi[target] == linear_search_all_occurrences(values, target)
+    assert sorted(linear_search_multi_stream(iter(values), range(5))) == sorted(
+        (t, i) for t in range(5) for i in linear_search_all_occurrences(values, t))
+    print("linear_search_all_occurrences karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 11: Performans testi (en kötü durum, eleman dizide yok)
+    print(f"\nTest 11: Performans Testi (10^6 eleman, tam tarama)")
+    for name, elapsed_ms in benchmark_linear_search().items():
+        print(f"{name:>15}: {elapsed_ms:8.2f} ms")
+    
+    size, matches, speed = benchmark_linear_search_file(size_mb=5)
+    print(f"Dosya tarama: {size / 2**20:.1f} MB, {matches} eşleşme, {speed:.1f} MB/s")
+    
+    for name, elapsed_ms in benchmark_linear_search_multi(size=10**4, target_count=100).items():
+        print(f"{name:>38}: {elapsed_ms:8.2f} ms")
+    
     print("\n" + "=" * 60)
 
@@ -0,0 +1,329 @@
+"""
+DÜZ TAMPONLU MATRİS (COMPACT MATRIX)
+
+Açıklama:
+Liste listesi (list of lists) ile saklanan bir matriste her eleman ayrı bir
+Python nesnesidir: eleman başına yaklaşık 8-10 kat bellek ve her erişimde
+işaretçi takibi gerekir. Matrix sınıfı tüm elemanları tek bir bitişik
+array('q') (int64) veya array('d') (double) tamponunda saklar.
+
+Eleman (i, j)'nin tampondaki konumu: offset + i × stride_satır + j × stride_sütun
+- Satır öncelikli (row-major, "C"): stride = (sütun sayısı, 1)
+- Sütun öncelikli (column-major, "F"): stride = (1, satır sayısı)
+Transpoz işlemi yalnızca boyutları ve stride'ları yer değiştirir, veri kopyalanmaz.
+
+Matrix, liste listesi gibi kullanılabilir: len(M), M[i][j], for row in M.
+Satırlar tampon üzerinde kopya oluşturmayan memoryview görünümleridir.
+
+Alan Karmaşıklığı: O(m × n) - eleman başına 8 bayt
+"""
+
+from array import array
+
+
+class Matrix:
+    """
+    Tek bir array('q') / array('d') tamponunda saklanan matris
+    """
+    
+    __slots__ = ("rows", "cols", "_data", "_offset", "_strides")
+    
+    def __init__(self, rows, cols, typecode="d", order="C"):
+        """
+        Sıfırlarla dolu bir matris oluşturur
+        
+        Args:
+            rows: Satır sayısı
+            cols: Sütun sayısı
+            typecode: "q" (int64) veya "d" (double) (varsayılan "d")
+            order: "C" (satır öncelikli) veya "F" (sütun öncelikli) (varsayılan "C")
+        
+        Raises:
+            ValueError: Tip kodu veya düzen bilinmiyorsa
+        """
+        if typecode not in ("q", "d"):
+            raise ValueError(f"Bilinmeyen tip kodu: {typecode} (seçenekler: q, d)")
+        if order not in ("C", "F"):
+            raise ValueError(f"Bilinmeyen düzen: {order} (seçenekler: C, F)")
+        
+        self.rows = rows
+        self.cols = cols
+        # Tekrarlama ile doğrudan doldurulur; ara bir bytes nesnesi oluşturulmaz
+        self._data = array(typecode, [0]) * (rows * cols)
+        self._offset = 0
+        self._strides = (cols, 1) if order == "C" else (1, rows)
+    
+    @classmethod
+    def _view(cls, data, rows, cols, offset, strides):
+        """Aynı tamponu paylaşan yeni bir görünüm oluşturur (kopya yok)"""
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix._data = data
+        matrix._offset = offset
+        matrix._strides = strides
+        return matrix
+    
+    @classmethod
+    def from_rows(cls, rows, typecode=None, order="C"):
+        """
+        Liste listesinden matris oluşturur
+        
+        Args:
+            rows: Liste listesi (veya satırları iterable olan herhangi bir matris)
+            typecode: "q" veya "d" (None: tüm elemanlar tamsayıysa "q", değilse "d")
+            order: "C" veya "F" (varsayılan "C")
+        
+        Returns:
+            Matrix: Yeni matris
+        
+        Raises:
+            ValueError: Satırların uzunlukları farklıysa
+        """
+        rows = [list(row) for row in rows]
+        m = len(rows)
+        n = len(rows[0]) if rows else 0
+        if any(len(row) != n for row in rows):
+            raise ValueError("Tüm satırlar aynı uzunlukta olmalıdır")
+        
+        if order == "C":
+            flat = [value for row in rows for value in row]
+        else:
+            flat = [row[j] for j in range(n) for row in rows]
+        if typecode is None:
+            typecode = "q" if all(type(value) is int for value in flat) else "d"
+        
+        strides = (n, 1) if order == "C" else (1, m)
+        return cls._view(array(typecode, flat), m, n, 0, strides)
+    
+    @classmethod
+    def identity(cls, n, typecode="q"):
+        """
+        n×n birim matris oluşturur (n² kutulanmış int yerine tek tampon)
+        
+        Args:
+            n: Matris boyutu
+            typecode: "q" veya "d" (varsayılan "q")
+        
+        Returns:
+            Matrix: Birim matris
+        """
+        matrix = cls(n, n, typecode)
+        one = 1 if typecode == "q" else 1.0
+        for i in range(n):
+            matrix._data[i * n + i] = one
+        return matrix
+    
+    @property
+    def shape(self):
+        """(satır sayısı, sütun sayısı)"""
+        return (self.rows, self.cols)
+    
+    @property
+    def typecode(self):
+        """Tamponun tip kodu ("q" veya "d")"""
+        return self._data.typecode
+    
+    @property
+    def order(self):
+        """Bellek düzeni: "C", "F" veya bitişik olmayan görünümler için None"""
+        if self._strides == (self.cols, 1):
+            return "C"
+        if self._strides == (1, self.rows):
+            return "F"
+        return None
+    
+    @property
+    def T(self):
+        """Transpoz - aynı tamponu paylaşan görünüm, veri kopyalanmaz"""
+        return Matrix._view(self._data, self.cols, self.rows, self._offset,
+                            (self._strides[1], self._strides[0]))
+    
+    def transpose(self):
+        """Transpoz görünümü döndürür (M.T ile aynı)"""
+        return self.T
+    
+    def row(self, i):
+        """
+        i. satırın kopya oluşturmayan görünümü
+        
+        Args:
+            i: Satır index'i (negatif index desteklenir)
+        
+        Returns:
+            memoryview: Satır elemanları (yazılabilir)
+        
+        Raises:
+            IndexError: i matrisin dışındaysa
+        """
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("Satır index'i matrisin dışında")
+        row_stride, col_stride = self._strides
+        start = self._offset + i * row_stride
+        return memoryview(self._data)[start:start + self.cols * col_stride:col_stride]
+    
+    def column(self, j):
+        """
+        j. sütunun kopya oluşturmayan görünümü
+        
+        Args:
+            j: Sütun index'i (negatif index desteklenir)
+        
+        Returns:
+            memoryview: Sütun elemanları (yazılabilir)
+        """
+        return self.T.row(j)
+    
+    def row_views(self):
+        """Tüm satırların görünümleri - liste listesi gibi hızlı M[i][j] erişimi için"""
+        return [self.row(i) for i in range(self.rows)]
+    
+    def __len__(self):
+        return self.rows
+    
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self.row(i)
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, j = key
+            return self._data[self._index(i, j)]
+        if isinstance(key, slice):
+            return [self.row(i) for i in range(*key.indices(self.rows))]
+        return self.row(key)
+    
+    def __setitem__(self, key, value):
+        if not isinstance(key, tuple):
+            raise TypeError("Eleman ataması için M[i, j] = değer kullanın")
+        i, j = key
+        self._data[self._index(i, j)] = value
+    
+    def _index(self, i, j):
+        """(i, j) elemanının tampondaki konumu"""
+        if i < 0:
+            i += self.rows
+        if j < 0:
+            j += self.cols
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Index matrisin dışında")
+        return self._offset + i * self._strides[0] + j * self._strides[1]
+    
+    def __eq__(self, other):
+        if isinstance(other, Matrix):
+            return self.shape == other.shape and self.tolist() == other.tolist()
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"Matrix({self.tolist()}, typecode={self.typecode!r})"
+    
+    def tolist(self):
+        """
+        Liste listesine çevirir
+        
+        Returns:
+            list: Liste listesi olarak matris
+        """
+        return [self.row(i).tolist() for i in range(self.rows)]
+    
+    def copy(self, order="C"):
+        """
+        Bitişik (contiguous) bir kopya oluşturur
+        
+        Args:
+            order: "C" veya "F" (varsayılan "C")
+        
+        Returns:
+            Matrix: Yeni tampona sahip matris
+        """
+        return Matrix.from_rows(self.tolist(), self.typecode, order)
+    
+    def buffer(self):
+        """
+        Satır öncelikli bitişik tampon (gerekirse kopyalanır)
+        
+        Returns:
+            array: rows × cols elemanlı array
+        """
+        if self.order == "C" and self._offset == 0 and len(self._data) == self.rows * self.cols:
+            return self._data
+        return self.copy("C")._data
+    
+    def nbytes(self):
+        """Elemanların kapladığı bayt sayısı"""
+        return self.rows * self.cols * self._data.itemsize
+
+
+# Test Senaryoları
+if __name__ == "__main__":
+    import sys
+    # matrix_multiplication "matrix" modülündeki sınıfı kullanır; isinstance
+    # kontrollerinin tutması için __main__ yerine aynı sınıf kullanılmalı
+    from matrix import Matrix
+    from matrix_multiplication import (create_identity_matrix, get_matrix_dimensions,
+                                       matrix_multiply, matrix_multiply_optimized,
+                                       matrix_multiply_parallel, matrix_multiply_strassen,
+                                       matrix_multiply_tiled, print_matrix)
+    
+    print("=" * 60)
+    print("DÜZ TAMPONLU MATRİS TEST SENARYOLARI")
+    print("=" * 60)
+    
+    # Test 1: Liste listesinden oluşturma
+    rows_1 = [[1, 2, 3],
+              [4, 5, 6]]
+    M1 = Matrix.from_rows(rows_1)
+    print("\nTest 1: Liste Listesinden Oluşturma")
+    print(f"Matris: {M1}")
+    print(f"Boyut: {M1.shape}, tip kodu: {M1.typecode}, düzen: {M1.order}")
+    print(f"M[1][2] = {M1[1][2]}, M[1, 2] = {M1[1, 2]}")
+    
+    # Test 2: Kopyasız transpoz
+    print("\nTest 2: Kopyasız Transpoz")
+    T1 = M1.T
+    print(f"Transpoz: {T1.tolist()}, düzen: {T1.order}")
+    print(f"Aynı tampon: {T1._data is M1._data}")
+    M1[0, 1] = 20
+    print(f"M[0, 1] = 20 sonrası T[1][0] = {T1[1][0]}")
+    assert T1.tolist() == [list(col) for col in zip(*M1.tolist())]
+    
+    # Test 3: Satır ve sütun öncelikli düzen
+    print("\nTest 3: Satır / Sütun Öncelikli Düzen")
+    F1 = Matrix.from_rows(rows_1, order="F")
+    print(f"F düzeni tampon: {F1._data.tolist()}, liste: {F1.tolist()}")
+    assert F1.tolist() == rows_1 and F1.T.order == "C"
+    
+    # Test 4: Mevcut fonksiyonlarla birlikte kullanım
+    print("\nTest 4: Mevcut Fonksiyonlarla Kullanım")
+    A4 = Matrix.from_rows([[1.5, 2.5], [3.5, 4.5]])
+    B4 = [[0.5, 1.5], [2.5, 3.5]]
+    print_matrix(A4, "Matris A (Matrix)")
+    print(f"Boyut: {get_matrix_dimensions(A4)}")
+    expected = matrix_multiply(A4.tolist(), B4)
+    for func in [matrix_multiply, matrix_multiply_optimized, matrix_multiply_tiled, matrix_multiply_strassen]:
+        assert func(A4, B4) == expected
+        assert func(A4, Matrix.from_rows(B4)) == expected
+        assert func(A4.tolist(), Matrix.from_rows(B4).T.T) == expected
+    assert matrix_multiply_parallel(A4, Matrix.from_rows(B4), 2) == expected
+    assert matrix_multiply(M1.T, M1) == matrix_multiply(M1.T.tolist(), M1.tolist())
+    print_matrix(matrix_multiply(A4, B4), "Sonuç (A × B)")
+    print("Liste listesi sonuçlarıyla karşılaştırma: Tüm sonuçlar aynı")
+    
+    # Test 5: Birim matris ve bellek kullanımı
+    print("\nTest 5: Birim Matris ve Bellek Kullanımı")
+    I_compact = create_identity_matrix(4, compact=True)
+    print_matrix(I_compact, "Birim Matris (Matrix)")
+    assert I_compact.tolist() == create_identity_matrix(4)
+    
+    n = 200
+    F_list = [[i * n + j + 0.5 for j in range(n)] for i in range(n)]
+    F_compact = Matrix.from_rows(F_list)
+    list_bytes = (sys.getsizeof(F_list) + sum(sys.getsizeof(row) for row in F_list)
+                  + sum(sys.getsizeof(value) for row in F_list for value in row))
+    compact_bytes = sys.getsizeof(F_compact._data)
+    print(f"{n}×{n} ondalıklı liste listesi: {list_bytes:,} bayt")
+    print(f"{n}×{n} ondalıklı Matrix: {compact_bytes:,} bayt ({list_bytes / compact_bytes:.1f} kat daha az)")
+    
+    print("\n" + "=" * 60)
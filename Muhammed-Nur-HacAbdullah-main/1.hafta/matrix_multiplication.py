@@ -17,32 +17,75 @@ Not: Klasik algoritma için O(n³) karmaşıklığı, Strassen algoritması O(n^
 Alan Karmaşıklığı: O(m × p) - Sonuç matrisi için
 """
 
-def matrix_multiply(A, B):
+import os
+import time
+from array import array
+from operator import add, sub
+
+from matrix import Matrix
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isteğe bağlıdır, yoksa saf Python backend'leri kullanılır
+    np = None
+
+# Otomatik ayar yapılmadığında kullanılan blok (tile) boyutu
+DEFAULT_BLOCK_SIZE = 64
+# tune_block_size ile ölçülen en hızlı blok boyutu (henüz ölçülmediyse None)
+_tuned_block_size = None
+
+# backend="auto" için eşikler (m × n × p çarpma sayısı)
+AUTO_PYTHON_MAX_WORK = 16 ** 3   # bu boyuta kadar dönüşüm maliyeti olmayan klasik algoritma
+BACKENDS = ("python", "tiled", "numpy", "auto")
+
+# Strassen-Winograd recursion'ının temel algoritmaya geçtiği boyut (ölçülmediyse)
+DEFAULT_STRASSEN_CROSSOVER = 64
+# tune_strassen_crossover ile ölçülen geçiş boyutu (henüz ölçülmediyse None)
+_tuned_strassen_crossover = None
+
+
+def matrix_multiply(A, B, backend="python", as_ndarray=False):
     """
     İki matrisi çarpar (klasik algoritma)
     
+    Backend'ler:
+    - "python": klasik i-j-k üçlü döngü (varsayılan)
+    - "tiled": blok tabanlı i-k-j çarpım (matrix_multiply_tiled)
+    - "numpy": NumPy/BLAS ile çarpım (NumPy kurulu olmalıdır)
+    - "auto": boyuta göre en hızlı backend seçilir; küçük matrislerde "python",
+      büyüklerde NumPy varsa "numpy", yoksa "tiled"
+    
     Args:
         A: İlk matris (m × n)
         B: İkinci matris (n × p)
+        backend: Kullanılacak backend (varsayılan "python")
+        as_ndarray: True ise sonuç ndarray olarak döner ("numpy" backend'inde
+                    kopya oluşturulmaz)
     
     Returns:
-        list: Sonuç matrisi (m × p)
+        list: Sonuç matrisi (m × p) - as_ndarray=True ise numpy.ndarray
     
     Raises:
-        ValueError: Matrisler çarpılamıyorsa
+        ValueError: Matrisler çarpılamıyorsa veya backend bilinmiyorsa
+        ImportError: NumPy gerektiren bir seçenek kullanılıp NumPy kurulu değilse
     """
-    # Matris boyutlarını al
-    if not A or not B:
-        raise ValueError("Matrisler boş olamaz")
+    # Matris boyutlarını al ve çarpma kontrolü yap
+    m, n, p = _check_dimensions(A, B)
+    A, B = _as_rows(A), _as_rows(B)
     
-    m = len(A)          # A'nın satır sayısı
-    n = len(A[0])       # A'nın sütun sayısı
-    n2 = len(B)         # B'nin satır sayısı
-    p = len(B[0])       # B'nin sütun sayısı
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen backend: {backend} (seçenekler: {', '.join(BACKENDS)})")
+    if (backend == "numpy" or as_ndarray) and np is None:
+        raise ImportError("numpy backend'i ve as_ndarray için NumPy kurulu olmalıdır")
     
-    # Çarpma kontrolü
-    if n != n2:
-        raise ValueError(f"Matrisler çarpılamaz: A({m}×{n}) × B({n2}×{p})")
+    if backend == "auto":
+        backend, A, B = _choose_backend(A, B, m, n, p)
+    if backend == "numpy":
+        C = np.asarray(A) @ np.asarray(B)   # auto seçtiyse zaten ndarray'dir, kopya yok
+        return C if as_ndarray else C.tolist()
+    if backend == "tiled":
+        C = matrix_multiply_tiled(A, B)
+        return np.asarray(C) if as_ndarray else C
     
     # Sonuç matrisini oluştur (m × p boyutunda, sıfırlarla doldur)
     C = [[0 for _ in range(p)] for _ in range(m)]
@@ -53,7 +96,44 @@ def matrix_multiply(A, B):
             for k in range(n):
                 C[i][j] += A[i][k] * B[k][j]
     
-    return C
+    return np.asarray(C) if as_ndarray else C
+
+
+def _as_rows(matrix):
+    """
+    Matrix nesnelerini kopya oluşturmayan satır görünümleri listesine çevirir
+    
+    Böylece M[i][j] erişimleri her seferinde Matrix.__getitem__ çağırmaz;
+    liste listeleri olduğu gibi döner.
+    """
+    return matrix.row_views() if isinstance(matrix, Matrix) else matrix
+
+
+def _choose_backend(A, B, m, n, p):
+    """
+    backend="auto" için boyuta ve veri tipine göre backend seçer
+    
+    Returns:
+        tuple: (backend, A, B) - "numpy" seçildiyse A ve B ndarray'e
+               dönüştürülmüş hâlleridir, tekrar dönüştürülmez
+    """
+    if m * n * p <= AUTO_PYTHON_MAX_WORK:
+        return ("python", A, B)
+    if np is None:
+        return ("tiled", A, B)
+    
+    A_array = np.asarray(A)
+    B_array = np.asarray(B)
+    if A_array.dtype == object or B_array.dtype == object:
+        return ("tiled", A, B)   # int64'e sığmayan tamsayılar veya karışık tipler
+    if A_array.dtype.kind == "b" and B_array.dtype.kind == "b":
+        return ("tiled", A, B)   # bool @ bool mantıksal VEYA/VE verir, sayım değil
+    if A_array.dtype.kind in "iu" and B_array.dtype.kind in "iu":
+        # int64 taşmasını önle: en büyük olası toplam 2^63'ü aşmamalı
+        bound = int(np.abs(A_array).max()) * int(np.abs(B_array).max()) * n
+        if bound >= 2 ** 63:
+            return ("tiled", A, B)
+    return ("numpy", A_array, B_array)
 
 
 def matrix_multiply_optimized(A, B):
@@ -78,7 +158,12 @@ def matrix_multiply_optimized(A, B):
     C = [[0 for _ in range(p)] for _ in range(m)]
     
     # B matrisini transpose et (cache performansı için)
-    B_T = [[B[j][i] for j in range(len(B))] for i in range(len(B[0]))]
+    # Matrix için transpoz yalnızca bir görünümdür, veri kopyalanmaz
+    A = _as_rows(A)
+    if isinstance(B, Matrix):
+        B_T = B.T.row_views()
+    else:
+        B_T = [[B[j][i] for j in range(len(B))] for i in range(len(B[0]))]
     
     # Çarpım işlemi
     for i in range(m):
@@ -89,12 +174,587 @@ def matrix_multiply_optimized(A, B):
     return C
 
 
+def _check_dimensions(A, B):
+    """
+    Matrislerin çarpılabilir olduğunu kontrol eder
+    
+    Returns:
+        tuple: (m, n, p) - A(m×n) × B(n×p)
+    
+    Raises:
+        ValueError: Matrisler boşsa veya çarpılamıyorsa
+    """
+    if len(A) == 0 or len(B) == 0:
+        raise ValueError("Matrisler boş olamaz")
+    
+    m, n = len(A), len(A[0])
+    n2, p = len(B), len(B[0])
+    if n != n2:
+        raise ValueError(f"Matrisler çarpılamaz: A({m}×{n}) × B({n2}×{p})")
+    return m, n, p
+
+
+def matrix_multiply_tiled(A, B, block_size=None):
+    """
+    Blok (tile) tabanlı i-k-j matris çarpımı
+    
+    k ve j eksenleri block_size'lık bloklara bölünür; böylece bir blok
+    işlenirken kullanılan B parçası önbellekte kalır. B'nin bloğu bir kez
+    sütunlara çevrilir; her C[i][j] bloğun k'ları boyunca yerel bir
+    değişkende biriktirilir ve C'ye blok başına yalnızca bir kez yazılır
+    (her k adımında C_row[j] okuyup yazmak yerine). Sütunlara çevrilen blok
+    için matris boyutundan bağımsız O(block_size²) ek bellek kullanılır.
+    Her C[i][j] için toplama sırası klasik algoritmayla aynıdır, bu yüzden
+    ondalıklı sayılarda bile sonuç birebir aynıdır.
+    
+    Args:
+        A: İlk matris (m × n)
+        B: İkinci matris (n × p)
+        block_size: Blok boyutu (None: ölçülmüş değer veya DEFAULT_BLOCK_SIZE,
+                    "auto": gerekirse tune_block_size ile ölçülür)
+    
+    Returns:
+        list: Sonuç matrisi (m × p)
+    
+    Raises:
+        ValueError: Matrisler çarpılamıyorsa
+    """
+    m, n, p = _check_dimensions(A, B)
+    A, B = _as_rows(A), _as_rows(B)
+    if block_size == "auto":
+        block_size = _tuned_block_size or tune_block_size()
+    elif block_size is None:
+        block_size = _tuned_block_size or DEFAULT_BLOCK_SIZE
+    
+    C = [[0] * p for _ in range(m)]
+    
+    for kk in range(0, n, block_size):
+        k_end = min(kk + block_size, n)
+        for jj in range(0, p, block_size):
+            j_end = min(jj + block_size, p)
+            B_cols = list(zip(*[B[k][jj:j_end] for k in range(kk, k_end)]))
+            for i in range(m):
+                A_part = A[i][kk:k_end]
+                C_row = C[i]
+                for j, B_col in zip(range(jj, j_end), B_cols):
+                    total = C_row[j]
+                    for a, b in zip(A_part, B_col):
+                        total += a * b
+                    C_row[j] = total
+    
+    return C
+
+
+def tune_block_size(size=128, candidates=(16, 32, 64, 128, 256)):
+    """
+    Bu makinede en hızlı blok boyutunu ölçer ve matrix_multiply_tiled için saklar
+    
+    Args:
+        size: Ölçümde kullanılan kare matris boyutu
+        candidates: Denenecek blok boyutları
+    
+    Returns:
+        int: En hızlı blok boyutu
+    """
+    global _tuned_block_size
+    
+    A = [[(i * 7 + j) % 13 / 7 for j in range(size)] for i in range(size)]
+    B = [[(i + j * 5) % 11 / 3 for j in range(size)] for i in range(size)]
+    timings = {}
+    for block_size in candidates:
+        start = time.perf_counter()
+        matrix_multiply_tiled(A, B, block_size)
+        timings[block_size] = time.perf_counter() - start
+    
+    _tuned_block_size = min(timings, key=timings.get)
+    return _tuned_block_size
+
+
+def _matrix_add(X, Y):
+    return [list(map(add, x, y)) for x, y in zip(X, Y)]
+
+
+def _matrix_sub(X, Y):
+    return [list(map(sub, x, y)) for x, y in zip(X, Y)]
+
+
+def _strassen_winograd(A, B, size, crossover):
+    """size×size (size = crossover × 2^k) matrisleri Strassen-Winograd ile çarpar"""
+    # Base case: Küçük matrislerde temel algoritma daha hızlıdır
+    if size <= crossover:
+        return matrix_multiply(A, B, backend="auto")
+    
+    half = size // 2
+    A11 = [row[:half] for row in A[:half]]
+    A12 = [row[half:] for row in A[:half]]
+    A21 = [row[:half] for row in A[half:]]
+    A22 = [row[half:] for row in A[half:]]
+    B11 = [row[:half] for row in B[:half]]
+    B12 = [row[half:] for row in B[:half]]
+    B21 = [row[:half] for row in B[half:]]
+    B22 = [row[half:] for row in B[half:]]
+    
+    # Winograd varyantı: 7 çarpım, Strassen'in 18 toplaması yerine 15 toplama
+    S1 = _matrix_add(A21, A22)
+    S2 = _matrix_sub(S1, A11)
+    S3 = _matrix_sub(A11, A21)
+    S4 = _matrix_sub(A12, S2)
+    T1 = _matrix_sub(B12, B11)
+    T2 = _matrix_sub(B22, T1)
+    T3 = _matrix_sub(B22, B12)
+    T4 = _matrix_sub(T2, B21)
+    
+    P1 = _strassen_winograd(A11, B11, half, crossover)
+    P2 = _strassen_winograd(A12, B21, half, crossover)
+    P3 = _strassen_winograd(S4, B22, half, crossover)
+    P4 = _strassen_winograd(A22, T4, half, crossover)
+    P5 = _strassen_winograd(S1, T1, half, crossover)
+    P6 = _strassen_winograd(S2, T2, half, crossover)
+    P7 = _strassen_winograd(S3, T3, half, crossover)
+    
+    U2 = _matrix_add(P1, P6)
+    U3 = _matrix_add(U2, P7)
+    C11 = _matrix_add(P1, P2)
+    C12 = _matrix_add(_matrix_add(U2, P5), P3)
+    C21 = _matrix_sub(U3, P4)
+    C22 = _matrix_add(U3, P5)
+    
+    return [r1 + r2 for r1, r2 in zip(C11, C12)] + [r1 + r2 for r1, r2 in zip(C21, C22)]
+
+
+def matrix_multiply_strassen(A, B, crossover=None):
+    """
+    Strassen-Winograd algoritması ile matris çarpımı - O(n^2.807)
+    
+    Matrisler dört bloğa bölünür ve 8 yerine 7 blok çarpımı yapılır. Kare
+    olmayan veya boyutu 2'nin kuvveti olmayan matrisler sıfırlarla
+    doldurulur (padding); blok boyutu crossover'a inince en hızlı temel
+    algoritmaya (matrix_multiply, backend="auto") geçilir.
+    
+    Not: Ondalıklı sayılarda ara toplama/çıkarmalar nedeniyle sonuç klasik
+    algoritmadan son basamaklarda farklı olabilir; tamsayılarda aynıdır.
+    
+    Args:
+        A: İlk matris (m × n)
+        B: İkinci matris (n × p)
+        crossover: Temel algoritmaya geçilen blok boyutu
+                   (None: ölçülmüş değer veya DEFAULT_STRASSEN_CROSSOVER)
+    
+    Returns:
+        list: Sonuç matrisi (m × p)
+    
+    Raises:
+        ValueError: Matrisler çarpılamıyorsa veya crossover 1'den küçükse
+    """
+    m, n, p = _check_dimensions(A, B)
+    if crossover is not None and crossover < 1:
+        raise ValueError(f"crossover en az 1 olmalıdır: {crossover}")
+    crossover = crossover or _tuned_strassen_crossover or DEFAULT_STRASSEN_CROSSOVER
+    
+    # Doldurma miktarını azaltmak için boyut crossover × 2^k değil,
+    # crossover'dan küçük bir taban × 2^k olarak seçilir
+    base = max(m, n, p)
+    levels = 0
+    while base > crossover:
+        base = (base + 1) // 2
+        levels += 1
+    size = base << levels
+    
+    A_padded = [list(row) + [0] * (size - n) for row in A] + [[0] * size for _ in range(size - m)]
+    B_padded = [list(row) + [0] * (size - p) for row in B] + [[0] * size for _ in range(size - n)]
+    C = _strassen_winograd(A_padded, B_padded, size, base)
+    
+    return [row[:p] for row in C[:m]]
+
+
+def tune_strassen_crossover(sizes=(32, 64, 128, 256), repeat=1):
+    """
+    Bu makinede Strassen-Winograd'ın temel algoritmayı geçtiği boyutu ölçer
+    
+    Her boyutta temel algoritma (matrix_multiply, backend="auto") ile tek
+    seviyeli Strassen-Winograd (yarı boyutta temel algoritmaya geçen)
+    karşılaştırılır. Strassen'in daha hızlı olduğu en küçük boyut S ise
+    geçiş boyutu S // 2 olarak saklanır: recursion size > crossover iken
+    bölündüğünden S boyutundaki matrisler bölünür, S // 2 boyutundakiler
+    temel algoritmayla çarpılır.
+    
+    Strassen hiçbir boyutta kazanmazsa geçiş boyutu None döner ve en büyük
+    ölçülen boyut saklanır; bu boyuta kadar recursion hiç bölünmez.
+    
+    Args:
+        sizes: Denenecek kare matris boyutları (artan sırada)
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        tuple: (geçiş boyutu veya None, [(boyut, temel sn, strassen sn), ...])
+    """
+    global _tuned_strassen_crossover
+    
+    def best_time(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    measurements = []
+    crossover = None
+    for size in sizes:
+        A = [[(i * 7 + j) % 13 for j in range(size)] for i in range(size)]
+        B = [[(i + j * 5) % 11 for j in range(size)] for i in range(size)]
+        direct = best_time(lambda: matrix_multiply(A, B, backend="auto"))
+        strassen = best_time(lambda: matrix_multiply_strassen(A, B, crossover=size // 2))
+        measurements.append((size, direct, strassen))
+        if crossover is None and strassen < direct:
+            crossover = size // 2
+    
+    # Hiçbir boyutta kazanmadıysa recursion en büyük ölçülen boyutun üzerinde başlar
+    _tuned_strassen_crossover = crossover or sizes[-1]
+    return crossover, measurements
+
+
+def _flatten_typed(B):
+    """
+    Matrisi satır öncelikli (row-major) tek bir array('q') / array('d') tamponuna çevirir
+    
+    Tamsayılar int64'e, ondalıklı sayılar double'a yazılır. Karışık matriste
+    tamsayılar double'a çevrilirse sonuç matrix_multiply'dan farklı tipte
+    (7 yerine 7.0) çıkacağından bu durumda tampon oluşturulmaz.
+    
+    Returns:
+        array: Düz tampon (int64'e sığmayan, karışık veya sayı olmayan
+               değerlerde None)
+    """
+    if isinstance(B, Matrix):
+        return B.buffer()
+    flat = [value for row in B for value in row]
+    if all(type(value) is float for value in flat):
+        return array("d", flat)
+    if all(type(value) is int for value in flat):
+        try:
+            return array("q", flat)
+        except OverflowError:
+            pass
+    return None
+
+
+# Process havuzundaki her işçinin paylaşılan bellekteki B'ye açtığı satır görünümleri
+_worker_shared = None
+_worker_B = None
+
+
+def _attach_shared_matrix(name, typecode, rows, cols):
+    """İşçi başlatıcısı: paylaşılan bellekteki B'ye kopyasız satır görünümleri açar"""
+    global _worker_shared, _worker_B
+    from multiprocessing import shared_memory
+    
+    _worker_shared = shared_memory.SharedMemory(name=name)
+    view = _worker_shared.buf.cast(typecode)
+    _worker_B = [view[k * cols:(k + 1) * cols] for k in range(rows)]
+
+
+def _multiply_row_block(A_rows):
+    """İşçide A'nın bir satır bloğunu paylaşılan B ile çarpar"""
+    return matrix_multiply_tiled(A_rows, _worker_B)
+
+
+def matrix_multiply_parallel(A, B, workers=None):
+    """
+    Çok çekirdekli matris çarpımı - sonuç satırları process havuzunda paylaştırılır
+    
+    B matrisi bir kez paylaşılan belleğe (multiprocessing.shared_memory)
+    yazılır; her işçi B'nin satırlarını doğrudan bu bellek üzerinden
+    (memoryview dilimleri) okur, B ne pickle edilir ne de işçide kopyalanır.
+    Görevlere yalnızca A'nın satır blokları gönderilir ve her blok
+    matrix_multiply_tiled ile çarpılır.
+    
+    Not: B'deki değerler int64'e sığmıyorsa, sayı değilse veya tamsayı ile
+    ondalıklı sayıları karışık içeriyorsa çarpım tek çekirdekte yapılır;
+    böylece sonuç her durumda matrix_multiply ile aynı tiptedir.
+    
+    Args:
+        A: İlk matris (m × n)
+        B: İkinci matris (n × p)
+        workers: Process sayısı (varsayılan: işlemci sayısı)
+    
+    Returns:
+        list: Sonuç matrisi (m × p)
+    
+    Raises:
+        ValueError: Matrisler çarpılamıyorsa
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    
+    m, n, p = _check_dimensions(A, B)
+    if isinstance(A, Matrix):
+        A = A.tolist()   # satır blokları işçilere pickle ile gönderilir
+    workers = min(workers or os.cpu_count() or 1, m)
+    flat = _flatten_typed(B) if workers > 1 else None
+    if flat is None:
+        return matrix_multiply_tiled(A, B)
+    
+    data = memoryview(flat).cast("B")
+    shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+    try:
+        shm.buf[:data.nbytes] = data
+        # İş yükünü dengelemek için işçi başına birkaç blok
+        block_count = min(m, workers * 4)
+        bounds = [m * i // block_count for i in range(block_count + 1)]
+        blocks = [A[start:stop] for start, stop in zip(bounds, bounds[1:])]
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_matrix,
+                                 initargs=(shm.name, flat.typecode, n, p)) as pool:
+            C = []
+            for rows in pool.map(_multiply_row_block, blocks):
+                C.extend(rows)
+        return C
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def matrix_chain_plan(*matrices):
+    """
+    Matris zinciri için en az işlem gerektiren parantezlemeyi bulur
+    (dinamik programlama)
+    
+    A0 × A1 × ... × Ak-1 çarpımında sıra sonucu değiştirmez ancak maliyeti
+    değiştirir: (10×100)(100×5)(5×50) için soldan sağa 7.500, sağdan sola
+    75.000 çarpma gerekir. cost[i][j], Ai..Aj alt zincirinin en düşük
+    maliyetidir; her bölme noktası s için
+    cost[i][s] + cost[s+1][j] + d[i] × d[s+1] × d[j+1] denenir.
+    
+    Zaman Karmaşıklığı: O(k³), Alan Karmaşıklığı: O(k²) - k: matris sayısı
+    
+    Args:
+        *matrices: Çarpılacak matrisler (en az bir tane)
+    
+    Returns:
+        tuple: (plan, flops) - plan iç içe demetlerdir, yapraklar matris
+               index'leridir; örn. (0, (1, 2)) = A0 × (A1 × A2).
+               flops = 2 × çarpma sayısı (her çarpma-toplama 2 işlem)
+    
+    Raises:
+        ValueError: Matris yoksa, matrislerden biri boşsa veya boyutlar uyumsuzsa
+    """
+    dims = _chain_dimensions(matrices)
+    k = len(matrices)
+    
+    cost = [[0] * k for _ in range(k)]
+    split = [[0] * k for _ in range(k)]
+    for length in range(2, k + 1):
+        for i in range(k - length + 1):
+            j = i + length - 1
+            cost[i][j] = None
+            for s in range(i, j):
+                candidate = cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if cost[i][j] is None or candidate < cost[i][j]:
+                    cost[i][j] = candidate
+                    split[i][j] = s
+    
+    def build(i, j):
+        if i == j:
+            return i
+        s = split[i][j]
+        return (build(i, s), build(s + 1, j))
+    
+    return build(0, k - 1), 2 * cost[0][k - 1]
+
+
+def _chain_dimensions(matrices):
+    """
+    Zincirdeki tüm boyutları kontrol eder
+    
+    Returns:
+        list: d - Ai matrisi d[i] × d[i+1] boyutundadır
+    
+    Raises:
+        ValueError: Matris yoksa, matrislerden biri boşsa veya boyutlar uyumsuzsa
+    """
+    if not matrices:
+        raise ValueError("En az bir matris gerekli")
+    if any(len(M) == 0 for M in matrices):
+        raise ValueError("Matrisler boş olamaz")
+    
+    dims = [len(matrices[0])]
+    for i, M in enumerate(matrices):
+        rows, cols = len(M), len(M[0])
+        if rows != dims[-1]:
+            prev = matrices[i - 1]
+            raise ValueError(f"Matrisler çarpılamaz: A{i - 1}({len(prev)}×{len(prev[0])}) × "
+                             f"A{i}({rows}×{cols})")
+        dims.append(cols)
+    return dims
+
+
+def _chain_plan_flops(plan, dims):
+    """Verilen plan için (satır, sütun, flops) - plan doğrulaması ve karşılaştırma için"""
+    if isinstance(plan, int):
+        return dims[plan], dims[plan + 1], 0
+    m, n, left = _chain_plan_flops(plan[0], dims)
+    _, p, right = _chain_plan_flops(plan[1], dims)
+    return m, p, left + right + 2 * m * n * p
+
+
+def format_chain_plan(plan):
+    """
+    Planı okunabilir hale getirir
+    
+    Args:
+        plan: matrix_chain_plan'ın döndürdüğü plan
+    
+    Returns:
+        str: Örn. "(A0 × (A1 × A2))"
+    """
+    if isinstance(plan, int):
+        return f"A{plan}"
+    return f"({format_chain_plan(plan[0])} × {format_chain_plan(plan[1])})"
+
+
+def matrix_chain_multiply(*matrices, backend="auto"):
+    """
+    Matris zincirini en uygun parantezleme ile çarpar
+    
+    Tüm boyutlar çarpımdan önce kontrol edilir, plan matrix_chain_plan ile
+    bulunur ve her adım matrix_multiply ile seçilen backend'de yapılır.
+    
+    Args:
+        *matrices: Çarpılacak matrisler (en az bir tane)
+        backend: matrix_multiply backend'i (varsayılan "auto")
+    
+    Returns:
+        list: A0 × A1 × ... × Ak-1 çarpımı
+    
+    Raises:
+        ValueError: Matris yoksa, matrislerden biri boşsa, boyutlar uyumsuzsa
+                    veya backend bilinmiyorsa
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen backend: {backend} (seçenekler: {', '.join(BACKENDS)})")
+    plan, _ = matrix_chain_plan(*matrices)
+    
+    def execute(node):
+        if isinstance(node, int):
+            return matrices[node]
+        return matrix_multiply(execute(node[0]), execute(node[1]), backend=backend)
+    
+    if isinstance(plan, int):
+        return [list(row) for row in _as_rows(matrices[0])]
+    return execute(plan)
+
+
+def benchmark_matrix_chain(dims=(200, 200, 200, 10, 200), backend="auto", repeat=1):
+    """
+    En uygun parantezlemeyi soldan sağa sıralı çarpımla karşılaştırır
+    
+    Args:
+        dims: Zincir boyutları (Ai matrisi dims[i] × dims[i+1])
+        backend: matrix_multiply backend'i
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        tuple: (soldan sağa flops, soldan sağa sn, plan, plan flops, plan sn)
+    """
+    matrices = [[[(i * 3 + j + index) % 7 - 3 for j in range(cols)] for i in range(rows)]
+                for index, (rows, cols) in enumerate(zip(dims, dims[1:]))]
+    
+    def left_to_right():
+        C = matrices[0]
+        for M in matrices[1:]:
+            C = matrix_multiply(C, M, backend=backend)
+        return C
+    
+    def best_time(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    naive_plan = 0
+    for index in range(1, len(matrices)):
+        naive_plan = (naive_plan, index)
+    plan, flops = matrix_chain_plan(*matrices)
+    return (
+        _chain_plan_flops(naive_plan, list(dims))[2],
+        best_time(left_to_right),
+        plan,
+        flops,
+        best_time(lambda: matrix_chain_multiply(*matrices, backend=backend)),
+    )
+
+
+def benchmark_matrix_multiply_parallel(size=1000, max_workers=None, repeat=1):
+    """
+    matrix_multiply_parallel için güçlü ölçekleme (strong scaling) testi
+    
+    Aynı boyuttaki çarpım 1..N işçiyle yapılır; hızlanma = T(1) / T(N),
+    verimlilik = hızlanma / N.
+    
+    Args:
+        size: Kare matris boyutu
+        max_workers: En fazla işçi sayısı (varsayılan: işlemci sayısı)
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (işçi sayısı, saniye, hızlanma, verimlilik)
+    """
+    A = [[(i * 7 + j) % 13 for j in range(size)] for i in range(size)]
+    B = [[(i + j * 5) % 11 for j in range(size)] for i in range(size)]
+    
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            matrix_multiply_parallel(A, B, workers)
+            best = min(best, time.perf_counter() - start)
+        speedup = results[0][1] / best if results else 1.0
+        results.append((workers, best, speedup, speedup / workers))
+    return results
+
+
+def benchmark_matrix_multiply(sizes=(50, 100, 200, 500, 1000, 2000), repeat=1):
+    """
+    Klasik, optimize edilmiş ve blok tabanlı çarpımın sürelerini karşılaştırır
+    
+    Args:
+        sizes: Denenecek kare matris boyutları
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (boyut, klasik sn, optimize sn, blok tabanlı sn)
+    """
+    def best_time(func, A, B):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(A, B)
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    results = []
+    for size in sizes:
+        A = [[i + j for j in range(size)] for i in range(size)]
+        B = [[i - j for j in range(size)] for i in range(size)]
+        results.append((
+            size,
+            best_time(matrix_multiply, A, B),
+            best_time(matrix_multiply_optimized, A, B),
+            best_time(matrix_multiply_tiled, A, B),
+        ))
+    return results
+
+
 def print_matrix(matrix, name="Matris"):
     """
     Matrisi düzgün formatta yazdırır
     
     Args:
-        matrix: Yazdırılacak matris
+        matrix: Yazdırılacak matris (liste listesi veya Matrix)
         name: Matris ismi
     """
     print(f"\n{name}:")
@@ -107,7 +767,7 @@ def get_matrix_dimensions(matrix):
     Matris boyutlarını döndürür
     
     Args:
-        matrix: Matris
+        matrix: Matris (liste listesi veya Matrix)
     
     Returns:
         tuple: (satır sayısı, sütun sayısı)
@@ -115,16 +775,19 @@ def get_matrix_dimensions(matrix):
     return (len(matrix), len(matrix[0]) if matrix else 0)
 
 
-def create_identity_matrix(n):
+def create_identity_matrix(n, compact=False):
     """
     n×n birim matris oluşturur
     
     Args:
         n: Matris boyutu
+        compact: True ise n² ayrı int nesnesi yerine tek tamponlu Matrix döner
     
     Returns:
-        list: Birim matris
+        list: Birim matris (compact=True ise Matrix)
     """
+    if compact:
+        return Matrix.identity(n)
     return [[1 if i == j else 0 for j in range(n)] for i in range(n)]
 
 
@@ -221,24 +884,141 @@ if __name__ == "__main__":
     except ValueError as e:
         print(f"Hata: {e}")
     
-    # Test 7: Performans testi (büyük matrisler)
-    import time
+    # Test 7: Blok tabanlı (tiled) çarpım
+    import random
+    rng = random.Random(42)
+    
+    print("\n\nTest 7: Blok Tabanlı Çarpım")
+    C7 = matrix_multiply_tiled(A2, B2, block_size=1)
+    print_matrix(C7, "Sonuç (A × B), block_size=1")
+    for m, n, p in [(1, 1, 1), (3, 5, 2), (17, 9, 23), (40, 33, 35)]:
+        A7 = [[rng.uniform(-5, 5) for _ in range(n)] for _ in range(m)]
+        B7 = [[rng.uniform(-5, 5) for _ in range(p)] for _ in range(n)]
+        for block_size in [1, 4, 16, 64]:
+            assert matrix_multiply_tiled(A7, B7, block_size) == matrix_multiply(A7, B7)
+    print("Klasik algoritma ile karşılaştırma: Tüm sonuçlar aynı")
+    print(f"Bu makine için ölçülen blok boyutu: {tune_block_size(size=64, candidates=(16, 32, 64))}")
+    
+    # Test 8: Backend seçimi
+    print("\n\nTest 8: Backend Seçimi")
+    for backend in BACKENDS:
+        if backend == "numpy" and np is None:
+            print(f"{backend:>7}: NumPy kurulu değil, atlandı")
+            continue
+        print(f"{backend:>7}: {matrix_multiply(A1, B1, backend=backend)}")
+    for backend in BACKENDS:
+        try:
+            matrix_multiply(A6, B6, backend=backend)
+        except ValueError as e:
+            assert str(e) == "Matrisler çarpılamaz: A(2×3) × B(2×2)"
+        else:
+            raise AssertionError(f"{backend}: ValueError bekleniyordu")
+    try:
+        matrix_multiply(A1, B1, backend="gpu")
+    except ValueError as e:
+        print(f"Hata: {e}")
+    big_A = [[rng.randrange(-9, 10) for _ in range(30)] for _ in range(25)]
+    big_B = [[rng.randrange(-9, 10) for _ in range(20)] for _ in range(30)]
+    expected = matrix_multiply(big_A, big_B)
+    assert matrix_multiply(big_A, big_B, backend="auto") == expected
+    assert matrix_multiply(big_A, big_B, backend="tiled") == expected
+    if np is not None:
+        assert matrix_multiply(big_A, big_B, backend="numpy") == expected
+        assert isinstance(matrix_multiply(big_A, big_B, backend="numpy", as_ndarray=True), np.ndarray)
+    print(f"auto backend (25×30 × 30×20): {_choose_backend(big_A, big_B, 25, 30, 20)[0]}, sonuçlar aynı")
+    # bool matrislerde auto, python backend'i ile aynı (sayısal) sonucu vermeli
+    true_matrix = [[True] * 20 for _ in range(20)]
+    assert matrix_multiply(true_matrix, true_matrix, backend="auto") == [[20] * 20 for _ in range(20)]
+    
+    # Test 9: Strassen-Winograd çarpımı
+    print("\n\nTest 9: Strassen-Winograd Çarpımı")
+    print_matrix(matrix_multiply_strassen(A2, B2, crossover=1), "Sonuç (A × B), crossover=1")
+    for m, n, p in [(1, 1, 1), (2, 2, 2), (3, 5, 2), (7, 7, 7), (16, 16, 16), (19, 33, 8), (40, 17, 65)]:
+        A9 = [[rng.randrange(-100, 100) for _ in range(n)] for _ in range(m)]
+        B9 = [[rng.randrange(-100, 100) for _ in range(p)] for _ in range(n)]
+        expected = matrix_multiply(A9, B9)
+        for crossover in [1, 2, 4, 16, None]:
+            if crossover and max(m, n, p) > 16 * crossover:
+                continue   # çok derin recursion, test süresini uzatır
+            assert matrix_multiply_strassen(A9, B9, crossover) == expected
+    print("Rastgele tamsayı matrislerde klasik algoritma ile karşılaştırma: Tüm sonuçlar aynı")
+    for bad_crossover in [0, -1]:
+        try:
+            matrix_multiply_strassen(A2, B2, crossover=bad_crossover)
+        except ValueError as e:
+            print(f"Hata: {e}")
+        else:
+            raise AssertionError(f"crossover={bad_crossover}: ValueError bekleniyordu")
+    crossover, measurements = tune_strassen_crossover(sizes=(16, 32, 64))
+    for size, direct, strassen in measurements:
+        print(f"{size:>4}×{size:<4} temel: {direct:.4f}s, Strassen-Winograd (1 seviye): {strassen:.4f}s")
+    if crossover is None:
+        print(f"Strassen-Winograd ölçülen boyutlarda kazanmadı, {_tuned_strassen_crossover}×"
+              f"{_tuned_strassen_crossover} boyutuna kadar bölünmeyecek")
+    else:
+        print(f"Bu makinede ölçülen geçiş boyutu: {crossover} (daha büyük bloklar bölünür)")
+    
+    # Test 10: Çok çekirdekli çarpım
+    print("\n\nTest 10: Çok Çekirdekli Çarpım (matrix_multiply_parallel)")
+    A10 = [[rng.randrange(-100, 100) for _ in range(40)] for _ in range(30)]
+    B10 = [[rng.randrange(-100, 100) for _ in range(25)] for _ in range(40)]
+    F10 = [[rng.uniform(-1, 1) for _ in range(25)] for _ in range(40)]
+    for workers in [1, 2, 3]:
+        assert matrix_multiply_parallel(A10, B10, workers) == matrix_multiply(A10, B10)
+        assert matrix_multiply_parallel(A10, F10, workers) == matrix_multiply(A10, F10)
+    assert matrix_multiply_parallel(A1, [[10**20, 1], [2, 3]], 2) == matrix_multiply(A1, [[10**20, 1], [2, 3]])
+    mixed = [[1, 2.5], [3, 4]]
+    result = matrix_multiply_parallel([[1, 2], [3, 4]], mixed, 2)
+    assert result == [[7, 10.5], [15, 23.5]] and type(result[0][0]) is int
+    M10 = [row[:] for row in B10]
+    M10[0][0] = 0.5
+    expected = matrix_multiply(A10, M10)
+    result = matrix_multiply_parallel(A10, M10, 3)
+    assert result == expected
+    assert [type(value) for row in result for value in row] == [type(value) for row in expected for value in row]
+    print("1, 2 ve 3 işçi ile klasik algoritma karşılaştırması: Tüm sonuçlar aynı")
+    
+    # Test 11: Matris zinciri
+    print("\n\nTest 11: Matris Zinciri (En Uygun Parantezleme)")
+    shapes = [(10, 100), (100, 5), (5, 50)]
+    chain = [[[rng.randrange(-9, 10) for _ in range(cols)] for _ in range(rows)] for rows, cols in shapes]
+    plan, flops = matrix_chain_plan(*chain)
+    print(f"10×100, 100×5, 5×50 -> plan: {format_chain_plan(plan)}, {flops} FLOP")
+    assert plan == ((0, 1), 2) and flops == 2 * 7500
+    expected = matrix_multiply(matrix_multiply(chain[0], chain[1]), chain[2])
+    assert matrix_chain_multiply(*chain) == expected
+    assert matrix_chain_multiply(*chain, backend="python") == expected
+    assert matrix_chain_multiply(A1) == A1 and matrix_chain_plan(A1) == (0, 0)
+    for dims in [(4, 6), (2, 9, 3), (30, 1, 30, 1, 30), (5, 8, 3, 12, 7, 2, 9)]:
+        chain = [[[rng.randrange(-9, 10) for _ in range(cols)] for _ in range(rows)]
+                 for rows, cols in zip(dims, dims[1:])]
+        expected = chain[0]
+        for M in chain[1:]:
+            expected = matrix_multiply(expected, M)
+        plan, flops = matrix_chain_plan(*chain)
+        assert _chain_plan_flops(plan, _chain_dimensions(chain))[2] == flops
+        assert matrix_chain_multiply(*chain) == expected
+    print("Farklı zincirlerde soldan sağa çarpım ile karşılaştırma: Tüm sonuçlar aynı")
+    for bad_chain in [(), (A1, A6, A6), (A1, [])]:
+        try:
+            matrix_chain_multiply(*bad_chain)
+        except ValueError as e:
+            print(f"Hata: {e}")
     
-    print("\n\nTest 7: Performans Testi")
-    size = 50
-    A7 = [[i + j for j in range(size)] for i in range(size)]
-    B7 = [[i - j for j in range(size)] for i in range(size)]
+    # Test 12: Performans testi (büyük matrisler)
+    print("\n\nTest 12: Performans Testi")
+    print(f"{'Boyut':>7} {'Klasik':>10} {'Optimize':>10} {'Blok':>10} {'Hızlanma':>9}")
+    for size, classic, optimized, tiled in benchmark_matrix_multiply(sizes=(50, 100)):
+        print(f"{size:>7} {classic:>9.4f}s {optimized:>9.4f}s {tiled:>9.4f}s {classic / tiled:>8.2f}x")
     
-    print(f"İki {size}×{size} matris çarpılıyor...")
-    start_time = time.time()
-    C7 = matrix_multiply(A7, B7)
-    end_time = time.time()
-    print(f"Klasik Algoritma: {end_time - start_time:.4f} saniye")
+    print("\nGüçlü ölçekleme (100×100, matrix_multiply_parallel):")
+    for workers, elapsed, speedup, efficiency in benchmark_matrix_multiply_parallel(size=100, max_workers=2):
+        print(f"{workers:>3} işçi: {elapsed:.4f}s, hızlanma: {speedup:.2f}x, verimlilik: {efficiency:.0%}")
     
-    start_time = time.time()
-    C7_opt = matrix_multiply_optimized(A7, B7)
-    end_time = time.time()
-    print(f"Optimize Edilmiş: {end_time - start_time:.4f} saniye")
+    print("\nMatris zinciri (60×60 × 60×60 × 60×4 × 4×60, backend=auto):")
+    naive_flops, naive_time, plan, flops, planned_time = benchmark_matrix_chain(dims=(60, 60, 60, 4, 60))
+    print(f"Soldan sağa: {naive_flops:>8} FLOP, {naive_time:.4f}s")
+    print(f"{format_chain_plan(plan)}: {flops:>8} FLOP, {planned_time:.4f}s")
     
     print("\n" + "=" * 60)
 
@@ -0,0 +1,439 @@
+"""
+DOSYA TABANLI MATRİS VE BELLEK DIŞI ÇARPIM (OUT-OF-CORE MATRIX MULTIPLICATION)
+
+Açıklama:
+RAM'e sığmayan matrisler diskte saklanır ve mmap ile belleğe eşlenir.
+Çarpım, matrisleri bloklara (tile) bölerek yapılır: her adımda A'dan ve
+B'den birer blok okunur, çarpılır ve sonuç bloğu diske yazılır. Aynı anda
+bellekte en fazla üç blok bulunur, blok boyutu bellek bütçesinden hesaplanır.
+
+Dosya Formatı (little-endian):
+- 0-3. bayt: Sihirli değer b"MMAT"
+- 4. bayt: Tip kodu (b"q" = int64, b"d" = double)
+- 5-7. bayt: Dolgu
+- 8-15. bayt: Satır sayısı (uint64)
+- 16-23. bayt: Sütun sayısı (uint64)
+- 24. bayttan itibaren: Elemanlar, satır öncelikli (row-major)
+
+Veri 24. bayttan başladığı için dosya numpy.memmap(path, dtype, offset=24,
+shape=(m, n)) ile de açılabilir.
+
+Zaman Karmaşıklığı: O(m × n × p) - klasik algoritma ile aynı
+Alan Karmaşıklığı: O(b²) bellek (b: blok boyutu), O(m × p) disk
+Disk Okuma: O(m × n × p / b) eleman
+"""
+
+import math
+import mmap
+import os
+import struct
+from array import array
+from itertools import repeat
+from operator import add, mul
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsiyonel
+    np = None
+
+HEADER_FORMAT = "<4sc3xQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"MMAT"
+ITEM_SIZE = 8
+# Blok içindeki bir eleman listede bir işaretçi (8 bayt) ve bir int/float
+# nesnesi (24-32 bayt) tutar
+PYTHON_ITEM_BYTES = 40
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+class MappedMatrix:
+    """
+    Diskteki bir dosyaya mmap ile eşlenmiş, satır öncelikli matris
+    """
+    
+    def __init__(self, path, file, mapping, rows, cols, typecode):
+        self.path = path
+        self.rows = rows
+        self.cols = cols
+        self.typecode = typecode
+        self._file = file
+        self._mmap = mapping
+    
+    @classmethod
+    def create(cls, path, rows, cols, typecode="d"):
+        """
+        Sıfırlarla dolu yeni bir matris dosyası oluşturur
+        
+        Args:
+            path: Dosya yolu (varsa üzerine yazılır)
+            rows: Satır sayısı
+            cols: Sütun sayısı
+            typecode: "q" (int64) veya "d" (double) (varsayılan "d")
+        
+        Returns:
+            MappedMatrix: Yazılabilir matris
+        
+        Raises:
+            ValueError: Tip kodu bilinmiyorsa
+        """
+        if typecode not in ("q", "d"):
+            raise ValueError(f"Bilinmeyen tip kodu: {typecode} (seçenekler: q, d)")
+        
+        file = open(path, "w+b")
+        file.write(struct.pack(HEADER_FORMAT, MAGIC, typecode.encode(), rows, cols))
+        # truncate seyrek (sparse) dosya oluşturur, sıfırlar diske yazılmaz
+        file.truncate(HEADER_SIZE + rows * cols * ITEM_SIZE)
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE)
+        return cls(path, file, mapping, rows, cols, typecode)
+    
+    @classmethod
+    def open(cls, path, writable=False):
+        """
+        Var olan bir matris dosyasını açar
+        
+        Args:
+            path: Dosya yolu
+            writable: True ise yazılabilir açılır (varsayılan False)
+        
+        Returns:
+            MappedMatrix: Dosyaya eşlenmiş matris
+        
+        Raises:
+            ValueError: Dosya formatı geçersizse
+        """
+        file = open(path, "r+b" if writable else "rb")
+        header = file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            file.close()
+            raise ValueError(f"Geçersiz matris dosyası: {path}")
+        magic, typecode, rows, cols = struct.unpack(HEADER_FORMAT, header)
+        typecode = typecode.decode()
+        if magic != MAGIC or typecode not in ("q", "d"):
+            file.close()
+            raise ValueError(f"Geçersiz matris dosyası: {path}")
+        if os.fstat(file.fileno()).st_size < HEADER_SIZE + rows * cols * ITEM_SIZE:
+            file.close()
+            raise ValueError(f"Matris dosyası eksik: {path}")
+        
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        mapping = mmap.mmap(file.fileno(), 0, access=access)
+        return cls(path, file, mapping, rows, cols, typecode)
+    
+    @classmethod
+    def from_rows(cls, path, rows, typecode=None):
+        """
+        Liste listesini (veya Matrix) satır satır dosyaya yazar
+        
+        Args:
+            path: Dosya yolu
+            rows: Yoğun matris
+            typecode: "q" veya "d" (None: tüm elemanlar tamsayıysa "q", değilse "d")
+        
+        Returns:
+            MappedMatrix: Yazılabilir matris
+        """
+        m = len(rows)
+        n = len(rows[0]) if m else 0
+        if typecode is None:
+            typecode = "q" if all(isinstance(x, int) for row in rows for x in row) else "d"
+        
+        matrix = cls.create(path, m, n, typecode)
+        for i, row in enumerate(rows):
+            matrix.write_block(i, 0, [row])
+        return matrix
+    
+    @property
+    def shape(self):
+        """(satır sayısı, sütun sayısı)"""
+        return (self.rows, self.cols)
+    
+    def _offset(self, i, j):
+        return HEADER_SIZE + (i * self.cols + j) * ITEM_SIZE
+    
+    def read_block(self, row_start, row_end, col_start, col_end):
+        """
+        [row_start, row_end) × [col_start, col_end) bloğunu okur
+        
+        Args:
+            row_start, row_end: Satır aralığı
+            col_start, col_end: Sütun aralığı
+        
+        Returns:
+            list: Blok (liste listesi)
+        """
+        width = (col_end - col_start) * ITEM_SIZE
+        block = []
+        for i in range(row_start, row_end):
+            start = self._offset(i, col_start)
+            row = array(self.typecode)
+            row.frombytes(self._mmap[start:start + width])
+            block.append(row.tolist())
+        return block
+    
+    def write_block(self, row_start, col_start, block):
+        """
+        Bloğu (row_start, col_start) konumundan başlayarak yazar
+        
+        Args:
+            row_start: Başlangıç satırı
+            col_start: Başlangıç sütunu
+            block: Yazılacak blok (liste listesi)
+        """
+        for i, row in enumerate(block, row_start):
+            data = array(self.typecode, row).tobytes()
+            start = self._offset(i, col_start)
+            self._mmap[start:start + len(data)] = data
+    
+    def tolist(self):
+        """Tüm matrisi liste listesi olarak okur (yalnızca küçük matrisler için)"""
+        return self.read_block(0, self.rows, 0, self.cols)
+    
+    def memmap(self):
+        """
+        Aynı dosyayı numpy.memmap olarak açar
+        
+        Returns:
+            numpy.memmap: (rows, cols) boyutunda görünüm
+        
+        Raises:
+            ImportError: numpy kurulu değilse
+        """
+        if np is None:
+            raise ImportError("numpy kurulu değil")
+        dtype = "<i8" if self.typecode == "q" else "<f8"
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=HEADER_SIZE,
+                         shape=(self.rows, self.cols))
+    
+    def flush(self):
+        """Yazılan değişiklikleri diske aktarır"""
+        self._mmap.flush()
+    
+    def close(self):
+        """Eşlemeyi ve dosyayı kapatır"""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __repr__(self):
+        return f"MappedMatrix({self.path!r}, {self.rows}×{self.cols}, typecode={self.typecode!r})"
+
+
+def block_size_for_budget(memory_budget):
+    """
+    Bellek bütçesine sığan en büyük kare blok boyutu
+    
+    Bellekte aynı anda A, B ve C'den birer blok bulunur: 3 × b² eleman.
+    
+    Args:
+        memory_budget: Bayt cinsinden bellek bütçesi
+    
+    Returns:
+        int: Blok boyutu (en az 1)
+    
+    Raises:
+        ValueError: Bütçe pozitif değilse
+    """
+    if memory_budget <= 0:
+        raise ValueError("Bellek bütçesi pozitif olmalıdır")
+    return max(1, math.isqrt(memory_budget // (3 * PYTHON_ITEM_BYTES)))
+
+
+def matrix_multiply_out_of_core(A, B, out_path, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Diskteki iki matrisi bloklar halinde çarpar, sonucu diske yazar
+    
+    Her C[i0:i1][j0:j1] bloğu için k ekseni boyunca A ve B blokları okunur,
+    i-k-j sırasıyla biriktirilir ve blok tamamlanınca diske yazılır.
+    
+    Args:
+        A: MappedMatrix (m × n)
+        B: MappedMatrix (n × p)
+        out_path: Sonuç dosyasının yolu
+        memory_budget: Blokların kullanabileceği bayt sayısı (varsayılan 64 MB)
+    
+    Returns:
+        MappedMatrix: Sonuç matrisi (m × p)
+    
+    Raises:
+        ValueError: Matrisler boşsa, çarpılamıyorsa veya bütçe geçersizse
+    """
+    m, n = A.shape
+    n2, p = B.shape
+    if m == 0 or n == 0 or p == 0:
+        raise ValueError("Matrisler boş olamaz")
+    if n != n2:
+        raise ValueError(f"Matrisler çarpılamaz: A({m}×{n}) × B({n2}×{p})")
+    
+    block = block_size_for_budget(memory_budget)
+    typecode = "q" if A.typecode == B.typecode == "q" else "d"
+    C = MappedMatrix.create(out_path, m, p, typecode)
+    
+    for i0 in range(0, m, block):
+        i1 = min(i0 + block, m)
+        for j0 in range(0, p, block):
+            j1 = min(j0 + block, p)
+            C_tile = [[0] * (j1 - j0) for _ in range(i1 - i0)]
+            
+            for k0 in range(0, n, block):
+                k1 = min(k0 + block, n)
+                A_tile = A.read_block(i0, i1, k0, k1)
+                B_tile = B.read_block(k0, k1, j0, j1)
+                
+                for i, A_row in enumerate(A_tile):
+                    C_row = C_tile[i]
+                    for k, a in enumerate(A_row):
+                        if a:
+                            C_row = list(map(add, C_row, map(mul, repeat(a), B_tile[k])))
+                    C_tile[i] = C_row
+            
+            C.write_block(i0, j0, C_tile)
+    
+    C.flush()
+    return C
+
+
+def benchmark_out_of_core(size=200, budgets=(16 * 1024, 256 * 1024, 4 * 1024 * 1024), directory=None,
+                          trace_memory=False):
+    """
+    Farklı bellek bütçelerinde bellek dışı çarpımın süresini ve bellek
+    tepesini ölçer
+    
+    Args:
+        size: Kare matris boyutu
+        budgets: Bayt cinsinden bellek bütçeleri
+        directory: Geçici dosyaların yazılacağı dizin (None: sistem varsayılanı)
+        trace_memory: True ise çarpım tracemalloc altında ayrıca çalıştırılıp
+            tepe bellek ölçülür (tracemalloc çarpımı birkaç kat yavaşlatır)
+    
+    Returns:
+        list: (bütçe, blok boyutu, süre sn, tepe bellek bayt veya None)
+    """
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+    
+    rng = random.Random(42)
+    results = []
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        A = MappedMatrix.create(os.path.join(tmp, "A.mat"), size, size)
+        B = MappedMatrix.create(os.path.join(tmp, "B.mat"), size, size)
+        for i in range(size):
+            A.write_block(i, 0, [[rng.random() for _ in range(size)]])
+            B.write_block(i, 0, [[rng.random() for _ in range(size)]])
+        
+        out_path = os.path.join(tmp, "C.mat")
+        for budget in budgets:
+            start = time.perf_counter()
+            matrix_multiply_out_of_core(A, B, out_path, memory_budget=budget).close()
+            elapsed = time.perf_counter() - start
+            
+            peak = None
+            if trace_memory:
+                tracemalloc.start()
+                matrix_multiply_out_of_core(A, B, out_path, memory_budget=budget).close()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            results.append((budget, block_size_for_budget(budget), elapsed, peak))
+        
+        A.close()
+        B.close()
+    return results
+
+
+# Test Senaryoları
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import tracemalloc
+    from matrix_multiplication import matrix_multiply
+    
+    print("=" * 60)
+    print("BELLEK DIŞI MATRİS ÇARPIMI TEST SENARYOLARI")
+    print("=" * 60)
+    
+    rng = random.Random(42)
+    tmp = tempfile.TemporaryDirectory()
+    
+    # Test 1: Dosya formatı - yazma ve geri okuma
+    print("\nTest 1: Dosya Formatı")
+    A1 = [[1, 2, 3], [4, 5, 6]]
+    path_1 = os.path.join(tmp.name, "A1.mat")
+    with MappedMatrix.from_rows(path_1, A1) as M1:
+        print(f"{M1}, dosya boyutu: {os.path.getsize(path_1)} bayt (başlık {HEADER_SIZE})")
+    with MappedMatrix.open(path_1) as M1:
+        print(f"Okunan: {M1.tolist()}")
+        assert M1.shape == (2, 3) and M1.typecode == "q" and M1.tolist() == A1
+        assert M1.read_block(0, 2, 1, 3) == [[2, 3], [5, 6]]
+    
+    # Test 2: Küçük matris çarpımı
+    print("\nTest 2: Küçük Matris Çarpımı")
+    B2 = [[7, 8], [9, 10], [11, 12]]
+    with MappedMatrix.open(path_1) as A2, \
+            MappedMatrix.from_rows(os.path.join(tmp.name, "B2.mat"), B2) as B2_file:
+        with matrix_multiply_out_of_core(A2, B2_file, os.path.join(tmp.name, "C2.mat"),
+                                         memory_budget=1) as C2:
+            print(f"Sonuç (blok boyutu 1): {C2.tolist()}")
+            assert C2.tolist() == matrix_multiply(A1, B2) == [[58, 64], [139, 154]]
+    
+    # Test 3: Düşük bellek bütçesi ile bellek içi sonuçla karşılaştırma
+    print("\nTest 3: Düşük Bellek Bütçesi ile Karşılaştırma")
+    for m, n, p, budget in [(1, 1, 1, 1), (37, 23, 29, 4096), (50, 64, 45, 16 * 1024), (20, 20, 20, 10 ** 9)]:
+        A = [[rng.randrange(-50, 50) for _ in range(n)] for _ in range(m)]
+        B = [[rng.random() for _ in range(p)] for _ in range(n)]
+        with MappedMatrix.from_rows(os.path.join(tmp.name, "A.mat"), A) as A_file, \
+                MappedMatrix.from_rows(os.path.join(tmp.name, "B.mat"), B) as B_file, \
+                matrix_multiply_out_of_core(A_file, B_file, os.path.join(tmp.name, "C.mat"),
+                                            memory_budget=budget) as C_file:
+            expected = matrix_multiply(A, B)
+            result = C_file.tolist()
+            assert all(math.isclose(x, y, rel_tol=1e-12, abs_tol=1e-9)
+                       for row_x, row_y in zip(result, expected) for x, y in zip(row_x, row_y))
+        print(f"{m}×{n} × {n}×{p}, bütçe {budget} bayt (blok {block_size_for_budget(budget)}): Doğru")
+    
+    # Test 4: Bellek tepesi bütçe ile sınırlı
+    print("\nTest 4: Bellek Tepesi")
+    size = 60
+    budget = 8 * 1024
+    with MappedMatrix.create(os.path.join(tmp.name, "A4.mat"), size, size) as A4, \
+            MappedMatrix.create(os.path.join(tmp.name, "B4.mat"), size, size) as B4:
+        for i in range(size):
+            A4.write_block(i, 0, [[rng.random() for _ in range(size)]])
+            B4.write_block(i, 0, [[rng.random() for _ in range(size)]])
+        tracemalloc.start()
+        C4 = matrix_multiply_out_of_core(A4, B4, os.path.join(tmp.name, "C4.mat"), memory_budget=budget)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        C4.close()
+    in_memory = 3 * size * size * PYTHON_ITEM_BYTES
+    print(f"Bütçe: {budget} bayt, tepe: {peak} bayt, bellek içi çarpım: ~{in_memory} bayt")
+    # Sabit ek yük (dosya nesneleri, satır tamponları) dışında bütçe aşılmaz
+    assert peak < budget + 16 * 1024 < in_memory
+    
+    # Test 5: Hata durumları
+    print("\nTest 5: Hata Durumları")
+    with open(os.path.join(tmp.name, "bad.mat"), "wb") as f:
+        f.write(b"not a matrix")
+    try:
+        MappedMatrix.open(os.path.join(tmp.name, "bad.mat"))
+    except ValueError as e:
+        print(f"Hata: {e}")
+    with MappedMatrix.open(path_1) as A5:
+        try:
+            matrix_multiply_out_of_core(A5, A5, os.path.join(tmp.name, "C5.mat"))
+        except ValueError as e:
+            print(f"Hata: {e}")
+    
+    # Test 6: Performans testi
+    print("\nTest 6: Performans Testi (100×100)")
+    for budget, block, elapsed, peak in benchmark_out_of_core(size=100):
+        print(f"Bütçe {budget:>8} bayt (blok {block:>3}): {elapsed:.4f} saniye")
+    
+    tmp.cleanup()
+    print("\n" + "=" * 60)
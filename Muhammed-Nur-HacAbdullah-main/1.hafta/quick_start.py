@@ -117,8 +117,14 @@ def main():
     print("  • python3 array_sum.py")
     print("  • python3 linear_search.py")
     print("  • python3 matrix_multiplication.py")
+    print("  • python3 matrix.py")
+    print("  • python3 sparse_matrix.py")
+    print("  • python3 mmap_matrix.py")
+    print("  • python3 instrumentation.py")
     print("\nTüm testleri çalıştırmak için:")
-    print("  • python3 run_all_tests.py")
+    print("  • python3 run_all_tests.py [--jobs N] [--no-cache] [--bench]")
+    print("\nPerformans ölçümleri için:")
+    print("  • python3 benchmark.py [--quick] [--memory] [--baseline temel.json]")
     print("\nDetaylı dokümantasyon için:")
     print("  • README.md dosyasını okuyun")
     print("="*60)
@@ -2,67 +2,317 @@
 TÜM TESTLERI ÇALIŞTIR
 
 Bu script tüm algoritma dosyalarını çalıştırarak test sonuçlarını gösterir.
+
+Dosyalar ayrı process'lerde eşzamanlı çalıştırılır (--jobs), çıktılar yine
+dosya sırasıyla yazdırılır. Son başarılı çalıştırmadan bu yana içeriği
+(dosyanın kendisi ve import ettiği yerel modüller) değişmeyen dosyalar
+atlanır; önbellek .test_cache.json dosyasında tutulur (--no-cache ile kapatılır).
+
+--bench verilirse testlerden sonra benchmark.py --quick çalıştırılır ve
+.benchmark_baseline.json'daki temel çizgiye göre eşikten fazla yavaşlayan
+ölçüm varsa çalıştırma başarısız sayılır (temel çizgi yoksa oluşturulur).
+Aynı şekilde benchmark.py --memory ile tepe bellek kullanımı
+.benchmark_memory_baseline.json'a göre kontrol edilir.
+
+Kullanım:
+    python3 run_all_tests.py [--jobs N] [--no-cache] [--bench] [--bench-threshold 0.25]
 """
 
+import argparse
+import ast
+import hashlib
+import json
+import os
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def run_test(filename, description):
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.path.join(BASE_DIR, ".test_cache.json")
+TIMEOUT = 30
+BENCH_BASELINE_FILE = os.path.join(BASE_DIR, ".benchmark_baseline.json")
+BENCH_MEMORY_BASELINE_FILE = os.path.join(BASE_DIR, ".benchmark_memory_baseline.json")
+BENCH_TIMEOUT = 600
+
+TESTS = [
+    ("binary_search.py", "İkili Arama (Binary Search)"),
+    ("array_sum.py", "Dizilerde Toplama (Array Summation)"),
+    ("linear_search.py", "Dizide Eleman Arama (Linear Search)"),
+    ("matrix_multiplication.py", "Matris Çarpımı (Matrix Multiplication)"),
+    ("matrix.py", "Düz Tamponlu Matris (Compact Matrix)"),
+    ("sparse_matrix.py", "Seyrek Matrisler (Sparse CSR/COO)"),
+    ("mmap_matrix.py", "Bellek Dışı Matris Çarpımı (Out-of-Core)"),
+    ("instrumentation.py", "İşlem Sayacı (Instrumentation)")
+]
+
+def _local_imports(path):
+    """Dosyanın import ettiği, aynı dizindeki modüllerin yolları"""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    
+    directory = os.path.dirname(path)
+    candidates = (os.path.join(directory, name + ".py") for name in names)
+    return sorted(candidate for candidate in candidates if os.path.isfile(candidate))
+
+def content_hash(filename):
     """
-    Bir test dosyasını çalıştırır ve sonucu gösterir
+    Dosyanın ve import ettiği yerel modüllerin (dolaylı olanlar dahil) özeti
+    
+    Python sürümü de özete katılır; yorumlayıcı değişirse testler yeniden çalışır.
+    
+    Args:
+        filename: Test dosyası (BASE_DIR'e göre)
+    
+    Returns:
+        str: SHA-256 özeti (hex)
+    """
+    digest = hashlib.sha256(sys.version.encode())
+    seen = set()
+    pending = [os.path.join(BASE_DIR, filename)]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        pending.extend(_local_imports(path))
+    
+    for path in sorted(seen):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def load_cache():
+    """Son başarılı çalıştırmadaki özetler: {dosya adı: özet}"""
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache):
+    """Önbelleği yazar (yazılamıyorsa sessizce geçer)"""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+def execute_test(filename, timeout=TIMEOUT, args=()):
+    """
+    Bir test dosyasını ayrı bir process'te çalıştırır (çıktı yazdırmaz)
+    
+    Çıktılar pipe yerine geçici dosyalara yönlendirilir; böylece process
+    os.wait4 ile beklenip kullandığı CPU süresi (kullanıcı + sistem) okunabilir.
+    os.wait4 veya os.waitid olmayan platformlarda (Windows, macOS) CPU süresi
+    None döner.
     
     Args:
         filename: Çalıştırılacak Python dosyası
+        timeout: Saniye cinsinden zaman aşımı
+        args: Dosyaya verilecek komut satırı argümanları
+    
+    Returns:
+        dict: returncode, stdout, stderr, wall, cpu, timed_out
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, filename, *args], stdout=out, stderr=err, cwd=BASE_DIR)
+        cpu = None
+        timed_out = False
+        
+        if hasattr(os, "wait4") and hasattr(os, "waitid"):
+            # Zamanlayıcı yalnızca process henüz toplanmamışsa öldürür. waitid(WNOWAIT)
+            # process'i zombi olarak bırakır, PID'i serbest kalmaz; "reaped" kilit
+            # altında işaretlendikten sonra wait4 ile toplanır. Böylece sinyal asla
+            # başka bir process'e gitmez. process.kill() kullanılmaz çünkü poll()
+            # ile process'i bizden önce toplayabilir.
+            lock = threading.Lock()
+            state = {"reaped": False, "killed": False}
+            
+            def kill():
+                with lock:
+                    if not state["reaped"]:
+                        os.kill(process.pid, signal.SIGKILL)
+                        state["killed"] = True
+            
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+            finally:
+                with lock:
+                    state["reaped"] = True
+                timer.cancel()
+            _, status, usage = os.wait4(process.pid, 0)
+            # Process'i kendimiz bekledik; Popen'in tekrar beklememesi için
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # Zaman aşımı: öldürme sinyali gönderildi ve process gerçekten onunla sonlandı
+            timed_out = state["killed"] and process.returncode == -signal.SIGKILL
+            cpu = usage.ru_utime + usage.ru_stime
+        else:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                timed_out = True
+        wall = time.perf_counter() - start
+        
+        out.seek(0)
+        err.seek(0)
+        return {
+            "returncode": process.returncode,
+            "stdout": out.read().decode("utf-8", errors="replace"),
+            "stderr": err.read().decode("utf-8", errors="replace"),
+            "wall": wall,
+            "cpu": cpu,
+            "timed_out": timed_out,
+        }
+
+def report_test(description, result):
+    """
+    execute_test sonucunu yazdırır
+    
+    Args:
         description: Test açıklaması
+        result: execute_test'in döndürdüğü sözlük
+    
+    Returns:
+        bool: Test başarılıysa True
     """
     print("\n" + "="*80)
     print(f"🧪 {description}")
     print("="*80)
     
-    try:
-        result = subprocess.run(
-            [sys.executable, filename],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode == 0:
-            print(result.stdout)
-            print(f"✅ {description} - BAŞARILI")
-        else:
-            print(result.stdout)
-            print(result.stderr)
-            print(f"❌ {description} - HATA")
-            return False
-            
-    except subprocess.TimeoutExpired:
+    cpu = "-" if result["cpu"] is None else f"{result['cpu']:.2f}s"
+    timing = f"⏲️ Süre: {result['wall']:.2f}s (duvar), {cpu} (CPU)"
+    
+    if result["timed_out"]:
         print(f"⏱️ {description} - ZAMAN AŞIMI")
         return False
+    if result["returncode"] == 0:
+        print(result["stdout"])
+        print(timing)
+        print(f"✅ {description} - BAŞARILI")
+        return True
+    
+    print(result["stdout"])
+    print(result["stderr"])
+    print(timing)
+    print(f"❌ {description} - HATA")
+    return False
+
+def run_test(filename, description):
+    """
+    Bir test dosyasını çalıştırır ve sonucu gösterir
+    
+    Args:
+        filename: Çalıştırılacak Python dosyası
+        description: Test açıklaması
+    
+    Returns:
+        bool: Test başarılıysa True
+    """
+    try:
+        return report_test(description, execute_test(filename))
     except Exception as e:
         print(f"❌ {description} - BEKLENMEYEN HATA: {e}")
         return False
+
+def run_benchmark_gate(threshold=None, memory=False):
+    """
+    Performans testlerini temel çizgiye göre çalıştırır
+    
+    Args:
+        threshold: Gerileme eşiği (None: benchmark.py varsayılanı)
+        memory: True ise süre yerine bellek kullanımı karşılaştırılır
     
-    return True
+    Returns:
+        dict: execute_test sonucu
+    """
+    if memory:
+        args = ["--quick", "--memory", "--baseline", BENCH_MEMORY_BASELINE_FILE]
+    else:
+        args = ["--quick", "--baseline", BENCH_BASELINE_FILE]
+    if threshold is not None:
+        args += ["--threshold", str(threshold)]
+    return execute_test("benchmark.py", timeout=BENCH_TIMEOUT, args=args)
 
-def main():
-    """Ana test fonksiyonu"""
+def main(jobs=None, use_cache=True, bench=False, bench_threshold=None):
+    """
+    Ana test fonksiyonu
+    
+    Args:
+        jobs: Aynı anda çalışan test dosyası sayısı (varsayılan: işlemci sayısı)
+        use_cache: False ise değişmemiş dosyalar da çalıştırılır
+        bench: True ise testlerden sonra performans kapısı çalıştırılır
+        bench_threshold: Performans kapısının süre gerileme eşiği (bellek kapısı
+                         benchmark.py'nin bellek eşiğini kullanır)
+    
+    Returns:
+        bool: Tüm testler başarılıysa True
+    """
     print("\n" + "="*80)
     print("🚀 VERİ YAPILARI VE ALGORİTMALAR - TÜM TESTLER")
     print("="*80)
     
-    tests = [
-        ("binary_search.py", "İkili Arama (Binary Search)"),
-        ("array_sum.py", "Dizilerde Toplama (Array Summation)"),
-        ("linear_search.py", "Dizide Eleman Arama (Linear Search)"),
-        ("matrix_multiplication.py", "Matris Çarpımı (Matrix Multiplication)")
-    ]
+    start = time.perf_counter()
+    cache = load_cache() if use_cache else {}
+    hashes = {filename: content_hash(filename) for filename, _ in TESTS}
+    pending = [(filename, description) for filename, description in TESTS
+               if cache.get(filename) != hashes[filename]]
     
     results = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs or os.cpu_count() or 1)) as pool:
+        futures = {filename: pool.submit(execute_test, filename) for filename, _ in pending}
+        
+        # Çıktılar, tamamlanma sırasından bağımsız olarak dosya sırasıyla yazdırılır
+        for filename, description in TESTS:
+            if filename not in futures:
+                print(f"\n⏭️ {description} - DEĞİŞMEDİ, ATLANDI")
+                results.append((description, True, None, True))
+                continue
+            
+            try:
+                result = futures[filename].result()
+                success = report_test(description, result)
+            except Exception as e:
+                print(f"❌ {description} - BEKLENMEYEN HATA: {e}")
+                success, result = False, None
+            results.append((description, success, result, False))
+            
+            if success:
+                cache[filename] = hashes[filename]
+            else:
+                cache.pop(filename, None)
     
-    for filename, description in tests:
-        success = run_test(filename, description)
-        results.append((description, success))
+    save_cache(cache)
+    
+    # Performans ölçümleri yalnızca doğruluk testleri geçtiyse anlamlıdır
+    if bench and all(success for _, success, _, _ in results):
+        gates = [("Performans Kapısı (Benchmark Gate)", bench_threshold, False),
+                 ("Bellek Kapısı (Memory Gate)", None, True)]
+        for description, threshold, memory in gates:
+            try:
+                result = run_benchmark_gate(threshold, memory)
+                success = report_test(description, result)
+            except Exception as e:
+                print(f"❌ {description} - BEKLENMEYEN HATA: {e}")
+                success, result = False, None
+            results.append((description, success, result, False))
     
     # Özet
     print("\n" + "="*80)
@@ -70,18 +320,28 @@ def main():
     print("="*80)
     
     total = len(results)
-    passed = sum(1 for _, success in results if success)
+    passed = sum(1 for _, success, _, _ in results if success)
     failed = total - passed
+    skipped = sum(1 for _, _, _, cached in results if cached)
     
-    for description, success in results:
+    for description, success, result, cached in results:
         status = "✅ BAŞARILI" if success else "❌ BAŞARISIZ"
-        print(f"{status:15} - {description}")
+        if cached:
+            timing = "önbellekte"
+        elif result is None:
+            timing = "-"
+        else:
+            cpu = "-" if result["cpu"] is None else f"{result['cpu']:.2f}s"
+            timing = f"{result['wall']:.2f}s duvar, {cpu} CPU"
+        print(f"{status:15} - {description} ({timing})")
     
     print("-"*80)
     print(f"Toplam: {total} test")
     print(f"✅ Başarılı: {passed}")
     print(f"❌ Başarısız: {failed}")
+    print(f"⏭️ Atlanan (değişmedi): {skipped}")
     print(f"📈 Başarı Oranı: {(passed/total)*100:.1f}%")
+    print(f"⏲️ Toplam süre: {time.perf_counter() - start:.2f}s")
     print("="*80)
     
     if failed == 0:
@@ -92,6 +352,17 @@ def main():
     return failed == 0
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Tüm algoritma testlerini çalıştırır")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="aynı anda çalışan test dosyası sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="değişmemiş dosyaları da çalıştır")
+    parser.add_argument("--bench", action="store_true",
+                        help="testlerden sonra performans gerilemelerini de kontrol et")
+    parser.add_argument("--bench-threshold", type=float, default=None,
+                        help="izin verilen göreli yavaşlama (varsayılan 0.25)")
+    args = parser.parse_args()
+    
+    success = main(jobs=args.jobs, use_cache=not args.no_cache, bench=args.bench,
+                   bench_threshold=args.bench_threshold)
     sys.exit(0 if success else 1)
-
@@ -0,0 +1,468 @@
+"""
+SEYREK MATRİSLER (SPARSE MATRICES) - COO ve CSR
+
+Açıklama:
+Elemanlarının büyük çoğunluğu sıfır olan matrislerde yalnızca sıfır olmayan
+elemanlar (nnz) saklanır ve çarpımda yalnızca bu elemanlar işlenir.
+
+- COO (Coordinate): Her eleman için (satır, sütun, değer) üçlüsü tutulur.
+  Oluşturması ve eleman eklemesi kolaydır.
+- CSR (Compressed Sparse Row): Elemanlar satır sırasıyla tutulur;
+  i. satırın elemanları indices/data dizilerinde indptr[i]:indptr[i+1]
+  aralığındadır. Satır satır çarpım için uygundur.
+
+Zaman Karmaşıklığı:
+- Seyrek × yoğun (m×n, n×p): O(nnz(A) × p) - klasik algoritmada O(m × n × p)
+- Seyrek × seyrek (Gustavson): O(Σ nnz(B'nin kullanılan satırları)) - yalnızca
+  sıfır olmayan çarpımlar yapılır
+
+Alan Karmaşıklığı: O(nnz + m)
+"""
+
+from array import array
+from itertools import repeat
+from operator import add, mul
+
+
+class COOMatrix:
+    """
+    Koordinat (COO) formatında seyrek matris
+    """
+    
+    def __init__(self, rows, cols, row_indices=(), col_indices=(), values=()):
+        """
+        Args:
+            rows: Satır sayısı
+            cols: Sütun sayısı
+            row_indices: Sıfır olmayan elemanların satır index'leri
+            col_indices: Sıfır olmayan elemanların sütun index'leri
+            values: Sıfır olmayan elemanların değerleri
+        
+        Raises:
+            ValueError: Dizilerin uzunlukları farklıysa veya index matrisin dışındaysa
+        """
+        self.rows = rows
+        self.cols = cols
+        self.row_indices = array("q", row_indices)
+        self.col_indices = array("q", col_indices)
+        self.values = list(values)
+        
+        if not len(self.row_indices) == len(self.col_indices) == len(self.values):
+            raise ValueError("Satır, sütun ve değer dizileri aynı uzunlukta olmalıdır")
+        if any(not 0 <= i < rows for i in self.row_indices) or any(
+                not 0 <= j < cols for j in self.col_indices):
+            raise ValueError("Index matrisin dışında")
+    
+    @classmethod
+    def from_dense(cls, dense):
+        """
+        Yoğun matristen (liste listesi veya Matrix) COO matris oluşturur
+        
+        Args:
+            dense: Yoğun matris
+        
+        Returns:
+            COOMatrix: Sıfır olmayan elemanları içeren seyrek matris
+        """
+        rows, cols, values = [], [], []
+        for i, row in enumerate(dense):
+            for j, value in enumerate(row):
+                if value != 0:
+                    rows.append(i)
+                    cols.append(j)
+                    values.append(value)
+        return cls(len(dense), len(dense[0]) if len(dense) else 0, rows, cols, values)
+    
+    @property
+    def shape(self):
+        """(satır sayısı, sütun sayısı)"""
+        return (self.rows, self.cols)
+    
+    @property
+    def nnz(self):
+        """Saklanan (sıfır olmayan) eleman sayısı"""
+        return len(self.values)
+    
+    def to_dense(self):
+        """
+        Liste listesi formatına çevirir (aynı konumdaki tekrarlar toplanır)
+        
+        Returns:
+            list: Yoğun matris
+        """
+        dense = [[0] * self.cols for _ in range(self.rows)]
+        for i, j, value in zip(self.row_indices, self.col_indices, self.values):
+            dense[i][j] += value
+        return dense
+    
+    def tocsr(self):
+        """
+        CSR formatına çevirir (satır sayımına dayalı sıralama, O(nnz + m))
+        
+        Aynı konumdaki tekrar eden elemanlar toplanır.
+        
+        Returns:
+            CSRMatrix: Aynı matris, CSR formatında
+        """
+        # Her satırdaki eleman sayısı -> satır başlangıçları
+        counts = [0] * (self.rows + 1)
+        for i in self.row_indices:
+            counts[i + 1] += 1
+        for i in range(self.rows):
+            counts[i + 1] += counts[i]
+        
+        next_slot = counts[:-1]
+        indices = [0] * self.nnz
+        data = [0] * self.nnz
+        for i, j, value in zip(self.row_indices, self.col_indices, self.values):
+            slot = next_slot[i]
+            indices[slot] = j
+            data[slot] = value
+            next_slot[i] += 1
+        
+        # Satır içinde sütunları sırala ve tekrarları birleştir
+        indptr = [0]
+        merged_indices = []
+        merged_data = []
+        for i in range(self.rows):
+            row = {}
+            for slot in range(counts[i], counts[i + 1]):
+                row[indices[slot]] = row.get(indices[slot], 0) + data[slot]
+            for j in sorted(row):
+                merged_indices.append(j)
+                merged_data.append(row[j])
+            indptr.append(len(merged_indices))
+        return CSRMatrix(self.rows, self.cols, indptr, merged_indices, merged_data)
+
+
+class CSRMatrix:
+    """
+    Sıkıştırılmış satır (CSR) formatında seyrek matris
+    """
+    
+    def __init__(self, rows, cols, indptr, indices, data):
+        """
+        Args:
+            rows: Satır sayısı
+            cols: Sütun sayısı
+            indptr: Satır başlangıçları (uzunluk rows + 1)
+            indices: Sıfır olmayan elemanların sütun index'leri (satır sırasıyla)
+            data: Sıfır olmayan elemanların değerleri
+        
+        Raises:
+            ValueError: Diziler tutarsızsa, indptr azalıyorsa veya sütun
+                        index'i matrisin dışındaysa
+        """
+        self.rows = rows
+        self.cols = cols
+        self.indptr = array("q", indptr)
+        self.indices = array("q", indices)
+        self.data = list(data)
+        
+        if len(self.indptr) != rows + 1 or self.indptr[0] != 0 or self.indptr[-1] != len(self.data):
+            raise ValueError("indptr dizisi satır sayısı ve eleman sayısı ile uyumsuz")
+        if len(self.indices) != len(self.data):
+            raise ValueError("indices ve data dizileri aynı uzunlukta olmalıdır")
+        if any(start > end for start, end in zip(self.indptr, self.indptr[1:])):
+            raise ValueError("indptr dizisi azalmayan sırada olmalıdır")
+        if any(not 0 <= j < cols for j in self.indices):
+            raise ValueError("Index matrisin dışında")
+    
+    @classmethod
+    def from_dense(cls, dense):
+        """
+        Yoğun matristen (liste listesi veya Matrix) CSR matris oluşturur
+        
+        Args:
+            dense: Yoğun matris
+        
+        Returns:
+            CSRMatrix: Sıfır olmayan elemanları içeren seyrek matris
+        """
+        indptr = [0]
+        indices = []
+        data = []
+        for row in dense:
+            for j, value in enumerate(row):
+                if value != 0:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(data))
+        return cls(len(dense), len(dense[0]) if len(dense) else 0, indptr, indices, data)
+    
+    @classmethod
+    def identity(cls, n):
+        """
+        n×n birim matris (n eleman saklanır, n² değil)
+        
+        Args:
+            n: Matris boyutu
+        
+        Returns:
+            CSRMatrix: Birim matris
+        """
+        return cls(n, n, range(n + 1), range(n), [1] * n)
+    
+    @property
+    def shape(self):
+        """(satır sayısı, sütun sayısı)"""
+        return (self.rows, self.cols)
+    
+    @property
+    def nnz(self):
+        """Saklanan (sıfır olmayan) eleman sayısı"""
+        return len(self.data)
+    
+    def density(self):
+        """Sıfır olmayan elemanların oranı (0-1 arası)"""
+        size = self.rows * self.cols
+        return self.nnz / size if size else 0.0
+    
+    def row_items(self, i):
+        """
+        i. satırdaki (sütun, değer) çiftleri
+        
+        Args:
+            i: Satır index'i
+        
+        Returns:
+            zip: (sütun index'i, değer) çiftleri
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+    
+    def to_dense(self):
+        """
+        Liste listesi formatına çevirir
+        
+        Returns:
+            list: Yoğun matris
+        """
+        dense = []
+        for i in range(self.rows):
+            row = [0] * self.cols
+            for j, value in self.row_items(i):
+                row[j] = value
+            dense.append(row)
+        return dense
+    
+    def tocoo(self):
+        """
+        COO formatına çevirir
+        
+        Returns:
+            COOMatrix: Aynı matris, COO formatında
+        """
+        row_indices = [i for i in range(self.rows) for _ in range(self.indptr[i], self.indptr[i + 1])]
+        return COOMatrix(self.rows, self.cols, row_indices, self.indices, self.data)
+    
+    def multiply_dense(self, B):
+        """
+        Seyrek × yoğun çarpım: yalnızca sıfır olmayan A[i][k] değerleri için
+        B'nin k. satırı sonuç satırına eklenir
+        
+        Args:
+            B: Yoğun matris (n × p, liste listesi veya Matrix)
+        
+        Returns:
+            list: Sonuç matrisi (m × p, liste listesi)
+        
+        Raises:
+            ValueError: Matrisler çarpılamıyorsa
+        """
+        n2 = len(B)
+        p = len(B[0]) if n2 else 0
+        if self.cols != n2:
+            raise ValueError(f"Matrisler çarpılamaz: A({self.rows}×{self.cols}) × B({n2}×{p})")
+        
+        C = []
+        for i in range(self.rows):
+            C_row = [0] * p
+            for k, a in self.row_items(i):
+                # Satır toplama döngüsü C içinde çalışır
+                C_row = list(map(add, C_row, map(mul, repeat(a), B[k])))
+            C.append(C_row)
+        return C
+    
+    def multiply(self, other):
+        """
+        Seyrek × seyrek çarpım (Gustavson algoritması)
+        
+        Her sonuç satırı, A satırındaki sıfır olmayan elemanların karşılık
+        geldiği B satırlarının ağırlıklı toplamıdır; toplam bir sözlükte
+        biriktirilir. Toplamı sıfır olan elemanlar saklanmaz.
+        
+        Args:
+            other: CSRMatrix (n × p) veya yoğun matris
+        
+        Returns:
+            CSRMatrix: Sonuç matrisi (other yoğunsa liste listesi)
+        
+        Raises:
+            ValueError: Matrisler çarpılamıyorsa
+        """
+        if not isinstance(other, CSRMatrix):
+            return self.multiply_dense(other)
+        if self.cols != other.rows:
+            raise ValueError(f"Matrisler çarpılamaz: A({self.rows}×{self.cols}) × "
+                             f"B({other.rows}×{other.cols})")
+        
+        indptr = [0]
+        indices = []
+        data = []
+        B_indptr, B_indices, B_data = other.indptr, other.indices, other.data
+        for i in range(self.rows):
+            accumulator = {}
+            get = accumulator.get
+            for k, a in self.row_items(i):
+                for slot in range(B_indptr[k], B_indptr[k + 1]):
+                    j = B_indices[slot]
+                    accumulator[j] = get(j, 0) + a * B_data[slot]
+            for j in sorted(accumulator):
+                value = accumulator[j]
+                if value != 0:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(data))
+        return CSRMatrix(self.rows, other.cols, indptr, indices, data)
+    
+    def __matmul__(self, other):
+        return self.multiply(other)
+
+
+def benchmark_sparse_multiply(size=200, densities=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5), repeat=1):
+    """
+    Farklı yoğunluklarda yoğun ve seyrek çarpımın sürelerini karşılaştırır
+    
+    Args:
+        size: Kare matris boyutu
+        densities: Sıfır olmayan eleman oranları
+        repeat: Tekrar sayısı (en iyi süre alınır)
+    
+    Returns:
+        list: (yoğunluk, yoğun sn, seyrek×yoğun sn, seyrek×seyrek sn)
+    """
+    import random
+    import time
+    from matrix_multiplication import matrix_multiply_tiled
+    
+    def best_time(func):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    
+    rng = random.Random(42)
+    results = []
+    for density in densities:
+        A = [[rng.randrange(1, 10) if rng.random() < density else 0 for _ in range(size)]
+             for _ in range(size)]
+        B = [[rng.randrange(1, 10) if rng.random() < density else 0 for _ in range(size)]
+             for _ in range(size)]
+        A_csr = CSRMatrix.from_dense(A)
+        B_csr = CSRMatrix.from_dense(B)
+        results.append((
+            density,
+            best_time(lambda: matrix_multiply_tiled(A, B)),
+            best_time(lambda: A_csr.multiply_dense(B)),
+            best_time(lambda: A_csr.multiply(B_csr)),
+        ))
+    return results
+
+
+# Test Senaryoları
+if __name__ == "__main__":
+    import random
+    from matrix import Matrix
+    from matrix_multiplication import create_identity_matrix, matrix_multiply, print_matrix
+    
+    print("=" * 60)
+    print("SEYREK MATRİS TEST SENARYOLARI")
+    print("=" * 60)
+    
+    # Test 1: Yoğun matristen COO ve CSR oluşturma
+    A1 = [[0, 0, 3, 0],
+          [4, 0, 0, 0],
+          [0, 0, 0, 0],
+          [0, 5, 0, 6]]
+    coo_1 = COOMatrix.from_dense(A1)
+    csr_1 = CSRMatrix.from_dense(A1)
+    print("\nTest 1: Yoğun Matristen Oluşturma")
+    print_matrix(A1, "Matris A")
+    print(f"COO -> satırlar: {coo_1.row_indices.tolist()}, sütunlar: {coo_1.col_indices.tolist()}, "
+          f"değerler: {coo_1.values}")
+    print(f"CSR -> indptr: {csr_1.indptr.tolist()}, indices: {csr_1.indices.tolist()}, data: {csr_1.data}")
+    print(f"nnz: {csr_1.nnz}, yoğunluk: {csr_1.density():.2%}")
+    assert coo_1.to_dense() == A1 and csr_1.to_dense() == A1
+    assert coo_1.tocsr().to_dense() == A1 and csr_1.tocoo().to_dense() == A1
+    
+    # Test 2: Seyrek × yoğun çarpım
+    B2 = [[1, 2],
+          [3, 4],
+          [5, 6],
+          [7, 8]]
+    print("\nTest 2: Seyrek × Yoğun Çarpım")
+    C2 = csr_1.multiply_dense(B2)
+    print_matrix(C2, "Sonuç (A × B)")
+    assert C2 == matrix_multiply(A1, B2)
+    
+    # Test 3: Birim matris ile çarpım
+    print("\nTest 3: Birim Matris (n eleman saklanır)")
+    I3 = CSRMatrix.from_dense(create_identity_matrix(4))
+    print(f"4×4 birim matris nnz: {I3.nnz}")
+    assert I3.to_dense() == CSRMatrix.identity(4).to_dense()
+    assert I3.multiply_dense(B2) == B2
+    assert (csr_1 @ I3).to_dense() == A1
+    
+    # Test 4: Seyrek × seyrek çarpım ve rastgele matrislerle karşılaştırma
+    print("\nTest 4: Seyrek × Seyrek Çarpım")
+    C4 = csr_1 @ csr_1
+    print_matrix(C4.to_dense(), "Sonuç (A × A)")
+    rng = random.Random(42)
+    for m, n, p, density in [(1, 1, 1, 1.0), (5, 7, 3, 0.3), (20, 15, 25, 0.1), (30, 30, 30, 0.02)]:
+        A = [[rng.randrange(-9, 10) if rng.random() < density else 0 for _ in range(n)] for _ in range(m)]
+        B = [[rng.randrange(-9, 10) if rng.random() < density else 0 for _ in range(p)] for _ in range(n)]
+        expected = matrix_multiply(A, B)
+        A_csr = CSRMatrix.from_dense(A)
+        assert A_csr.multiply_dense(B) == expected
+        assert A_csr.multiply_dense(Matrix.from_rows(B)) == expected
+        assert (A_csr @ CSRMatrix.from_dense(B)).to_dense() == expected
+        assert (COOMatrix.from_dense(A).tocsr() @ COOMatrix.from_dense(B).tocsr()).to_dense() == expected
+    print("Klasik algoritma ile karşılaştırma: Tüm sonuçlar aynı")
+    
+    # Test 5: Hata durumu
+    print("\nTest 5: Hata Durumu - Çarpılamayan Matrisler ve Tutarsız CSR Dizileri")
+    try:
+        csr_1.multiply_dense([[1, 2], [3, 4]])
+    except ValueError as e:
+        print(f"Hata: {e}")
+    
+    # Tutarsız CSR dizileri (rows=2, cols=3)
+    invalid_csr = [
+        ([0, 1], [0], [5]),              # indptr uzunluğu rows + 1 değil
+        ([1, 1, 1], [0], [5]),           # indptr[0] != 0
+        ([0, 1, 1], [0, 2], [5, 6]),     # indptr[-1] != len(data)
+        ([0, 1, 1], [0, 1], [5]),        # indices ve data uzunlukları farklı
+        ([0, 2, 1], [0], [5]),           # indptr azalıyor
+        ([0, 3, 2], [0, 1], [5, 6]),     # indptr azalıyor (son eleman tutarlı)
+        ([0, 1, 2], [0, 3], [5, 6]),     # sütun index'i cols dışında
+        ([0, 1, 2], [-1, 0], [5, 6]),    # negatif sütun index'i
+    ]
+    for indptr, indices, data in invalid_csr:
+        try:
+            CSRMatrix(2, 3, indptr, indices, data)
+        except ValueError as e:
+            print(f"Hata: {e}")
+        else:
+            raise AssertionError(f"ValueError bekleniyordu: {indptr}, {indices}, {data}")
+    assert CSRMatrix(2, 3, [0, 0, 2], [0, 2], [5, 6]).to_dense() == [[0, 0, 0], [5, 0, 6]]
+    
+    # Test 6: Yoğunluk taraması
+    print("\nTest 6: Performans Testi (100×100, yoğunluk taraması)")
+    print(f"{'Yoğunluk':>9} {'Yoğun':>10} {'Seyrek×Yoğun':>13} {'Seyrek×Seyrek':>14}")
+    for density, dense, sparse_dense, sparse_sparse in benchmark_sparse_multiply(size=100):
+        print(f"{density:>9.1%} {dense:>9.4f}s {sparse_dense:>12.4f}s {sparse_sparse:>13.4f}s")
+    
+    print("\n" + "=" * 60)